@@ -5,7 +5,23 @@ This package provides tools for:
 - Line calculations (slope, equations)
 - Circle equations and visualizations
 - Parabola and ellipse geometry
+- Vectorized point, line, circle and triangle batches (PointArray, LineArray, CircleArray, TriangleArray)
+- Immutable, hashable value types (FrozenPoint, FrozenCircle, ...)
+- Nearest-neighbour and radius queries (KDTree)
+- Bulk point-in-triangle location (TriangleGrid)
+- Sweep-line segment intersection (segment_intersections)
+- Stable batched quadratic roots (solve_quadratics)
+- Convex hulls of large point sets (convex_hull)
+- Polygon area, centroid and bulk point-in-polygon (Polygon)
+- Delaunay triangulation of scattered points (Delaunay)
+- Chunked streaming of huge coordinate files through point operations (Pipeline)
+- Opt-in per-method call counts, timings and allocations (instrument)
+
+Only the pure-Python core classes are imported eagerly. Everything that needs
+numpy, scipy or matplotlib (the array types, spatial indexes and plotting
+helpers) is loaded on first access through the module-level __getattr__.
 """
+import importlib
 
 # Import core classes/functions from submodules
 from Coord_Geom.points import Point
@@ -15,8 +31,58 @@ from Coord_Geom.circles import Circle
 from Coord_Geom.parabolas import Parabola
 from Coord_Geom.ellipses import Ellipse
 from Coord_Geom.hyperbolas import Hyperbola
-from .plot_utils import *
+from Coord_Geom.frozen import (FrozenPoint, FrozenLine, FrozenCircle, FrozenParabola,
+                               FrozenEllipse, FrozenHyperbola, freeze)
+
+# Public names resolved lazily: name -> defining module
+_LAZY = {
+    'PointArray': 'Coord_Geom.point_arrays',
+    'LineArray': 'Coord_Geom.line_arrays',
+    'CircleArray': 'Coord_Geom.circle_arrays',
+    'TriangleArray': 'Coord_Geom.triangle_arrays',
+    'KDTree': 'Coord_Geom.spatial',
+    'TriangleGrid': 'Coord_Geom.point_location',
+    'segment_intersections': 'Coord_Geom.intersections',
+    'solve_quadratics': 'Coord_Geom.quadratics',
+    'convex_hull': 'Coord_Geom.hulls',
+    'Polygon': 'Coord_Geom.polygons',
+    'Delaunay': 'Coord_Geom.delaunay',
+    'Pipeline': 'Coord_Geom.streaming',
+    'read_csv': 'Coord_Geom.streaming',
+    'read_binary': 'Coord_Geom.streaming',
+    'read_array': 'Coord_Geom.streaming',
+    'CSVWriter': 'Coord_Geom.streaming',
+    'BinaryWriter': 'Coord_Geom.streaming',
+    'prepare_plot': 'Coord_Geom.plot_utils',
+    'finish_plot': 'Coord_Geom.plot_utils',
+    'plot_point': 'Coord_Geom.plot_utils',
+    'plot_line': 'Coord_Geom.plot_utils',
+    'plot_circle': 'Coord_Geom.plot_utils',
+    'plot_triangle': 'Coord_Geom.plot_utils',
+    'plot_parabola': 'Coord_Geom.plot_utils',
+    'plot_ellipse': 'Coord_Geom.plot_utils',
+    'plot_hyperbola': 'Coord_Geom.plot_utils',
+    'Scene': 'Coord_Geom.plot_utils',
+    'instrument': 'Coord_Geom.instrumentation',
+}
+
+__all__ = ['Point', 'Line', 'Triangle', 'Circle', 'Parabola', 'Ellipse', 'Hyperbola',
+           'FrozenPoint', 'FrozenLine', 'FrozenCircle', 'FrozenParabola',
+           'FrozenEllipse', 'FrozenHyperbola', 'freeze'] + list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 # (Optional) Set version
 __version__ = "0.1.0"
-
@@ -0,0 +1,41 @@
+import functools
+
+_KEY = '__key__'
+_MISSING = object()
+
+
+def cached_method(method):
+    """
+    Memoizes a zero-argument method on its instance.
+
+    The class provides ``_cache_key()``, a cheap tuple of the values that
+    define the shape (vertex coordinates, conic coefficients, ...). Results
+    are kept in a per-instance ``_cache`` dict, created on first use, and the
+    whole dict is dropped as soon as the key changes, so mutating a defining
+    parameter (even a vertex Point shared with other objects) can never
+    return a stale value.
+
+    Only use this on methods returning immutable values (numbers, tuples,
+    strings); methods returning Points should build them from cached parts.
+
+    Caching is not free: every call builds the key tuple, and the first one
+    on an instance also allocates the dict, so a cold call costs about a
+    microsecond more than the bare formula (benchmarks/bench_cached_properties
+    shows a fresh-instance report 1-2 us slower than uncached). Reserve it for
+    sub-results that other methods reuse or that are expensive to compute,
+    not one-line closed forms.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        key = self._cache_key()
+        cache = getattr(self, '_cache', None)
+        if cache is None or cache[_KEY] != key:
+            cache = self._cache = {_KEY: key}
+        value = cache.get(name, _MISSING)
+        if value is _MISSING:
+            value = cache[name] = method(self)
+        return value
+
+    return wrapper
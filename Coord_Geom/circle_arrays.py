@@ -0,0 +1,271 @@
+import numpy as np
+from Coord_Geom.points import Point
+from Coord_Geom.circles import Circle
+from Coord_Geom.point_arrays import as_xy
+
+# Codes returned by CircleArray.contains_points()
+INSIDE = -1
+ON = 0
+OUTSIDE = 1
+
+# Circles wider than this many grid cells skip the grid in overlapping_pairs
+_LARGE_CELLS = 8
+
+
+class CircleArray:
+    """
+    A column store of many circles: float64 ``cx``, ``cy`` and ``radius``
+    arrays. Point arguments broadcast against the circles, so N points can be
+    tested against one circle (a CircleArray of length 1) or against N
+    circles pairwise.
+    """
+
+    def __init__(self, cx, cy, radius):
+        self.cx = np.ascontiguousarray(cx, dtype=float).reshape(-1)
+        self.cy = np.ascontiguousarray(cy, dtype=float).reshape(-1)
+        self.radius = np.ascontiguousarray(radius, dtype=float).reshape(-1)
+        if not self.cx.shape == self.cy.shape == self.radius.shape:
+            raise ValueError("cx, cy and radius must have the same length.")
+
+    @classmethod
+    def from_circles(cls, circles):
+        circles = list(circles)
+        n = len(circles)
+        cx = np.fromiter((c.center.x for c in circles), dtype=float, count=n)
+        cy = np.fromiter((c.center.y for c in circles), dtype=float, count=n)
+        radius = np.fromiter((c.radius for c in circles), dtype=float, count=n)
+        return cls(cx, cy, radius)
+
+    def to_circles(self):
+        return [Circle(Point(x, y), r) for x, y, r in
+                zip(self.cx.tolist(), self.cy.tolist(), self.radius.tolist())]
+
+    def __len__(self):
+        return self.radius.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Circle(Point(float(self.cx[index]), float(self.cy[index])), float(self.radius[index]))
+        return CircleArray(self.cx[index], self.cy[index], self.radius[index])
+
+    def __repr__(self):
+        return "CircleArray(n={})".format(len(self))
+
+    def diameter(self):
+        return 2 * self.radius
+
+    def circumference(self):
+        return 2 * np.pi * self.radius
+
+    def area(self):
+        return np.pi * self.radius ** 2
+
+    def arc_length(self, angle_deg):
+        return (np.asarray(angle_deg, dtype=float) / 360) * self.circumference()
+
+    def sector_area(self, angle_deg):
+        return (np.asarray(angle_deg, dtype=float) / 360) * self.area()
+
+    def chord_length(self, angle_deg):
+        angle_rad = np.radians(angle_deg)
+        return 2 * self.radius * np.sin(angle_rad / 2)
+
+    def point_on_circumference(self, angle_deg):
+        angle_rad = np.radians(angle_deg)
+        return self.cx + self.radius * np.cos(angle_rad), self.cy + self.radius * np.sin(angle_rad)
+
+    def translate(self, dx, dy):
+        return CircleArray(self.cx + dx, self.cy + dy, self.radius)
+
+    def distance_from_points(self, points):
+        px, py = as_xy(points)
+        return np.hypot(self.cx - px, self.cy - py)
+
+    def contains_points(self, points, tol=0.0):
+        """
+        Classifies points against the circles as INSIDE (-1), ON (0) or
+        OUTSIDE (1). A point is ON when its distance from the center is
+        within ``tol`` of the radius; ``tol=0`` matches Circle.contains_point.
+        """
+        offset = self.distance_from_points(points) - self.radius
+        codes = np.where(offset < 0, INSIDE, OUTSIDE).astype(np.int8)
+        codes[np.abs(offset) <= tol] = ON
+        return codes
+
+    def tangents_from_points(self, points, tol=0.0):
+        """
+        Tangent lines from external points, as in Circle.tangent_from_point.
+
+        Returns ``(slopes, intercepts, counts)``. ``slopes`` and ``intercepts``
+        have shape (N, 2); ``counts`` is 0 for points inside the circle, 1 for
+        points on it (tolerance ``tol``) and 2 outside. Unused entries are NaN;
+        vertical tangents have slope ``inf`` and intercept NaN.
+        """
+        px, py = as_xy(points)
+        px, py, cx, cy, r = np.broadcast_arrays(px, py, self.cx, self.cy, self.radius)
+        dx = px - cx
+        dy = py - cy
+        d = np.hypot(dx, dy)
+        offset = d - r
+
+        on = np.abs(offset) <= tol
+        outside = (offset > 0) & ~on
+        counts = np.where(outside, 2, np.where(on, 1, 0)).astype(np.int8)
+
+        tx = np.full(d.shape + (2,), np.nan)
+        ty = np.full(d.shape + (2,), np.nan)
+
+        # On the circle: the tangent is perpendicular to the radius
+        tx[on, 0] = -dy[on]
+        ty[on, 0] = dx[on]
+
+        # Outside: rotate the center-to-point direction by +/- asin(r / d)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ux = dx / d
+            uy = dy / d
+            theta = np.arcsin(np.clip(r / d, -1.0, 1.0))
+        for column, angle in enumerate((theta, -theta)):
+            cos_a = np.cos(angle[outside])
+            sin_a = np.sin(angle[outside])
+            tx[outside, column] = ux[outside] * cos_a - uy[outside] * sin_a
+            ty[outside, column] = ux[outside] * sin_a + uy[outside] * cos_a
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            slopes = np.where(tx == 0, np.inf, ty / tx)
+            intercepts = py[..., None] - slopes * px[..., None]
+        slopes[np.isnan(tx)] = np.nan
+        intercepts[~np.isfinite(slopes)] = np.nan
+        return slopes, intercepts, counts
+
+    def overlapping_pairs(self, tol=0.0, cell_size=None, chunk_size=1 << 22):
+        """
+        All pairs of circles whose discs overlap or touch, with the points
+        where their boundaries meet.
+
+        Returns ``(pairs, xs, ys, counts)``: a (K, 2) int array of ``(i, j)``
+        rows with ``i < j`` sorted lexicographically, (K, 2) arrays of
+        intersection coordinates (NaN where unused) and the number of
+        intersection points: 2 where the boundaries cross, 1 where they are
+        tangent (internally or externally, within ``tol``) and 0 where one
+        circle lies inside the other or they coincide.
+
+        Candidates come from a uniform grid over the bounding boxes (cell
+        ``cell_size``, by default twice the median radius), each pair being
+        considered in a single cell only; circles much larger than a cell are
+        checked against everything directly. Candidate pairs are generated
+        and tested ``chunk_size`` at a time.
+        """
+        n = len(self)
+        cx, cy, r = self.cx, self.cy, self.radius
+        xmin, xmax, ymin, ymax = cx - r, cx + r, cy - r, cy + r
+        origin = np.array([xmin.min(), ymin.min()]) if n else np.zeros(2)
+        extent = np.array([xmax.max(), ymax.max()]) - origin if n else np.ones(2)
+        if cell_size is None:
+            cell_size = 2 * np.median(r) if n else 1.0
+        cell_size = float(max(cell_size, extent.max() / 65536, np.finfo(float).tiny))
+
+        large = 2 * r > _LARGE_CELLS * cell_size
+        found = [self._pairs_with_large(np.flatnonzero(large), tol, chunk_size)]
+
+        # Grid cells covered by the bounding box of every remaining circle
+        small = np.flatnonzero(~large)
+        first = np.floor((np.column_stack((xmin[small], ymin[small])) - origin) / cell_size).astype(np.int64)
+        last = np.floor((np.column_stack((xmax[small], ymax[small])) - origin) / cell_size).astype(np.int64)
+        spans = last - first + 1
+        covered = spans[:, 0] * spans[:, 1]
+        entry = np.repeat(np.arange(small.shape[0], dtype=np.intp), covered)
+        local = np.arange(entry.shape[0], dtype=np.intp) - np.repeat(np.cumsum(covered) - covered, covered)
+        cell_x = first[entry, 0] + local % spans[entry, 0]
+        cell_y = first[entry, 1] + local // spans[entry, 0]
+        width = int(np.floor(extent[0] / cell_size)) + 1
+        cells = cell_y * width + cell_x
+
+        # Stable sort keeps circle indices ascending within every cell
+        order = np.argsort(cells, kind='stable')
+        cells = cells[order]
+        members = small[entry[order]]
+        total = cells.shape[0]
+        edges = np.concatenate(([0], np.flatnonzero(np.diff(cells)) + 1, [total]))
+        group_end = np.repeat(edges[1:], np.diff(edges))
+        partners = group_end - np.arange(total) - 1
+
+        # Walk positions in blocks of about chunk_size candidate pairs
+        cumulative = np.cumsum(partners)
+        limit = cumulative[-1] if total else 0
+        block_ends = np.searchsorted(cumulative, np.arange(0, limit, chunk_size), side='right')
+        start = 0
+        for stop in np.unique(np.append(block_ends, total)).tolist():
+            if stop == start:
+                continue
+            position = np.arange(start, stop, dtype=np.intp)
+            counts = partners[start:stop]
+            base = np.repeat(position, counts)
+            offset = np.arange(base.shape[0], dtype=np.intp) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+            i, j = members[base], members[base + offset]
+
+            # Keep each pair only in the cell holding the lower-left corner
+            # of the intersection of the two bounding boxes
+            corner_x = np.floor((np.maximum(xmin[i], xmin[j]) - origin[0]) / cell_size).astype(np.int64)
+            corner_y = np.floor((np.maximum(ymin[i], ymin[j]) - origin[1]) / cell_size).astype(np.int64)
+            keep = (corner_y * width + corner_x == cells[base])
+            keep &= (xmin[i] <= xmax[j]) & (xmin[j] <= xmax[i]) & (ymin[i] <= ymax[j]) & (ymin[j] <= ymax[i])
+            found.append(self._narrow_phase(i[keep], j[keep], tol))
+            start = stop
+
+        pairs = np.concatenate([f[0] for f in found])
+        xs = np.concatenate([f[1] for f in found])
+        ys = np.concatenate([f[2] for f in found])
+        counts = np.concatenate([f[3] for f in found])
+        order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+        return pairs[order], xs[order], ys[order], counts[order]
+
+    def _pairs_with_large(self, large, tol, chunk_size):
+        """Candidate pairs of every large circle with every other circle, tested directly."""
+        n = len(self)
+        is_large = np.zeros(n, dtype=bool)
+        is_large[large] = True
+        found = [self._narrow_phase(np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), tol)]
+        rows = max(1, chunk_size // max(n, 1))
+        others = np.arange(n, dtype=np.intp)
+        for start in range(0, large.shape[0], rows):
+            block = large[start:start + rows]
+            i = np.repeat(block, n)
+            j = np.tile(others, block.shape[0])
+            # Large-large pairs once, from the lower index
+            keep = (i != j) & (~is_large[j] | (i < j))
+            i, j = np.minimum(i[keep], j[keep]), np.maximum(i[keep], j[keep])
+            found.append(self._narrow_phase(i, j, tol))
+        return tuple(np.concatenate([f[k] for f in found]) for k in range(4))
+
+    def _narrow_phase(self, i, j, tol):
+        """Overlap test and boundary intersection points for candidate pairs i < j."""
+        cx, cy, r = self.cx, self.cy, self.radius
+        dx = cx[j] - cx[i]
+        dy = cy[j] - cy[i]
+        d = np.hypot(dx, dy)
+        r1, r2 = r[i], r[j]
+        outer = r1 + r2
+        inner = np.abs(r1 - r2)
+
+        overlap = d <= outer + tol
+        i, j, dx, dy, d, r1, r2, outer, inner = (v[overlap] for v in (i, j, dx, dy, d, r1, r2, outer, inner))
+
+        tangent = (d > 0) & ((np.abs(d - outer) <= tol) | (np.abs(d - inner) <= tol))
+        crossing = (inner < d) & (d < outer) & ~tangent
+        counts = (2 * crossing + tangent).astype(np.int8)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Distance from circle i's center to the chord, and half the chord
+            a = (d ** 2 + r1 ** 2 - r2 ** 2) / (2 * d)
+            h = np.sqrt(np.maximum(r1 ** 2 - a ** 2, 0.0))
+            ux, uy = dx / d, dy / d
+        h[tangent] = 0.0
+        mx = cx[i] + a * ux
+        my = cy[i] + a * uy
+        xs = np.column_stack((mx - h * uy, mx + h * uy))
+        ys = np.column_stack((my + h * ux, my - h * ux))
+        xs[counts == 0] = np.nan
+        ys[counts == 0] = np.nan
+        xs[counts == 1, 1] = np.nan
+        ys[counts == 1, 1] = np.nan
+        return np.column_stack((i, j)), xs, ys, counts
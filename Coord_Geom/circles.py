@@ -3,6 +3,8 @@ from Coord_Geom.points import Point
 from Coord_Geom.lines import Line
 
 class Circle:
+    __slots__ = ('center', 'radius')
+
     def __init__(self, center: Point, radius: float):
         self.center = center
         self.radius = radius
@@ -0,0 +1,235 @@
+import numpy as np
+from Coord_Geom.points import Point
+from Coord_Geom.triangles import Triangle
+from Coord_Geom.point_arrays import as_coords
+from Coord_Geom.predicates import incircle, orient
+
+# Vertex index of the point at infinity shared by all ghost triangles
+_GHOST = -1
+
+_NEXT = (1, 2, 0)
+_PREV = (2, 0, 1)
+
+
+class Delaunay:
+    """
+    Delaunay triangulation of a point set, built without scipy.
+
+    Points are inserted one at a time (Bowyer-Watson) in Morton order: each
+    new point is located by walking from the previously created triangle,
+    which the ordering keeps close by, and the triangles whose circumcircle
+    contains it are replaced by a fan around it. Outside edges of the convex
+    hull are closed with ghost triangles sharing a vertex at infinity, so no
+    bounding super-triangle is needed. Orientation and incircle tests are
+    exact (floating point filtered, with a rational fallback).
+
+    ``faces`` is an (M, 3) int array of point indices, each row
+    counter-clockwise; ``neighbors[f, i]`` is the face across the edge
+    opposite ``faces[f, i]``, or -1 on the convex hull. Duplicated points are
+    triangulated once, under their lowest index; with fewer than three
+    non-collinear points there are no faces. For cocircular points any of
+    the valid triangulations may be returned.
+
+    Faces convert to Triangle objects on demand (indexing, ``to_triangles``)
+    or all at once to a TriangleArray.
+    """
+
+    def __init__(self, points):
+        xy = np.array(as_coords(points), dtype=float)
+        if not np.isfinite(xy).all():
+            raise ValueError("Point coordinates must be finite")
+        xy.flags.writeable = False
+        self.points = xy
+        faces, neighbors = _Triangulation(xy).run()
+        faces.flags.writeable = False
+        neighbors.flags.writeable = False
+        self.faces = faces
+        self.neighbors = neighbors
+        self._triangles = None
+
+    def __len__(self):
+        return self.faces.shape[0]
+
+    def __repr__(self):
+        return "Delaunay(points={}, faces={})".format(self.points.shape[0], len(self))
+
+    def __getitem__(self, index):
+        """The face ``index`` as a Triangle."""
+        (ax, ay), (bx, by), (cx, cy) = self.points[self.faces[index]].tolist()
+        return Triangle(Point(ax, ay), Point(bx, by), Point(cx, cy))
+
+    def to_triangles(self):
+        """List of Triangle objects, one per face; built on first call."""
+        if self._triangles is None:
+            self._triangles = [Triangle(Point(ax, ay), Point(bx, by), Point(cx, cy))
+                               for (ax, ay), (bx, by), (cx, cy) in self.points[self.faces].tolist()]
+        return self._triangles
+
+    def to_triangle_array(self):
+        from Coord_Geom.triangle_arrays import TriangleArray
+        return TriangleArray(self.points[self.faces])
+
+
+def _insertion_order(xy):
+    """Indices of the distinct points (lowest index of each), sorted along a Morton curve."""
+    order = np.lexsort((np.arange(xy.shape[0]), xy[:, 1], xy[:, 0]))
+    distinct = np.ones(order.shape[0], dtype=bool)
+    distinct[1:] = (np.diff(xy[order], axis=0) != 0).any(axis=1)
+    unique = np.sort(order[distinct])
+    if unique.shape[0] < 3:
+        return unique
+
+    coords = xy[unique]
+    low = coords.min(axis=0)
+    span = (coords.max(axis=0) - low).max() or 1.0
+    cells = np.minimum((coords - low) / span * 65536, 65535).astype(np.uint64)
+
+    def spread(v):
+        v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+        v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+        v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+        return (v | (v << np.uint64(1))) & np.uint64(0x55555555)
+
+    code = spread(cells[:, 0]) | (spread(cells[:, 1]) << np.uint64(1))
+    return unique[np.argsort(code, kind='stable')]
+
+
+class _Triangulation:
+    """
+    Incremental Bowyer-Watson state. Triangle ``t`` is ``V[t]``, three
+    vertex indices in counter-clockwise order (a ghost triangle has
+    _GHOST as one of them), and ``N[t][i]`` is the triangle across the edge
+    opposite ``V[t][i]``.
+    """
+
+    def __init__(self, xy):
+        self.xy = xy
+        self.xs = xy[:, 0].tolist()
+        self.ys = xy[:, 1].tolist()
+        self.V = []
+        self.N = []
+
+    def run(self):
+        order = _insertion_order(self.xy).tolist()
+        if not self._start(order):
+            return np.empty((0, 3), dtype=np.intp), np.empty((0, 3), dtype=np.intp)
+        last = 0
+        for p in order[3:]:
+            last = self._insert(p, self._locate(p, last))
+
+        real = [t for t, v in enumerate(self.V) if _GHOST not in v]
+        ids = np.full(len(self.V), -1, dtype=np.intp)
+        ids[real] = np.arange(len(real), dtype=np.intp)
+        faces = np.array([self.V[t] for t in real], dtype=np.intp).reshape(-1, 3)
+        neighbors = ids[np.array([self.N[t] for t in real], dtype=np.intp).reshape(-1, 3)]
+        return faces, neighbors
+
+    def _start(self, order):
+        """First triangle and its three ghosts; moves its vertices to the front of ``order``."""
+        if len(order) < 3:
+            return False
+        xs, ys = self.xs, self.ys
+        a, b = order[0], order[1]
+        for k in range(2, len(order)):
+            turn = orient(xs[a], ys[a], xs[b], ys[b], xs[order[k]], ys[order[k]])
+            if turn != 0:
+                break
+        else:
+            return False
+        c = order.pop(k)
+        order[2:2] = [c]
+        if turn < 0:
+            b, c = c, b
+
+        self.V = [[a, b, c], [b, a, _GHOST], [c, b, _GHOST], [a, c, _GHOST]]
+        # Link every directed edge u -> v to the triangle holding v -> u
+        opposite = {}
+        for t, v in enumerate(self.V):
+            for i in range(3):
+                opposite[v[_NEXT[i]], v[_PREV[i]]] = t
+        self.N = [[opposite[v[_PREV[i]], v[_NEXT[i]]] for i in range(3)] for v in self.V]
+        return True
+
+    def _locate(self, p, t):
+        """A triangle in conflict with ``p``, found by a visibility walk from ``t``."""
+        V, N, xs, ys = self.V, self.N, self.xs, self.ys
+        if _GHOST in V[t]:
+            t = N[t][V[t].index(_GHOST)]
+        px, py = xs[p], ys[p]
+        while True:
+            v = V[t]
+            for i in range(3):
+                u, w = v[_NEXT[i]], v[_PREV[i]]
+                if orient(xs[u], ys[u], xs[w], ys[w], px, py) < 0:
+                    t = N[t][i]
+                    break
+            else:
+                return t
+            # Stepping out of the hull lands on a ghost that sees p
+            if _GHOST in V[t]:
+                return t
+
+    def _in_conflict(self, t, p):
+        a, b, c = self.V[t]
+        if c == _GHOST:
+            return self._sees(a, b, p)
+        if a == _GHOST:
+            return self._sees(b, c, p)
+        if b == _GHOST:
+            return self._sees(c, a, p)
+        xs, ys = self.xs, self.ys
+        return incircle(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], xs[p], ys[p]) > 0
+
+    def _sees(self, u, v, p):
+        """Ghost conflict: p beyond hull edge u -> v, or strictly inside the edge."""
+        xs, ys = self.xs, self.ys
+        turn = orient(xs[u], ys[u], xs[v], ys[v], xs[p], ys[p])
+        if turn != 0:
+            return turn > 0
+        if xs[u] != xs[v]:
+            return min(xs[u], xs[v]) < xs[p] < max(xs[u], xs[v])
+        return min(ys[u], ys[v]) < ys[p] < max(ys[u], ys[v])
+
+    def _insert(self, p, t):
+        """Replace the conflict region around triangle ``t`` by a fan of triangles on ``p``."""
+        V, N = self.V, self.N
+        conflict = {t}
+        clear = set()
+        stack = [t]
+        # Cavity edges u -> v with the triangle outside and its slot facing in
+        boundary = []
+        while stack:
+            s = stack.pop()
+            vs, ns = V[s], N[s]
+            for i in range(3):
+                out = ns[i]
+                if out in conflict:
+                    continue
+                if out not in clear:
+                    if self._in_conflict(out, p):
+                        conflict.add(out)
+                        stack.append(out)
+                        continue
+                    clear.add(out)
+                boundary.append((vs[_NEXT[i]], vs[_PREV[i]], out, N[out].index(s)))
+
+        # The cavity boundary has two more edges than the cavity has triangles
+        free = list(conflict)
+        fan = {}
+        for u, v, out, slot in boundary:
+            if free:
+                t = free.pop()
+                V[t] = [u, v, p]
+                N[t] = [-1, -1, out]
+            else:
+                t = len(V)
+                V.append([u, v, p])
+                N.append([-1, -1, out])
+            N[out][slot] = t
+            fan[u] = t
+        for u, t in fan.items():
+            # (u, v, p) meets (v, w, p) across the edge v - p
+            following = fan[V[t][1]]
+            N[t][0] = following
+            N[following][1] = t
+        return t
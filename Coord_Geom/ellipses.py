@@ -1,13 +1,21 @@
 import math
+import numbers
+import sys
 from Coord_Geom.points import Point
+from Coord_Geom.caching import cached_method
 
 class Ellipse:
+    __slots__ = ('a', 'b', 'h', 'k', 'orientation', '_cache')
+
     def __init__(self, a, b, h=0, k=0, orientation='h'):
         self.a = a  # semi-major axis
         self.b = b  # semi-minor axis
         self.h = h  # center x
         self.k = k  # center y
-        self.orientation = orientation.lower()
+        self.orientation = sys.intern(orientation.lower())
+
+    def _cache_key(self):
+        return self.a, self.b
 
     def equation(self):
         h, k = self.h, self.k
@@ -19,8 +27,12 @@ class Ellipse:
     def eccentricity(self):
         return math.sqrt(1 - (self.b ** 2) / (self.a ** 2))
 
+    @cached_method
+    def focal_distance(self):
+        return math.sqrt(abs(self.a ** 2 - self.b ** 2))
+
     def foci(self):
-        c = math.sqrt(abs(self.a ** 2 - self.b ** 2))
+        c = self.focal_distance()
         if self.orientation == 'h':
             return (self.h - c, self.k), Point(self.h + c, self.k)
         else:
@@ -54,6 +66,13 @@ class Ellipse:
             return math.isclose((x ** 2 / self.b ** 2) + (y ** 2 / self.a ** 2), 1, abs_tol=1e-9)
 
     def get_y_given_x(self, x):
+        """
+        The two y values ``(upper, lower)`` on the ellipse at ``x``, or None
+        when x is outside it. Given an array of x values, returns two arrays
+        with NaN where x is outside the ellipse.
+        """
+        if not isinstance(x, numbers.Real):
+            return self._solve_array(x, self.h, self.k, 'h')
         x_shifted = x - self.h
         if self.orientation == 'h':
             inside = 1 - (x_shifted ** 2) / (self.a ** 2)
@@ -69,6 +88,13 @@ class Ellipse:
             return self.k + y_val, self.k - y_val
 
     def get_x_given_y(self, y):
+        """
+        The two x values ``(right, left)`` on the ellipse at ``y``, or None
+        when y is outside it. Given an array of y values, returns two arrays
+        with NaN where y is outside the ellipse.
+        """
+        if not isinstance(y, numbers.Real):
+            return self._solve_array(y, self.k, self.h, 'v')
         y_shifted = y - self.k
         if self.orientation == 'v':
             inside = 1 - (y_shifted ** 2) / (self.a ** 2)
@@ -83,6 +109,24 @@ class Ellipse:
             x_val = math.sqrt(inside)
             return self.h + x_val, self.h - x_val
 
+    def _solve_array(self, values, center, other_center, along):
+        """
+        Array form of get_y_given_x / get_x_given_y. ``along`` is the
+        orientation whose major axis lies along the input coordinate.
+        """
+        import numpy as np
+
+        shifted = np.asarray(values, dtype=float) - center
+        if self.orientation == along:
+            inside = 1 - shifted ** 2 / self.a ** 2
+            scale = self.b
+        else:
+            inside = 1 - shifted ** 2 / self.b ** 2
+            scale = self.a
+        with np.errstate(invalid='ignore'):
+            offset = scale * np.sqrt(inside)
+        return other_center + offset, other_center - offset
+
     def tangent_slope_at_point(self, p: Point):
         x = p.x - self.h
         y = p.y - self.k
@@ -138,6 +182,87 @@ class Ellipse:
             c = p.y - m * p.x
             return f"y = {m}x + {c}"
 
+    def distance_to_ellipse(self, p):
+        distances, xs, ys, _ = self.nearest_points([[p.x, p.y]])
+        return float(distances[0]), Point(float(xs[0]), float(ys[0]))
+
+    def nearest_points(self, points, max_iter=200):
+        """
+        Nearest point on the ellipse to every query point.
+
+        ``points`` is a Point, a sequence of Points, a PointArray or an (N, 2)
+        array. Returns ``(distances, xs, ys, angles)``: the distance to the
+        curve, the nearest point, and its parameter angle in degrees, with the
+        curve written as (h + a cos t, k + b sin t) for 'h' orientation and
+        (h + b cos t, k + a sin t) for 'v'.
+
+        Uses Eberly's robust method: queries are folded into the first
+        quadrant and the root of the one-dimensional optimality equation is
+        bracketed and bisected, stopping once every bracket has collapsed or
+        after ``max_iter`` halvings.
+        """
+        import numpy as np
+        from Coord_Geom.point_arrays import as_coords
+
+        xy = as_coords(points)
+        x = xy[:, 0] - self.h
+        y = xy[:, 1] - self.k
+        ex, ey = (self.a, self.b) if self.orientation == 'h' else (self.b, self.a)
+
+        # Fold into the first quadrant, with the longer semi-axis first
+        swap = ey > ex
+        e0, e1 = (ey, ex) if swap else (ex, ey)
+        p0, p1 = (np.abs(y), np.abs(x)) if swap else (np.abs(x), np.abs(y))
+        q0 = np.empty_like(p0)
+        q1 = np.empty_like(p1)
+
+        # On the major axis (p1 == 0): closed form
+        axis = p1 == 0
+        numer0 = e0 * p0[axis]
+        denom0 = e0 ** 2 - e1 ** 2
+        with np.errstate(invalid='ignore', divide='ignore'):
+            xde0 = np.where(numer0 < denom0, numer0 / denom0, 1.0)
+        q0[axis] = e0 * xde0
+        q1[axis] = e1 * np.sqrt(np.maximum(1 - xde0 ** 2, 0.0))
+
+        # On the minor axis (p0 == 0): the co-vertex
+        covertex = ~axis & (p0 == 0)
+        q0[covertex] = 0.0
+        q1[covertex] = e1
+
+        # General position: bisect G(s) = (r0 z0 / (s + r0))^2 + (z1 / (s + 1))^2 - 1
+        general = ~axis & ~covertex
+        z0 = p0[general] / e0
+        z1 = p1[general] / e1
+        g = z0 ** 2 + z1 ** 2 - 1
+        r0 = (e0 / e1) ** 2
+        n0 = r0 * z0
+        lo = z1 - 1
+        hi = np.where(g < 0, 0.0, np.hypot(n0, z1) - 1)
+        root = np.zeros_like(z0)
+        active = g != 0
+        for _ in range(max_iter):
+            if not active.any():
+                break
+            mid = 0.5 * (lo + hi)
+            active &= (mid != lo) & (mid != hi)
+            value = (n0 / (mid + r0)) ** 2 + (z1 / (mid + 1)) ** 2 - 1
+            lo = np.where(active & (value > 0), mid, lo)
+            hi = np.where(active & (value < 0), mid, hi)
+            root = np.where(active, mid, root)
+            active &= value != 0
+        on_curve = g == 0
+        q0[general] = np.where(on_curve, p0[general], r0 * p0[general] / (root + r0))
+        q1[general] = np.where(on_curve, p1[general], p1[general] / (root + 1))
+
+        distances = np.hypot(q0 - p0, q1 - p1)
+        if swap:
+            q0, q1 = q1, q0
+        fx = np.copysign(q0, x)
+        fy = np.copysign(q1, y)
+        angles = np.degrees(np.arctan2(fy / ey, fx / ex))
+        return distances, self.h + fx, self.k + fy, angles
+
     def is_inside(self, p):
         x = p.x - self.h
         y = p.y - self.k
@@ -0,0 +1,127 @@
+from Coord_Geom.points import Point
+from Coord_Geom.lines import Line
+from Coord_Geom.circles import Circle
+from Coord_Geom.parabolas import Parabola
+from Coord_Geom.ellipses import Ellipse
+from Coord_Geom.hyperbolas import Hyperbola
+
+
+class _Frozen:
+    """
+    Mixin that turns a slotted geometry class into an immutable value type.
+
+    Each slot may be assigned exactly once (by the regular ``__init__``);
+    rebinding or deleting it afterwards raises AttributeError. Equality and
+    hashing are based on the values listed in ``_fields``.
+    """
+    __slots__ = ()
+    _fields = ()
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError("{} is immutable".format(type(self).__name__))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def _key(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash((type(self).__name__,) + self._key())
+
+    def __repr__(self):
+        args = ", ".join(repr(value) for value in self._key())
+        return "{}({})".format(type(self).__name__, args)
+
+    def __reduce__(self):
+        return type(self), self._key()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class FrozenPoint(_Frozen, Point):
+    __slots__ = ()
+    _fields = ('x', 'y')
+
+    @classmethod
+    def of(cls, p):
+        return p if type(p) is cls else cls(p.x, p.y)
+
+
+class FrozenLine(_Frozen, Line):
+    __slots__ = ()
+    _fields = ('p1', 'p2')
+
+    def __init__(self, p1, p2):
+        super().__init__(FrozenPoint.of(p1), FrozenPoint.of(p2))
+
+    def translate(self, dx, dy):
+        return FrozenLine(FrozenPoint(self.p1.x + dx, self.p1.y + dy),
+                          FrozenPoint(self.p2.x + dx, self.p2.y + dy))
+
+
+class FrozenCircle(_Frozen, Circle):
+    __slots__ = ()
+    _fields = ('center', 'radius')
+
+    def __init__(self, center, radius):
+        super().__init__(FrozenPoint.of(center), radius)
+
+    def translate(self, dx, dy):
+        # Unlike Circle.translate, never touches the (shared) center point
+        return FrozenCircle(FrozenPoint(self.center.x + dx, self.center.y + dy), self.radius)
+
+
+class FrozenParabola(_Frozen, Parabola):
+    __slots__ = ()
+    _fields = ('a', 'b', 'c', 'orientation')
+
+
+class FrozenEllipse(_Frozen, Ellipse):
+    __slots__ = ()
+    _fields = ('a', 'b', 'h', 'k', 'orientation')
+
+    def translate(self, dx, dy):
+        return FrozenEllipse(self.a, self.b, self.h + dx, self.k + dy, self.orientation)
+
+
+class FrozenHyperbola(_Frozen, Hyperbola):
+    __slots__ = ()
+    _fields = ('a', 'b', 'h', 'k', 'orientation')
+
+    def translate(self, dx, dy):
+        return FrozenHyperbola(self.a, self.b, self.h + dx, self.k + dy, self.orientation)
+
+
+def freeze(shape):
+    """Returns the immutable counterpart of a Point, Line, Circle or conic."""
+    if isinstance(shape, _Frozen):
+        return shape
+    if isinstance(shape, Point):
+        return FrozenPoint(shape.x, shape.y)
+    if isinstance(shape, Line):
+        return FrozenLine(shape.p1, shape.p2)
+    if isinstance(shape, Circle):
+        return FrozenCircle(shape.center, shape.radius)
+    if isinstance(shape, Parabola):
+        return FrozenParabola(shape.a, shape.b, shape.c, shape.orientation)
+    if isinstance(shape, Ellipse):
+        return FrozenEllipse(shape.a, shape.b, shape.h, shape.k, shape.orientation)
+    if isinstance(shape, Hyperbola):
+        return FrozenHyperbola(shape.a, shape.b, shape.h, shape.k, shape.orientation)
+    raise TypeError("Cannot freeze object of type {}".format(type(shape).__name__))
@@ -0,0 +1,86 @@
+import numpy as np
+from Coord_Geom.point_arrays import as_coords
+
+
+def convex_hull(points, chunk_size=1 << 20):
+    """
+    Indices of the convex hull vertices of ``points`` (a list of Points, a
+    PointArray or an (N, 2) array), in counter-clockwise order starting from
+    the lowest point of the leftmost ones.
+
+    Points lying on a hull edge are not vertices and are left out. Among
+    duplicated points the lowest index is reported. Fewer than three distinct
+    points give the distinct points themselves (one, or the two ends of a
+    segment); so does an input where every point is collinear.
+
+    Points strictly inside the octagon spanned by the extremes in x, y, x + y
+    and x - y are discarded first (Akl-Toussaint), ``chunk_size`` points at a
+    time; Andrew's monotone chain then runs on the survivors, using the
+    Point.determinant orientation test.
+    """
+    xy = as_coords(points)
+    n = xy.shape[0]
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+
+    candidates = _outside_octagon(xy, chunk_size)
+    x, y = xy[candidates, 0], xy[candidates, 1]
+    # Sort by x, then y, then index, and keep the first of every duplicate
+    order = np.lexsort((candidates, y, x))
+    candidates, x, y = candidates[order], x[order], y[order]
+    distinct = np.ones(candidates.shape[0], dtype=bool)
+    distinct[1:] = (x[1:] != x[:-1]) | (y[1:] != y[:-1])
+    candidates, x, y = candidates[distinct], x[distinct], y[distinct]
+    if candidates.shape[0] < 3:
+        return candidates
+
+    hull = _monotone_chain(x.tolist(), y.tolist())
+    return candidates[hull]
+
+
+def _outside_octagon(xy, chunk_size):
+    """Indices of the points not strictly inside the Akl-Toussaint octagon."""
+    x, y = xy[:, 0], xy[:, 1]
+    extremes = [np.argmin(x), np.argmin(x - y), np.argmax(y), np.argmax(x + y),
+                np.argmax(x), np.argmax(x - y), np.argmin(y), np.argmin(x + y)]
+    # Counter-clockwise order from the left; drop repeated vertices
+    corners = []
+    for i in extremes:
+        corner = (xy[i, 0], xy[i, 1])
+        if not corners or corner != corners[-1]:
+            corners.append(corner)
+    while len(corners) > 1 and corners[-1] == corners[0]:
+        corners.pop()
+    corners.reverse()
+    if len(corners) < 3:
+        return np.arange(xy.shape[0], dtype=np.intp)
+
+    keep = []
+    for start in range(0, xy.shape[0], chunk_size):
+        block = xy[start:start + chunk_size]
+        inside = np.ones(block.shape[0], dtype=bool)
+        for k in range(len(corners)):
+            (ax, ay), (bx, by) = corners[k], corners[(k + 1) % len(corners)]
+            # Point.determinant(a, b, p) > 0: p strictly left of a -> b
+            inside &= (bx - ax) * (block[:, 1] - ay) - (block[:, 0] - ax) * (by - ay) > 0
+        keep.append(np.flatnonzero(~inside) + start)
+    return np.concatenate(keep)
+
+
+def _monotone_chain(x, y):
+    """Hull positions (CCW) of points sorted by x then y, all distinct."""
+    def half(order):
+        chain = []
+        for i in order:
+            px, py = x[i], y[i]
+            while len(chain) >= 2:
+                a, b = chain[-2], chain[-1]
+                if (x[b] - x[a]) * (py - y[a]) - (px - x[a]) * (y[b] - y[a]) > 0:
+                    break
+                chain.pop()
+            chain.append(i)
+        return chain
+
+    lower = half(range(len(x)))
+    upper = half(range(len(x) - 1, -1, -1))
+    return np.array(lower[:-1] + upper[:-1], dtype=np.intp)
@@ -1,21 +1,36 @@
 import math
-from scipy.optimize import minimize
-import numpy as np
+import numbers
+import sys
+from collections import namedtuple
 from Coord_Geom.points import Point
+from Coord_Geom.caching import cached_method
+from Coord_Geom.quadratics import real_roots, solve_quadratics
+
+# Convergence summary returned by Hyperbola.nearest_points()
+NearestPointReport = namedtuple('NearestPointReport', ['iterations', 'converged', 'max_step'])
 
 class Hyperbola:
+    __slots__ = ('a', 'b', 'h', 'k', 'orientation', '_cache')
+
     def __init__(self, a, b, h=0, k=0, orientation="h"):
         self.a = a
         self.b = b
         self.h = h
         self.k = k
-        self.orientation = orientation.lower()
+        self.orientation = sys.intern(orientation.lower())
+
+    def _cache_key(self):
+        return self.a, self.b
 
     def eccentricity(self):
         return math.sqrt(1 + (self.b ** 2) / (self.a ** 2))
 
+    @cached_method
+    def focal_distance(self):
+        return math.sqrt(self.a ** 2 + self.b ** 2)
+
     def foci(self):
-        c = math.sqrt(self.a ** 2 + self.b ** 2)
+        c = self.focal_distance()
         if self.orientation == "h":
             return (self.h + c, self.k), Point(self.h - c, self.k)
         else:
@@ -30,6 +45,15 @@ class Hyperbola:
     def evaluate(self, val):
         # For horizontal: val = x → return ±y
         # For vertical: val = y → return ±x
+        # Arrays of values return two arrays, NaN where no real point exists
+        if not isinstance(val, numbers.Real):
+            import numpy as np
+
+            center, other_center = (self.h, self.k) if self.orientation == 'h' else (self.k, self.h)
+            term = (np.asarray(val, dtype=float) - center) ** 2 / self.a ** 2 - 1
+            with np.errstate(invalid='ignore'):
+                offset = self.b * np.sqrt(term)
+            return other_center + offset, other_center - offset
         if self.orientation == 'h':
             dx = val - self.h
             term = (dx ** 2) / (self.a ** 2) - 1
@@ -49,7 +73,7 @@ class Hyperbola:
         return (2 * self.b ** 2) / self.a
 
     def latus_rectum_endpoints(self):
-        c = math.sqrt(self.a ** 2 + self.b ** 2)
+        c = self.focal_distance()
         l = self.latus_rectum_length() / 2
 
         if self.orientation == "h":
@@ -98,7 +122,21 @@ class Hyperbola:
             lhs = (y ** 2) / (self.a ** 2) - (x ** 2) / (self.b ** 2)
         return math.isclose(lhs, 1, rel_tol=1e-9)
 
-    def distance_to_hyperbola(self, p):
+    def distance_to_hyperbola(self, p, method="newton"):
+        """
+        Returns (distance, nearest Point on the hyperbola) for a point.
+
+        method="newton" uses nearest_points(); method="scipy" is the old
+        scipy.optimize.minimize search started from the right-hand vertex.
+        """
+        if method == "newton":
+            distances, xs, ys, _ = self.nearest_points([[p.x, p.y]])
+            return float(distances[0]), Point(float(xs[0]), float(ys[0]))
+        if method != "scipy":
+            raise ValueError("method must be 'newton' or 'scipy'")
+        import numpy as np
+        from scipy.optimize import minimize
+
         def objective(t):
             point_on_hyperbola = self.parametric_point(math.degrees(t[0]))
             return math.hypot(point_on_hyperbola.x - p.x, point_on_hyperbola.y - p.y)
@@ -110,6 +148,62 @@ class Hyperbola:
 
         return min_distance, nearest_point
 
+    def nearest_points(self, points, max_iter=50, tol=1e-12):
+        """
+        Foot of the normal from every query point to the hyperbola.
+
+        ``points`` is a Point, a sequence of Points, a PointArray or an (N, 2)
+        array. Returns ``(distances, xs, ys, report)`` where ``xs, ys`` is the
+        nearest point on the curve and ``report`` is a NearestPointReport.
+
+        Each query is folded into the first quadrant of the hyperbola's own
+        frame (the nearest point always lies on the same branch and side of
+        the transverse axis). There, with the branch written as
+        (a cosh s, b sinh s), the optimality condition
+        (a^2 + b^2) sinh s - a u tanh s - b v = 0 is convex in s, so Newton
+        iterations started from asinh((a u + b v) / (a^2 + b^2)), which lies
+        right of its largest root, converge monotonically to the global
+        minimum.
+        """
+        import numpy as np
+        from Coord_Geom.point_arrays import as_coords
+
+        xy = as_coords(points)
+        if self.orientation == "h":
+            u, v = xy[:, 0] - self.h, xy[:, 1] - self.k
+        else:
+            u, v = xy[:, 1] - self.k, xy[:, 0] - self.h
+        su = np.where(u < 0, -1.0, 1.0)
+        sv = np.where(v < 0, -1.0, 1.0)
+        au = self.a * np.abs(u)
+        bv = self.b * np.abs(v)
+        c2 = self.a ** 2 + self.b ** 2
+
+        s = np.arcsinh((au + bv) / c2)
+        converged = np.zeros(s.shape, dtype=bool)
+        step = np.zeros(s.shape)
+        iterations = 0
+        while iterations < max_iter and not converged.all():
+            iterations += 1
+            cosh_s = np.cosh(s)
+            g = c2 * np.sinh(s) - au * np.tanh(s) - bv
+            dg = c2 * cosh_s - au / cosh_s ** 2
+            with np.errstate(invalid='ignore', divide='ignore'):
+                step = np.where(converged | (dg <= 0), 0.0, g / dg)
+            s = np.maximum(s - step, 0.0)
+            converged |= np.abs(step) <= tol * np.maximum(1.0, s)
+
+        foot_u = su * self.a * np.cosh(s)
+        foot_v = sv * self.b * np.sinh(s)
+        distances = np.hypot(u - foot_u, v - foot_v)
+        if self.orientation == "h":
+            xs, ys = self.h + foot_u, self.k + foot_v
+        else:
+            xs, ys = self.h + foot_v, self.k + foot_u
+
+        report = NearestPointReport(iterations, converged, float(np.abs(step).max(initial=0.0)))
+        return distances, xs, ys, report
+
     def distance_to_focus(self, p: Point):
         f1, f2 = self.foci()
         d1 = math.hypot(p.x - f1.x, p.y - f1.y)
@@ -176,7 +270,83 @@ class Hyperbola:
         else:
             return f"(y - {self.k})²/{self.a ** 2} - (x - {self.h})²/{self.b ** 2} = 1"
 
-    def intersects_with_line(self, line, samples=1000):
+    def intersects_with_line(self, line, samples=1000, method="exact", segment=True):
+        """
+        Intersection points of the hyperbola with the segment from line.p1 to
+        line.p2 (or the whole line when segment=False), ordered from p1.
+
+        method="exact" solves the quadratic in the segment parameter.
+        method="sampled" is the old approximate fallback: it walks the segment
+        in ``samples`` steps and keeps the samples within 1% of the curve.
+        """
+        if method == "sampled":
+            return self._sampled_line_intersections(line, samples)
+        if method != "exact":
+            raise ValueError("method must be 'exact' or 'sampled'")
+
+        A, B, C = self._line_quadratic(line.p1.x - self.h, line.p1.y - self.k,
+                                       line.p2.x - line.p1.x, line.p2.y - line.p1.y)
+        if A == 0 and B == 0 and C == 0:
+            raise ValueError("Line must be defined by two distinct points.")
+
+        intersections = []
+        for t in real_roots(A, B, C):
+            if segment and not 0 <= t <= 1:
+                continue
+            x = line.p1.x + t * (line.p2.x - line.p1.x)
+            y = line.p1.y + t * (line.p2.y - line.p1.y)
+            intersections.append(Point(x, y))
+        return intersections
+
+    def intersections_with_lines(self, lines, segment=True):
+        """
+        Vectorized intersects_with_line for many lines at once.
+
+        ``lines`` is a sequence of Line objects, a LineArray or an (N, 4)
+        array of ``x1, y1, x2, y2`` rows (other shapes raise ValueError).
+        Returns ``(xs, ys, counts)``: (N, 2) arrays of intersection
+        coordinates ordered from p1 (NaN where unused) and the number of
+        intersections of every line. As in intersects_with_line, a line whose
+        two points coincide has no intersections, unless that point is on the
+        hyperbola, which raises ValueError.
+        """
+        import numpy as np
+        from Coord_Geom.line_arrays import as_segments
+
+        x1, y1, x2, y2 = as_segments(lines).T
+        dx = x2 - x1
+        dy = y2 - y1
+        A, B, C = self._line_quadratic(x1 - self.h, y1 - self.k, dx, dy)
+        if np.any((A == 0) & (B == 0) & (C == 0)):
+            raise ValueError("Line must be defined by two distinct points.")
+
+        t, _ = solve_quadratics(A, B, C)
+        if segment:
+            t[(t < 0) | (t > 1)] = np.nan
+        # Move surviving roots to the front
+        swap = np.isnan(t[:, 0]) & ~np.isnan(t[:, 1])
+        t[swap] = t[swap][:, ::-1]
+        counts = (~np.isnan(t)).sum(axis=1)
+
+        xs = x1[:, None] + t * dx[:, None]
+        ys = y1[:, None] + t * dy[:, None]
+        return xs, ys, counts
+
+    def _line_quadratic(self, x0, y0, dx, dy):
+        # Coefficients of A t^2 + B t + C = 0 for the point (x0, y0) + t (dx, dy),
+        # given relative to the center
+        if self.orientation == "h":
+            u0, v0, du, dv = x0, y0, dx, dy
+        else:
+            u0, v0, du, dv = y0, x0, dy, dx
+        a2 = self.a ** 2
+        b2 = self.b ** 2
+        A = du * du / a2 - dv * dv / b2
+        B = 2 * (u0 * du / a2 - v0 * dv / b2)
+        C = u0 * u0 / a2 - v0 * v0 / b2 - 1
+        return A, B, C
+
+    def _sampled_line_intersections(self, line, samples):
         intersections = []
 
         for i in range(samples + 1):
@@ -187,7 +357,7 @@ class Hyperbola:
             dx = x - self.h
             dy = y - self.k
 
-            if self.orientation == "horizontal":
+            if self.orientation == "h":
                 val = (dx ** 2) / self.a ** 2 - (dy ** 2) / self.b ** 2
             else:
                 val = (dy ** 2) / self.a ** 2 - (dx ** 2) / self.b ** 2
@@ -197,8 +367,8 @@ class Hyperbola:
 
         return intersections
 
-    def reflect_point_across_hyperbola(self, p):
-        _, nearest = self.distance_to_hyperbola(p)
+    def reflect_point_across_hyperbola(self, p, method="newton"):
+        _, nearest = self.distance_to_hyperbola(p, method=method)
         m = self.normal_slope_at_point(nearest)
 
         if m == float('inf'):
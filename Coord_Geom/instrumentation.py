@@ -0,0 +1,161 @@
+import contextlib
+import enum
+import functools
+import inspect
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+from Coord_Geom import _LAZY
+
+# Modules scanned for classes to instrument when they are already imported:
+# the eagerly imported core, every module behind a lazy public name (derived
+# from _LAZY, so new ones are picked up) and internal helpers they load.
+_CORE_MODULES = (
+    'Coord_Geom.points',
+    'Coord_Geom.lines',
+    'Coord_Geom.triangles',
+    'Coord_Geom.circles',
+    'Coord_Geom.parabolas',
+    'Coord_Geom.ellipses',
+    'Coord_Geom.hyperbolas',
+    'Coord_Geom.frozen',
+)
+_MODULES = tuple(name for name in dict.fromkeys(
+    _CORE_MODULES + tuple(_LAZY.values()) + ('Coord_Geom.tessellation',)) if name != __name__)
+
+MethodStats = namedtuple('MethodStats', ['name', 'calls', 'total_time', 'mean_time', 'allocated'])
+
+
+class InstrumentationReport:
+    """
+    Per-method call counts, cumulative (inclusive) wall time in seconds and,
+    when allocation tracing was on, the net bytes allocated by those calls.
+    """
+
+    _SORT_KEYS = {'calls': 1, 'time': 2, 'mean': 3, 'allocated': 4, 'name': 0}
+
+    def __init__(self, trace_allocations=False):
+        self.trace_allocations = trace_allocations
+        self._stats = {}
+
+    def rows(self, sort_by='time', reverse=True):
+        """Returns MethodStats rows sorted by 'time', 'calls', 'mean', 'allocated' or 'name'."""
+        if sort_by not in self._SORT_KEYS:
+            raise ValueError("sort_by must be one of {}".format(sorted(self._SORT_KEYS)))
+        rows = [MethodStats(name, calls, total, total / calls, allocated)
+                for name, (calls, total, allocated) in self._stats.items() if calls]
+        return sorted(rows, key=lambda row: row[self._SORT_KEYS[sort_by]], reverse=reverse)
+
+    def top(self, n=10, sort_by='time'):
+        return self.rows(sort_by)[:n]
+
+    def __getitem__(self, name):
+        calls, total, allocated = self._stats[name]
+        return MethodStats(name, calls, total, total / calls if calls else 0.0, allocated)
+
+    def __str__(self):
+        header = "{:<45} {:>10} {:>12} {:>12}".format('method', 'calls', 'total ms', 'mean us')
+        if self.trace_allocations:
+            header += " {:>12}".format('alloc KiB')
+        lines = [header]
+        for row in self.rows():
+            line = "{:<45} {:>10} {:>12.3f} {:>12.3f}".format(
+                row.name, row.calls, row.total_time * 1e3, row.mean_time * 1e6)
+            if self.trace_allocations:
+                line += " {:>12.1f}".format(row.allocated / 1024)
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def default_classes():
+    """Geometry classes from the Coord_Geom modules imported so far."""
+    classes = []
+    for module_name in _MODULES:
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module_name or issubclass(cls, (tuple, enum.Enum)):
+                continue
+            classes.append(cls)
+    return classes
+
+
+def _wrap(func, stats, trace_allocations):
+    perf_counter = time.perf_counter
+    get_traced_memory = tracemalloc.get_traced_memory
+
+    if trace_allocations:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stats[0] += 1
+            before = get_traced_memory()[0]
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats[1] += perf_counter() - start
+                stats[2] += get_traced_memory()[0] - before
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stats[0] += 1
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats[1] += perf_counter() - start
+    return wrapper
+
+
+@contextlib.contextmanager
+def instrument(classes=None, trace_allocations=False):
+    """
+    Records call counts and timings for every method of the geometry classes
+    while the block runs, and yields the InstrumentationReport being filled:
+
+        with instrument() as report:
+            run_pipeline()
+        print(report)
+
+    Methods are only wrapped inside the block and restored afterwards, so
+    there is no cost at all when instrumentation is not in use. Calls made
+    indirectly (Line.equation from Line.evaluate, say) are counted too, and
+    times are inclusive of nested calls. With ``trace_allocations`` the net
+    tracemalloc delta of each call is summed as well (much slower).
+
+    ``classes`` defaults to every class defined in the already imported
+    Coord_Geom modules.
+    """
+    report = InstrumentationReport(trace_allocations)
+    if classes is None:
+        classes = default_classes()
+
+    started_tracing = trace_allocations and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    patched = []
+    try:
+        for cls in classes:
+            for name, attr in list(vars(cls).items()):
+                if name.startswith('__') and name != '__init__':
+                    continue
+                wrapped_type = None
+                func = attr
+                if isinstance(attr, (classmethod, staticmethod)):
+                    wrapped_type, func = type(attr), attr.__func__
+                if not inspect.isfunction(func):
+                    continue
+                stats = report._stats.setdefault("{}.{}".format(cls.__name__, name), [0, 0.0, 0])
+                wrapper = _wrap(func, stats, trace_allocations)
+                setattr(cls, name, wrapped_type(wrapper) if wrapped_type else wrapper)
+                patched.append((cls, name, attr))
+        yield report
+    finally:
+        for cls, name, attr in reversed(patched):
+            setattr(cls, name, attr)
+        if started_tracing:
+            tracemalloc.stop()
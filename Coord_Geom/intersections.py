@@ -0,0 +1,246 @@
+import heapq
+from fractions import Fraction
+from functools import cmp_to_key
+
+import numpy as np
+from Coord_Geom.line_arrays import as_segments
+from Coord_Geom.predicates import ERRBOUND, orient, sign
+
+
+def segment_intersections(segments):
+    """
+    Every pair of intersecting segments, found with a Bentley-Ottmann sweep
+    over n segments with k intersecting pairs.
+
+    The event queue and the status searches cost O((n + k) log n), but the
+    status is a Python list updated by slice assignment, which moves up to n
+    entries per event: the worst case is O(n^2 + k n). Each move is a single
+    memmove of pointers, cheap next to the predicate work unless the status
+    (the segments crossing one vertical line) grows very large.
+
+    ``segments`` is a list of Lines (taken as the segments p1-p2), a
+    LineArray, or an (N, 4) array of ``x1, y1, x2, y2`` rows (an (N, 2, 2)
+    array works too); other shapes raise ValueError. Touching counts as
+    intersecting: shared endpoints, an endpoint on another segment, vertical
+    segments and zero-length segments are all handled, and collinear
+    segments that overlap are reported once.
+
+    Returns ``(pairs, points, overlaps)``: a (K, 2) int array of ``(i, j)``
+    rows with ``i < j`` sorted lexicographically, the (K, 2) intersection
+    point of each pair and a (K,) bool array marking collinear overlaps, for
+    which the point is the start of the shared stretch (its lowest point in
+    x, then y order).
+
+    All sign tests are exact (floating point filtered, with a rational
+    fallback), so the result does not depend on rounding even for
+    degenerate input.
+    """
+    coords = _as_segments(segments)
+    found = _Sweep(coords).run()
+    if not found:
+        return np.empty((0, 2), dtype=np.intp), np.empty((0, 2)), np.empty(0, dtype=bool)
+
+    pairs = np.array(list(found), dtype=np.intp)
+    points = np.array([(float(x), float(y)) for x, y in found.values()])
+    order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    pairs, points = pairs[order], points[order]
+    rows = coords.tolist()
+    overlaps = np.array([_overlap(rows[i], rows[j]) for i, j in pairs.tolist()], dtype=bool)
+    return pairs, points, overlaps
+
+
+def _as_segments(segments):
+    coords = as_segments(segments)
+    if not np.isfinite(coords).all():
+        raise ValueError("Segment coordinates must be finite")
+    return coords
+
+
+def _exact(value):
+    """A float when the rational value is representable as one."""
+    approx = float(value)
+    return approx if approx == value else value
+
+
+def _overlap(first, second):
+    ax, ay, bx, by = first
+    cx, cy, dx, dy = second
+    if orient(ax, ay, bx, by, cx, cy) or orient(ax, ay, bx, by, dx, dy):
+        return False
+    if (ax, ay) == (bx, by) or (cx, cy) == (dx, dy):
+        return False
+    start = max(min((ax, ay), (bx, by)), min((cx, cy), (dx, dy)))
+    end = min(max((ax, ay), (bx, by)), max((cx, cy), (dx, dy)))
+    return start < end
+
+
+class _Sweep:
+    """
+    Left-to-right sweep following de Berg et al. Events are points ordered by
+    (x, y); the status is a plain list of segment indices ordered bottom to
+    top just right of the last event. At each event every segment through
+    the point is removed and the ones that continue are reinserted by slope,
+    so intersections are found by comparing segments against the event point
+    only, never against each other.
+    """
+
+    def __init__(self, coords):
+        left = []
+        right = []
+        events = {}
+        through = {}
+        points = []
+        for i, (x1, y1, x2, y2) in enumerate(coords.tolist()):
+            a, b = sorted(((x1, y1), (x2, y2)))
+            left.append(a)
+            right.append(b)
+            events.setdefault(a, []).append(i)
+            events.setdefault(b, [])
+            through.setdefault(b, set()).add(i)
+            if a == b:
+                points.append(i)
+        self.left = left
+        self.right = right
+        self.degenerate = set(points)
+        self.events = events
+        # Heap entries carry float keys first: rounding is monotone, so they
+        # order like the exact points and ties fall through to exact compares
+        self.heap = [(x, y, (x, y)) for x, y in events]
+        heapq.heapify(self.heap)
+        # Segments known to pass through each event point (ending or crossing)
+        self.through = through
+        self.status = []
+        self.checked = set()
+        self.found = {}
+
+    def run(self):
+        heap = self.heap
+        events = self.events
+        status = self.status
+        right = self.right
+        degenerate = self.degenerate
+        by_slope = cmp_to_key(self._compare_slopes)
+
+        while heap:
+            fx, fy, p = heapq.heappop(heap)
+            starting = events.pop(p)
+            known = self.through.pop(p, ())
+            lo, hi = self._locate(p, fx, fy, known)
+            through = status[lo:hi]
+
+            involved = starting + through
+            if len(involved) > 1:
+                self._report(involved, p)
+
+            inserted = [i for i in starting if i not in degenerate]
+            if type(fx) is type(p[0]) and type(fy) is type(p[1]):
+                inserted.extend(i for i in through if right[i] != p)
+            else:
+                # Not representable as floats, so not an endpoint of anything
+                inserted.extend(through)
+            inserted.sort(key=by_slope)
+            status[lo:hi] = inserted
+
+            if not inserted:
+                if 0 < lo < len(status):
+                    self._check(status[lo - 1], status[lo], p)
+            else:
+                if lo > 0:
+                    self._check(status[lo - 1], inserted[0], p)
+                end = lo + len(inserted)
+                if end < len(status):
+                    self._check(inserted[-1], status[end], p)
+        return self.found
+
+    def _side(self, i, p, fx, fy):
+        """Sign of (height of segment i at x = p.x) - p.y; 0 when i passes through p."""
+        (x1, y1), (x2, y2) = self.left[i], self.right[i]
+        px, py = p
+        if x1 == x2:
+            return (y1 > py) - (y2 < py)
+        slope = (y2 - y1) / (x2 - x1)
+        height = y1 + (fx - x1) * slope
+        diff = height - fy
+        if abs(diff) > ERRBOUND * (abs(y1) + abs(fy) + (abs(fx) + abs(x1)) * abs(slope)):
+            return sign(diff)
+        F = Fraction
+        return sign((F(y1) - F(py)) * (F(x2) - F(x1)) + (F(px) - F(x1)) * (F(y2) - F(y1)))
+
+    def _locate(self, p, fx, fy, known):
+        """Slice of the status holding the segments that pass through p."""
+        status = self.status
+        side = self._side
+        lo, hi = 0, len(status)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = status[mid]
+            if i not in known and side(i, p, fx, fy) < 0:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = lo
+        hi = len(status)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = status[mid]
+            if i in known or side(i, p, fx, fy) <= 0:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
+
+    def _compare_slopes(self, i, j):
+        """Bottom-to-top order just right of a common point; verticals go on top."""
+        (ax, ay), (bx, by) = self.left[i], self.right[i]
+        (cx, cy), (dx, dy) = self.left[j], self.right[j]
+        vertical_i, vertical_j = ax == bx, cx == dx
+        if vertical_i or vertical_j:
+            return vertical_i - vertical_j
+        first = (by - ay) * (dx - cx)
+        second = (dy - cy) * (bx - ax)
+        diff = first - second
+        if abs(diff) > ERRBOUND * (abs(first) + abs(second)):
+            return sign(diff)
+        F = Fraction
+        return sign((F(by) - F(ay)) * (F(dx) - F(cx)) - (F(dy) - F(cy)) * (F(bx) - F(ax)))
+
+    def _check(self, i, j, p):
+        """Schedules the crossing of neighbours i and j if it lies after p."""
+        key = (i, j) if i < j else (j, i)
+        if key in self.checked:
+            return
+        self.checked.add(key)
+        q = self._crossing(i, j)
+        if q is None or q <= p:
+            return
+        if q not in self.events:
+            self.events[q] = []
+            heapq.heappush(self.heap, (float(q[0]), float(q[1]), q))
+        self.through.setdefault(q, set()).update(key)
+
+    def _crossing(self, i, j):
+        """Exact point where the interiors of i and j cross, or None."""
+        (ax, ay), (bx, by) = self.left[i], self.right[i]
+        (cx, cy), (dx, dy) = self.left[j], self.right[j]
+        first = orient(ax, ay, bx, by, cx, cy)
+        second = orient(ax, ay, bx, by, dx, dy)
+        if first == 0 or second == 0 or first == second:
+            return None
+        first = orient(cx, cy, dx, dy, ax, ay)
+        second = orient(cx, cy, dx, dy, bx, by)
+        if first == 0 or second == 0 or first == second:
+            return None
+        F = Fraction
+        ax, ay, bx, by, cx, cy, dx, dy = map(F, (ax, ay, bx, by, cx, cy, dx, dy))
+        at_a = (dx - cx) * (ay - cy) - (dy - cy) * (ax - cx)
+        at_b = (dx - cx) * (by - cy) - (dy - cy) * (bx - cx)
+        t = at_a / (at_a - at_b)
+        return _exact(ax + (bx - ax) * t), _exact(ay + (by - ay) * t)
+
+    def _report(self, involved, p):
+        found = self.found
+        involved = sorted(involved)
+        for n, i in enumerate(involved):
+            for j in involved[n + 1:]:
+                if (i, j) not in found:
+                    found[(i, j)] = p
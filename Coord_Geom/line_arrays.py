@@ -0,0 +1,175 @@
+import numpy as np
+from Coord_Geom.points import Point
+from Coord_Geom.lines import Line
+from Coord_Geom.point_arrays import as_xy
+
+
+def _isclose(a, b, rel_tol, abs_tol):
+    """Elementwise math.isclose (symmetric, unlike np.isclose)."""
+    return np.abs(a - b) <= np.maximum(rel_tol * np.maximum(np.abs(a), np.abs(b)), abs_tol)
+
+
+def as_segments(segments):
+    """
+    Returns an (N, 4) float array of ``x1, y1, x2, y2`` rows from a LineArray,
+    a sequence of Lines, or an (N, 4) or (N, 2, 2) array-like. Any other shape
+    raises ValueError rather than being regrouped into segments.
+    """
+    if isinstance(segments, LineArray):
+        return segments.to_coords()
+    if not isinstance(segments, np.ndarray):
+        segments = list(segments)
+        if segments and isinstance(segments[0], Line):
+            return np.array([(l.p1.x, l.p1.y, l.p2.x, l.p2.y) for l in segments], dtype=float)
+    arr = np.asarray(segments, dtype=float)
+    if arr.shape == (0,):
+        return arr.reshape(0, 4)
+    if arr.ndim == 3 and arr.shape[1:] == (2, 2):
+        return arr.reshape(-1, 4)
+    if arr.ndim != 2 or arr.shape[1] != 4:
+        raise ValueError("Expected an (N, 4) or (N, 2, 2) array of segments, got shape {}".format(arr.shape))
+    return arr
+
+
+class LineArray:
+    """
+    A column store of many lines, each through two points: float64 ``x1``,
+    ``y1``, ``x2`` and ``y2`` arrays. Every method mirrors the one on Line.
+
+    Point arguments broadcast against the lines, so N points can be checked
+    against one line (a LineArray of length 1), one point against N lines, or
+    N points against N lines pairwise. With ``outer=True`` every point is
+    checked against every line instead, giving (N_lines, N_points) results.
+    Points come back as ``(x, y)`` array pairs.
+    """
+
+    def __init__(self, x1, y1, x2, y2):
+        self.x1 = np.ascontiguousarray(x1, dtype=float).reshape(-1)
+        self.y1 = np.ascontiguousarray(y1, dtype=float).reshape(-1)
+        self.x2 = np.ascontiguousarray(x2, dtype=float).reshape(-1)
+        self.y2 = np.ascontiguousarray(y2, dtype=float).reshape(-1)
+        if not self.x1.shape == self.y1.shape == self.x2.shape == self.y2.shape:
+            raise ValueError("x1, y1, x2 and y2 must have the same length.")
+
+    @classmethod
+    def from_lines(cls, lines):
+        lines = list(lines)
+        coords = np.array([(l.p1.x, l.p1.y, l.p2.x, l.p2.y) for l in lines], dtype=float).reshape(-1, 4)
+        return cls.from_coords(coords)
+
+    @classmethod
+    def from_coords(cls, coords):
+        """From an (N, 4) array of ``x1, y1, x2, y2`` rows (or (N, 2, 2)); other shapes raise ValueError."""
+        coords = as_segments(coords)
+        return cls(coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3])
+
+    def to_lines(self):
+        return [Line(Point(x1, y1), Point(x2, y2)) for x1, y1, x2, y2 in
+                zip(self.x1.tolist(), self.y1.tolist(), self.x2.tolist(), self.y2.tolist())]
+
+    def to_coords(self):
+        return np.column_stack((self.x1, self.y1, self.x2, self.y2))
+
+    def __len__(self):
+        return self.x1.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Line(Point(float(self.x1[index]), float(self.y1[index])),
+                        Point(float(self.x2[index]), float(self.y2[index])))
+        return LineArray(self.x1[index], self.y1[index], self.x2[index], self.y2[index])
+
+    def __repr__(self):
+        return "LineArray(n={})".format(len(self))
+
+    def _columns(self, points, outer):
+        """Point coordinates and line columns, shaped to broadcast together."""
+        px, py = as_xy(points)
+        x1, y1, x2, y2 = self.x1, self.y1, self.x2, self.y2
+        if outer:
+            px = np.reshape(px, -1)
+            py = np.reshape(py, -1)
+            x1, y1, x2, y2 = x1[:, None], y1[:, None], x2[:, None], y2[:, None]
+        return px, py, x1, y1, x2, y2
+
+    def length(self):
+        return np.hypot(self.x2 - self.x1, self.y2 - self.y1)
+
+    def midpoint(self):
+        return (self.x1 + self.x2) / 2, (self.y1 + self.y2) / 2
+
+    def slope(self):
+        """Slopes as in Line.slope: vertical lines are +inf, or -inf when p2 is below p1."""
+        dx = self.x2 - self.x1
+        dy = self.y2 - self.y1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            m = dy / dx
+        vertical = dx == 0
+        m[vertical] = np.where(dy[vertical] >= 0, np.inf, -np.inf)
+        return m
+
+    def equation(self):
+        """Returns ``(m, c)`` arrays for y = mx + c; c is NaN for vertical lines."""
+        m = self.slope()
+        with np.errstate(invalid='ignore'):
+            c = self.y1 - m * self.x1
+        c[np.isinf(m)] = np.nan
+        return m, c
+
+    def perpendicular_slope(self):
+        m = self.slope()
+        with np.errstate(divide='ignore'):
+            perpendicular = -1 / m
+        perpendicular[m == 0] = np.inf
+        return perpendicular
+
+    def perpendicular_bisector(self):
+        """Returns ``(slopes, (mid_x, mid_y))``, as Line.perpendicular_bisector."""
+        return self.perpendicular_slope(), self.midpoint()
+
+    def angle_with_x_axis(self):
+        return np.degrees(np.arctan(self.slope()))
+
+    def distance_from_points(self, points, outer=False):
+        """Perpendicular distances; 0 for lines whose two points coincide."""
+        px, py, x1, y1, x2, y2 = self._columns(points, outer)
+        dx = x2 - x1
+        dy = y2 - y1
+        numerator = np.abs(dy * px - dx * py + x2 * y1 - y2 * x1)
+        denominator = np.hypot(dx, dy)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denominator != 0, numerator / denominator, 0.0)
+
+    def _foot(self, points, outer):
+        """Projection scalar along p1 -> p2 and the pieces needed to use it."""
+        px, py, x1, y1, x2, y2 = self._columns(points, outer)
+        dx = x2 - x1
+        dy = y2 - y1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = (dx * (px - x1) + dy * (py - y1)) / (dx ** 2 + dy ** 2)
+        return scale, px, py, x1, y1, dx, dy
+
+    def project_points(self, points, outer=False):
+        """Feet of the perpendiculars; NaN for lines whose two points coincide."""
+        scale, _, _, x1, y1, dx, dy = self._foot(points, outer)
+        return x1 + scale * dx, y1 + scale * dy
+
+    def reflect_points(self, points, outer=False):
+        """Mirror images across the lines; NaN for lines whose two points coincide."""
+        scale, px, py, x1, y1, dx, dy = self._foot(points, outer)
+        return 2 * (x1 + scale * dx) - px, 2 * (y1 + scale * dy) - py
+
+    def points_on_line(self, points, rel_tol=1e-9, abs_tol=0.0, outer=False):
+        """
+        Boolean on-line test with explicit tolerances. Like Line.point_on_line
+        it compares x against a vertical line and y against y = mx + c
+        otherwise, using math.isclose semantics.
+        """
+        px, py, x1, y1, x2, y2 = self._columns(points, outer)
+        dx = x2 - x1
+        dy = y2 - y1
+        vertical = dx == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            m = dy / dx
+            expected = m * (px - x1) + y1
+        return np.where(vertical, _isclose(px, x1, rel_tol, abs_tol), _isclose(py, expected, rel_tol, abs_tol))
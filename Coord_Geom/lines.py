@@ -1,7 +1,10 @@
 import math
+import numbers
 from Coord_Geom.points import Point
 
 class Line:
+    __slots__ = ('p1', 'p2')
+
     def __init__(self, p1: Point, p2: Point):
         self.p1 = p1
         self.p2 = p2
@@ -25,15 +28,23 @@ class Line:
         return m, c  # y = mx + c
 
     def evaluate(self, x):
+        """y at ``x``; also takes an array of x values and returns an array."""
         m, c = self.equation()
         if m == float('inf') or m == float('-inf'):
             raise ValueError("Cannot evaluate vertical line at x = {}".format(x))
+        if not isinstance(x, numbers.Real):
+            import numpy as np
+            x = np.asarray(x, dtype=float)
         return m * x + c
 
     def evaluate_y(self, y):
+        """x at ``y``; also takes an array of y values and returns an array."""
         m, c = self.equation()
         if m == 0:
             raise ValueError("Cannot evaluate horizontal line at y = {}".format(y))
+        if not isinstance(y, numbers.Real):
+            import numpy as np
+            y = np.asarray(y, dtype=float)
         return (y - c) / m
 
     def perpendicular_slope(self):
@@ -1,18 +1,32 @@
 import math
+import numbers
+import sys
 
 from Coord_Geom.lines import Line
 from Coord_Geom.points import Point
+from Coord_Geom.caching import cached_method
+from Coord_Geom.quadratics import quadratic_roots, real_roots, solve_quadratics
 
 class Parabola:
+    __slots__ = ('a', 'b', 'c', 'orientation', '_cache')
+
     def __init__(self, a: float, b: float, c: float, orientation='v'):
         self.a = a
         self.b = b
         self.c = c
-        self.orientation = orientation.lower()
+        self.orientation = sys.intern(orientation.lower())
+
+    def _cache_key(self):
+        return self.a, self.b, self.c, self.orientation
 
     def evaluate(self, x):
+        """Value of a*x^2 + b*x + c; also takes an array and returns an array."""
+        if not isinstance(x, numbers.Real):
+            import numpy as np
+            x = np.asarray(x, dtype=float)
         return self.a * x ** 2 + self.b * x + self.c
 
+    @cached_method
     def vertex(self):
         if self.orientation == 'v':
             x = -self.b / (2 * self.a)
@@ -75,19 +89,9 @@ class Parabola:
     def latus_rectum_length(self):
         return 1 / abs(self.a)
 
+    @cached_method
     def roots(self):
-        discriminant = self.discriminant()
-        if discriminant > 0:
-            r1 = (-self.b + math.sqrt(discriminant)) / (2 * self.a)
-            r2 = (-self.b - math.sqrt(discriminant)) / (2 * self.a)
-            return r1, r2
-        elif discriminant == 0:
-            r = -self.b / (2 * self.a)
-            return r, r
-        else:
-            real = -self.b / (2 * self.a)
-            imag = math.sqrt(-discriminant) / (2 * self.a)
-            return complex(real, imag), complex(real, -imag)
+        return quadratic_roots(self.a, self.b, self.c)
 
     def is_point_on_parabola(self, point):
         if self.orientation == 'v':
@@ -141,61 +145,55 @@ class Parabola:
         return Point(x, y)
 
     def intersection_with_line(self, line : Line):
-        m, c = line.equation()  # y = mx + c
-
+        """
+        Points where the (infinite) line through line.p1 and line.p2 meets
+        the parabola, in ascending order along the parabola's axis variable.
+        """
+        la, lb, lc = self._line_coefficients(line.p2.y - line.p1.y, line.p1.x - line.p2.x,
+                                             line.p2.x * line.p1.y - line.p1.x * line.p2.y)
         points = []
+        for u in real_roots(la, lb, lc):
+            v = self.evaluate(u)
+            points.append(Point(u, v) if self.orientation == 'v' else Point(v, u))
+        return points
 
+    def _line_coefficients(self, la, lb, lc):
+        # Substitute the parabola into la * x + lb * y + lc = 0, giving
+        # A u^2 + B u + C = 0 in u = x for 'v' (y = a x^2 + b x + c), y for 'h'
         if self.orientation == 'v':
-            # Parabola: y = ax^2 + bx + c
-            # Line: y = mx + c  → ax^2 + bx + c = mx + c
-            # → ax^2 + (b - m)x + (c - c) = 0
-            A = self.a
-            B = self.b - m
-            C = self.c - c
-
-            D = B ** 2 - 4 * A * C
-
-            if D < 0:
-                return []  # No real intersection
-            elif math.isclose(D, 0):
-                x = -B / (2 * A)
-                y = line.evaluate(x)
-                points.append(Point(x, y))
-            else:
-                sqrt_D = math.sqrt(D)
-                x1 = (-B + sqrt_D) / (2 * A)
-                x2 = (-B - sqrt_D) / (2 * A)
-                points.append(Point(x1, line.evaluate(x1)))
-                points.append(Point(x2, line.evaluate(x2)))
-
-        else:  # orientation == 'h'
-            # Parabola: x = ay^2 + by + c
-            # Line: y = mx + c → x = a y^2 + b y + c = (y - c)/m
-            # Multiply both sides by m: m x = a y^2 + b y + c → x = (a y^2 + b y + c)/m
-
-            # Invert line: x = (y - c) / m
-            if m == 0:
-                return []  # horizontal line can't intersect horizontal parabola (constant y)
-
-            # Sub x = (y - c) / m into x = ay^2 + by + c
-            # ay^2 + by + c = (y - c)/m → ay^2 + (b - 1/m)y + (c + c/m) = 0
-            A = self.a
-            B = self.b - 1 / m
-            C = self.c - c / m
-
-            D = B ** 2 - 4 * A * C
-
-            if D < 0:
-                return []
-            elif math.isclose(D, 0):
-                y = -B / (2 * A)
-                x = self.evaluate(y)
-                points.append(Point(x, y))
-            else:
-                sqrt_D = math.sqrt(D)
-                y1 = (-B + sqrt_D) / (2 * A)
-                y2 = (-B - sqrt_D) / (2 * A)
-                points.append(Point(line.evaluate_y(y1), y1))
-                points.append(Point(line.evaluate_y(y2), y2))
+            lin, other = la, lb
+        else:
+            lin, other = lb, la
+        return other * self.a, other * self.b + lin, other * self.c + lc
+
+    def intersections_with_lines(self, lines=None, coefficients=None, tol=0.0):
+        """
+        Vectorized intersection_with_line for many lines at once.
+
+        Give either ``lines``, a sequence of Line objects, a LineArray or an
+        (N, 4) array of ``x1, y1, x2, y2`` rows, or ``coefficients``, three arrays
+        ``(la, lb, lc)`` describing the lines la * x + lb * y + lc = 0.
+        Vertical and horizontal lines are handled for both orientations.
+
+        Returns ``(xs, ys, counts)``: (N, 2) arrays of intersection
+        coordinates in ascending order along the parabola's axis variable (x
+        for 'v', y for 'h'; NaN where unused) and the number of intersections
+        of every line. A line is tangent (one intersection) when the
+        discriminant is within ``tol * B^2`` of zero.
+        """
+        import numpy as np
+        from Coord_Geom.line_arrays import as_segments
+
+        if (lines is None) == (coefficients is None):
+            raise ValueError("Give exactly one of lines or coefficients.")
+        if lines is not None:
+            x1, y1, x2, y2 = as_segments(lines).T
+            la, lb, lc = y2 - y1, x1 - x2, x2 * y1 - x1 * y2
+        else:
+            la, lb, lc = np.broadcast_arrays(*(np.asarray(v, dtype=float).reshape(-1) for v in coefficients))
 
-        return points
+        u, counts = solve_quadratics(*self._line_coefficients(la, lb, lc), tol=tol)
+        v = self.a * u ** 2 + self.b * u + self.c
+        if self.orientation == 'v':
+            return u, v, counts
+        return v, u, counts
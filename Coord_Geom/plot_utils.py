@@ -1,5 +1,8 @@
 import matplotlib.pyplot as plt
-import math
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 from Coord_Geom.points import Point
 from Coord_Geom.lines import Line
 from Coord_Geom.triangles import Triangle
@@ -7,6 +10,9 @@ from Coord_Geom.circles import Circle
 from Coord_Geom.parabolas import Parabola
 from Coord_Geom.ellipses import Ellipse
 from Coord_Geom.hyperbolas import Hyperbola
+from Coord_Geom.circle_arrays import CircleArray
+from Coord_Geom.line_arrays import as_segments
+from Coord_Geom.tessellation import tessellate, DEFAULT_RELATIVE_TOLERANCE
 
 # ---------- General Setup Utilities ----------
 
@@ -29,26 +35,24 @@ def plot_point(p: Point, label='', color='red', size=50):
 # ---------- Line ----------
 
 def plot_line(line, label=None, bounds=(-10, 10), color='blue'):
-    try:
-        x_vals = list(bounds)
-        y_vals = [line.evaluate(x) for x in x_vals]
-        if label:
-            plt.plot(x_vals, y_vals, color=color, label=label)
-        else:
-            plt.plot(x_vals, y_vals, color=color)
-    except ValueError:
+    if line.p1.x == line.p2.x:
+        # Vertical: no x range to clip to, draw it across the whole axes
         if label:
             plt.axvline(x=line.p1.x, color=color, label=label)
         else:
             plt.axvline(x=line.p1.x, color=color)
+        return
+    pts = tessellate(line, bounds=bounds)
+    if label:
+        plt.plot(pts[:, 0], pts[:, 1], color=color, label=label)
+    else:
+        plt.plot(pts[:, 0], pts[:, 1], color=color)
 
 # ---------- Circle ----------
 
-def plot_circle(circle : Circle, show_center=True, show_radius=True, label=''):
-    theta = [math.radians(i) for i in range(361)]
-    xs = [circle.center.x + circle.radius * math.cos(t) for t in theta]
-    ys = [circle.center.y + circle.radius * math.sin(t) for t in theta]
-    plt.plot(xs, ys, label=label)
+def plot_circle(circle : Circle, show_center=True, show_radius=True, label='', tolerance=None):
+    pts = tessellate(circle, tolerance)
+    plt.plot(pts[:, 0], pts[:, 1], label=label)
 
     if show_center:
         plot_point(circle.center, label='Center', color='black')
@@ -60,10 +64,8 @@ def plot_circle(circle : Circle, show_center=True, show_radius=True, label=''):
 # ---------- Triangle ----------
 
 def plot_triangle(triangle : Triangle, label_vertices=True):
-    pts = [triangle.a, triangle.b, triangle.c, triangle.a]
-    xs = [p.x for p in pts]
-    ys = [p.y for p in pts]
-    plt.plot(xs, ys, 'purple', label="Triangle")
+    pts = tessellate(triangle)
+    plt.plot(pts[:, 0], pts[:, 1], 'purple', label="Triangle")
 
     if label_vertices:
         for i, p in enumerate([triangle.a, triangle.b, triangle.c]):
@@ -71,39 +73,17 @@ def plot_triangle(triangle : Triangle, label_vertices=True):
 
 # ---------- Parabola ----------
 
-def plot_parabola(parabola : Parabola, range_val=(-10, 10), label='Parabola'):
-    vals = [v / 10 for v in range(int(range_val[0]*10), int(range_val[1]*10))]
-    xs, ys = [], []
-
-    for val in vals:
-        try:
-            if parabola.orientation == 'v':
-                xs.append(val)
-                ys.append(parabola.evaluate(val))
-            else:
-                ys.append(val)
-                xs.append(parabola.evaluate(val))
-        except:
-            continue
-
-    plt.plot(xs, ys, label=label)
+def plot_parabola(parabola : Parabola, range_val=(-10, 10), label='Parabola', tolerance=None):
+    pts = tessellate(parabola, tolerance, bounds=range_val)
+    plt.plot(pts[:, 0], pts[:, 1], label=label)
     plot_point(parabola.vertex(), label="Vertex", color='green')
     plot_point(parabola.focus(), label="Focus", color='blue')
 
 # ---------- Ellipse ----------
 
-def plot_ellipse(ellipse : Ellipse, show_foci=True, label='Ellipse'):
-    theta = [math.radians(i) for i in range(361)]
-
-    # Handle orientation
-    if ellipse.orientation == 'horizontal':
-        xs = [ellipse.h + ellipse.a * math.cos(t) for t in theta]
-        ys = [ellipse.k + ellipse.b * math.sin(t) for t in theta]
-    else:
-        xs = [ellipse.h + ellipse.b * math.cos(t) for t in theta]
-        ys = [ellipse.k + ellipse.a * math.sin(t) for t in theta]
-
-    plt.plot(xs, ys, label=label)
+def plot_ellipse(ellipse : Ellipse, show_foci=True, label='Ellipse', tolerance=None):
+    pts = tessellate(ellipse, tolerance)
+    plt.plot(pts[:, 0], pts[:, 1], label=label)
 
     if show_foci:
         f1, f2 = ellipse.foci()
@@ -112,30 +92,118 @@ def plot_ellipse(ellipse : Ellipse, show_foci=True, label='Ellipse'):
 
 # ---------- Hyperbola ----------
 
-def plot_hyperbola(hyperbola : Hyperbola, range_val=(-10, 10), show_foci=True, label='Hyperbola'):
-    vals = [v / 10 for v in range(int(range_val[0] * 10), int(range_val[1] * 10))]
-    branch1, branch2 = [], []
-
-    for val in vals:
-        try:
-            a1, a2 = hyperbola.evaluate(val)
-            if hyperbola.orientation == 'h':
-                branch1.append((val, a1))  # x, +y
-                branch2.append((val, a2))  # x, -y
-            else:
-                branch1.append((a1, val))  # +x, y
-                branch2.append((a2, val))  # -x, y
-        except ValueError:
-            continue
-
-    if branch1:
-        x1, y1 = zip(*branch1)
-        plt.plot(x1, y1, label=label)
-    if branch2:
-        x2, y2 = zip(*branch2)
-        plt.plot(x2, y2, linestyle='--')
+def plot_hyperbola(hyperbola : Hyperbola, range_val=(-10, 10), show_foci=True, label='Hyperbola', tolerance=None):
+    # Both branches in one polyline, separated by a NaN gap
+    pts = tessellate(hyperbola, tolerance, bounds=range_val)
+    if len(pts):
+        plt.plot(pts[:, 0], pts[:, 1], label=label)
 
     if show_foci:
         f1, f2 = hyperbola.foci()
         plot_point(f1, label='F1', color='green')
-        plot_point(f2, label='F2', color='green')
\ No newline at end of file
+        plot_point(f2, label='F2', color='green')
+
+# ---------- Batched scenes ----------
+
+class Scene:
+    """
+    Collects many shapes and renders them straight to an image file.
+
+    Shapes sharing a style are drawn as one LineCollection (curves) or one
+    scatter PathCollection (points), so the cost of a render grows with the
+    number of styles rather than the number of shapes. Rendering uses the Agg
+    canvas directly: no pyplot state, no ``plt.show()``, no display needed.
+    Labels are only drawn when ``show_labels`` is set.
+    """
+
+    def __init__(self, title=None, figsize=(7, 7), show_labels=False, grid=True):
+        self.title = title
+        self.figsize = figsize
+        self.show_labels = show_labels
+        self.grid = grid
+        self._lines = {}
+        self._points = {}
+        self._labels = []
+
+    def add(self, shape, color='blue', linestyle='-', linewidth=1.0, label=None,
+            tolerance=None, bounds=(-10, 10)):
+        if isinstance(shape, Point):
+            return self.add_point(shape, color=color, label=label)
+        pts = tessellate(shape, tolerance, bounds=bounds)
+        pieces = self._lines.setdefault((color, linestyle, linewidth), [])
+        for piece in np.split(pts, np.flatnonzero(np.isnan(pts[:, 0]))):
+            piece = piece[~np.isnan(piece[:, 0])]
+            if len(piece) > 1:
+                pieces.append(piece)
+        if label and len(pts):
+            self._labels.append((pts[0, 0], pts[0, 1], label))
+        return self
+
+    def add_point(self, p, color='red', size=20, label=None):
+        self._points.setdefault((color, size), []).append(np.array([[p.x, p.y]], dtype=float))
+        if label:
+            self._labels.append((p.x + 0.2, p.y + 0.2, label))
+        return self
+
+    def add_points(self, xy, color='red', size=20):
+        """Adds an (N, 2) array or PointArray of unlabelled points."""
+        if hasattr(xy, 'to_xy'):
+            xy = xy.to_xy()
+        self._points.setdefault((color, size), []).append(np.asarray(xy, dtype=float).reshape(-1, 2))
+        return self
+
+    def add_circles(self, circles, color='blue', linestyle='-', linewidth=1.0, tolerance=None):
+        """
+        Adds many circles (a CircleArray or a sequence of Circles) at once by
+        scaling one shared polygon, sized for the largest radius.
+        """
+        if not isinstance(circles, CircleArray):
+            circles = CircleArray.from_circles(circles)
+        if len(circles) == 0:
+            return self
+        r_max = float(np.abs(circles.radius).max())
+        if tolerance is None:
+            tolerance = DEFAULT_RELATIVE_TOLERANCE * r_max
+        unit = tessellate(Circle(Point(0.0, 0.0), r_max), tolerance) / r_max
+        segments = (circles.radius[:, None, None] * unit
+                    + np.stack((circles.cx, circles.cy), axis=1)[:, None, :])
+        self._lines.setdefault((color, linestyle, linewidth), []).extend(segments)
+        return self
+
+    def add_segments(self, segments, color='blue', linestyle='-', linewidth=1.0):
+        """
+        Adds many segments at once, each drawn from p1 to p2 exactly (not
+        extended to any bounds): a sequence of Lines, a LineArray, or an
+        (N, 4) array of ``x1, y1, x2, y2`` rows (an (N, 2, 2) array works too).
+        """
+        coords = as_segments(segments)
+        self._lines.setdefault((color, linestyle, linewidth), []).extend(coords.reshape(-1, 2, 2))
+        return self
+
+    def figure(self, show_labels=None):
+        show_labels = self.show_labels if show_labels is None else show_labels
+        fig = Figure(figsize=self.figsize)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(1, 1, 1)
+        if self.title:
+            ax.set_title(self.title)
+        ax.grid(self.grid)
+        ax.set_aspect('equal')
+
+        for (color, linestyle, linewidth), pieces in self._lines.items():
+            ax.add_collection(LineCollection(pieces, colors=color, linestyles=linestyle,
+                                             linewidths=linewidth))
+        for (color, size), chunks in self._points.items():
+            xy = np.concatenate(chunks)
+            ax.scatter(xy[:, 0], xy[:, 1], c=color, s=size)
+        if show_labels:
+            for x, y, text in self._labels:
+                ax.text(x, y, text, fontsize=10)
+        ax.autoscale_view()
+        return fig
+
+    def render(self, path, dpi=100, show_labels=None, format=None):
+        """Writes the scene to ``path``; the format (png, svg, pdf, ...) follows the extension."""
+        fig = self.figure(show_labels=show_labels)
+        fig.savefig(path, dpi=dpi, format=format)
+        return path
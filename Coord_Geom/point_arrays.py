@@ -0,0 +1,174 @@
+import numpy as np
+from Coord_Geom.points import Point
+
+# Codes returned by PointArray.quadrant()
+AXIS = 0
+QUADRANT_I = 1
+QUADRANT_II = 2
+QUADRANT_III = 3
+QUADRANT_IV = 4
+
+
+def as_xy(obj):
+    """
+    Returns the (x, y) coordinates of a Point, PointArray, (x, y) pair or
+    (N, 2) array as float arrays (or floats) that broadcast against each other.
+    """
+    if isinstance(obj, PointArray):
+        return obj.x, obj.y
+    if hasattr(obj, 'x') and hasattr(obj, 'y'):
+        return float(obj.x), float(obj.y)
+    arr = np.asarray(obj, dtype=float)
+    if arr.shape[-1:] != (2,):
+        raise ValueError("Expected coordinates with a trailing dimension of 2, got shape {}".format(arr.shape))
+    return arr[..., 0], arr[..., 1]
+
+
+def as_coords(points):
+    """
+    Returns an (N, 2) float array from a Point, a sequence of Points, a
+    PointArray, a single (x, y) pair or an (N, 2) array-like of pairs. Any
+    other shape raises ValueError rather than being regrouped into pairs.
+    """
+    if isinstance(points, PointArray):
+        return points.to_xy()
+    if hasattr(points, 'x') and hasattr(points, 'y'):
+        return np.array([[points.x, points.y]], dtype=float)
+    if not isinstance(points, np.ndarray):
+        points = list(points)
+        if points and hasattr(points[0], 'x'):
+            return PointArray.from_points(points).to_xy()
+    arr = np.asarray(points, dtype=float)
+    if arr.shape == (0,) or arr.shape == (2,):
+        return arr.reshape(-1, 2)
+    if arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError("Expected an (N, 2) array of coordinates, got shape {}".format(arr.shape))
+    return arr
+
+
+class PointArray:
+    """
+    A column store of many points: contiguous float64 ``x`` and ``y`` arrays.
+    Every method mirrors the one on Point, but works on all points at once and
+    returns NumPy arrays (or a new PointArray) instead of Python objects.
+    """
+
+    def __init__(self, x, y):
+        self.x = np.ascontiguousarray(x, dtype=float)
+        self.y = np.ascontiguousarray(y, dtype=float)
+        if self.x.ndim != 1 or self.x.shape != self.y.shape:
+            raise ValueError("x and y must be 1-D arrays of the same length.")
+
+    @classmethod
+    def from_points(cls, points):
+        points = list(points)
+        x = np.fromiter((p.x for p in points), dtype=float, count=len(points))
+        y = np.fromiter((p.y for p in points), dtype=float, count=len(points))
+        return cls(x, y)
+
+    @classmethod
+    def from_xy(cls, xy):
+        """From an (N, 2) array-like of pairs; any other shape raises ValueError (see as_coords)."""
+        xy = as_coords(xy)
+        return cls(xy[:, 0], xy[:, 1])
+
+    def to_points(self):
+        return [Point(x, y) for x, y in zip(self.x.tolist(), self.y.tolist())]
+
+    def to_xy(self):
+        return np.column_stack((self.x, self.y))
+
+    def __len__(self):
+        return self.x.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Point(float(self.x[index]), float(self.y[index]))
+        return PointArray(self.x[index], self.y[index])
+
+    def __iter__(self):
+        return iter(self.to_points())
+
+    def __repr__(self):
+        return "PointArray(n={})".format(len(self))
+
+    def quadrant(self):
+        """
+        Returns an int8 array of quadrant codes: AXIS (0) for points on either
+        axis, otherwise QUADRANT_I .. QUADRANT_IV (1 .. 4).
+        """
+        codes = np.full(len(self), QUADRANT_IV, dtype=np.int8)
+        codes[(self.x > 0) & (self.y > 0)] = QUADRANT_I
+        codes[(self.x < 0) & (self.y > 0)] = QUADRANT_II
+        codes[(self.x < 0) & (self.y < 0)] = QUADRANT_III
+        codes[(self.x == 0) | (self.y == 0)] = AXIS
+        return codes
+
+    def distance_to(self, other):
+        ox, oy = as_xy(other)
+        return np.hypot(self.x - ox, self.y - oy)
+
+    def dist_origin(self):
+        return np.hypot(self.x, self.y)
+
+    def midpoint(self, other):
+        ox, oy = as_xy(other)
+        return PointArray((self.x + ox) / 2, (self.y + oy) / 2)
+
+    def collinear(self, other, next):
+        return self.determinant(other, next) == 0
+
+    def reflect_x(self):
+        return PointArray(self.x, -self.y)
+
+    def reflect_y(self):
+        return PointArray(-self.x, self.y)
+
+    def reflect_o(self):
+        return PointArray(-self.x, -self.y)
+
+    def angle_with(self, other):
+        """
+        Returns the angles in degrees between each point and ``other``
+        (a Point or PointArray), treating points as vectors from the origin.
+        """
+        ox, oy = as_xy(other)
+        dot = self.x * ox + self.y * oy
+        mags = np.hypot(self.x, self.y) * np.hypot(ox, oy)
+
+        if np.any(mags == 0):
+            raise ValueError("Cannot compute angle with a zero vector.")
+
+        cos_theta = np.clip(dot / mags, -1.0, 1.0)
+        return np.degrees(np.arccos(cos_theta))
+
+    def x_inclination(self):
+        return np.degrees(np.arctan2(self.y, self.x))
+
+    def y_inclination(self):
+        return np.degrees(np.arctan2(-self.x, self.y))
+
+    def determinant(self, other, next):
+        ox, oy = as_xy(other)
+        nx, ny = as_xy(next)
+        return (ox - self.x) * (ny - self.y) - (nx - self.x) * (oy - self.y)
+
+    def rotate(self, angle_deg, around_origin=True, center=None):
+        angle_rad = np.radians(angle_deg)
+        cos_a = np.cos(angle_rad)
+        sin_a = np.sin(angle_rad)
+        cx, cy = (0.0, 0.0)
+
+        if not around_origin and center is not None:
+            cx, cy = as_xy(center)
+
+        x_shifted = self.x - cx
+        y_shifted = self.y - cy
+
+        x_rot = x_shifted * cos_a - y_shifted * sin_a + cx
+        y_rot = x_shifted * sin_a + y_shifted * cos_a + cy
+
+        return PointArray(x_rot, y_rot)
+
+    def translate(self, dx, dy):
+        return PointArray(self.x + dx, self.y + dy)
@@ -0,0 +1,126 @@
+import numpy as np
+from Coord_Geom.point_arrays import as_coords
+from Coord_Geom.triangle_arrays import TriangleArray
+
+
+class TriangleGrid:
+    """
+    Uniform-grid point-location index over a fixed set of triangles.
+
+    Every triangle is registered in the grid cells its bounding box overlaps;
+    ``locate`` then only runs the Triangle.contains_point sign test against
+    the triangles of each query point's cell.
+
+    ``cells_per_triangle`` sets the grid resolution (about that many cells per
+    triangle in total); alternatively pass an explicit square ``cell_size``.
+    Larger grids mean fewer candidates per query but more cell entries for
+    big triangles.
+    """
+
+    def __init__(self, triangles, cells_per_triangle=1.0, cell_size=None):
+        if isinstance(triangles, TriangleArray):
+            coords = triangles.coords
+        elif isinstance(triangles, np.ndarray):
+            coords = np.asarray(triangles, dtype=float)
+            if coords.ndim == 2 and coords.shape[1] == 6:
+                coords = coords.reshape(-1, 3, 2)
+            if coords.ndim != 3 or coords.shape[1:] != (3, 2):
+                raise ValueError("Expected an (N, 3, 2) or (N, 6) array of triangles, got shape {}".format(
+                    coords.shape))
+        else:
+            coords = TriangleArray.from_triangles(triangles).coords
+        self.coords = coords
+        n = coords.shape[0]
+
+        lo = coords.min(axis=1)
+        hi = coords.max(axis=1)
+        self.origin = lo.min(axis=0) if n else np.zeros(2)
+        extent = (hi.max(axis=0) - self.origin) if n else np.ones(2)
+        extent = np.maximum(extent, np.finfo(float).tiny)
+
+        if cell_size is None:
+            cells = max(1.0, n * cells_per_triangle)
+            cell_size = np.sqrt(extent[0] * extent[1] / cells)
+            cell_size = max(cell_size, extent.max() / 4096, np.finfo(float).tiny)
+        self.cell_size = float(cell_size)
+        self.shape = tuple(int(s) for s in np.floor(extent / self.cell_size).astype(np.int64) + 1)
+
+        # Cell ranges covered by every bounding box
+        first = self._cell_index(lo)
+        last = self._cell_index(hi)
+        spans = last - first + 1
+        counts = spans[:, 0] * spans[:, 1]
+
+        tri = np.repeat(np.arange(n, dtype=np.intp), counts)
+        local = np.arange(tri.shape[0], dtype=np.intp) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = first[tri, 0] + local % spans[tri, 0]
+        cy = first[tri, 1] + local // spans[tri, 0]
+        cells = cy * self.shape[0] + cx
+
+        # Stable sort keeps triangle indices ascending within every cell
+        order = np.argsort(cells, kind='stable')
+        self.cell_triangles = tri[order]
+        self.cell_offsets = np.zeros(self.shape[0] * self.shape[1] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(cells, minlength=self.shape[0] * self.shape[1]), out=self.cell_offsets[1:])
+
+    def __len__(self):
+        return self.coords.shape[0]
+
+    def _cell_index(self, xy):
+        index = np.floor((xy - self.origin) / self.cell_size).astype(np.intp)
+        return np.clip(index, 0, np.array(self.shape) - 1)
+
+    def locate(self, points, chunk_size=1 << 18):
+        """
+        Index of a triangle containing each query point, or -1 for misses.
+
+        Points on a shared edge or vertex get the lowest containing index.
+        Queries are processed ``chunk_size`` points at a time to bound memory.
+        """
+        xy = as_coords(points)
+        result = np.full(xy.shape[0], -1, dtype=np.intp)
+        for start in range(0, xy.shape[0], chunk_size):
+            stop = start + chunk_size
+            result[start:stop] = self._locate_chunk(xy[start:stop])
+        return result
+
+    def _locate_chunk(self, xy):
+        result = np.full(xy.shape[0], -1, dtype=np.intp)
+        if len(self) == 0:
+            return result
+
+        upper = self.origin + np.array(self.shape) * self.cell_size
+        inside = np.all((xy >= self.origin) & (xy <= upper), axis=1)
+        query = np.flatnonzero(inside)
+        index = self._cell_index(xy[query])
+        cells = index[:, 1] * self.shape[0] + index[:, 0]
+
+        starts = self.cell_offsets[cells]
+        counts = self.cell_offsets[cells + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return result
+
+        # Expand (query, candidate triangle) pairs
+        pair_query = np.repeat(query, counts)
+        local = np.arange(total, dtype=np.intp) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_tri = self.cell_triangles[np.repeat(starts, counts) + local]
+
+        p = xy[pair_query]
+        tri = self.coords[pair_tri]
+        has_neg = np.zeros(total, dtype=bool)
+        has_pos = np.zeros(total, dtype=bool)
+        for i in range(3):
+            u = tri[:, i] - p
+            v = tri[:, (i + 1) % 3] - p
+            d = u[:, 0] * v[:, 1] - v[:, 0] * u[:, 1]
+            has_neg |= d < 0
+            has_pos |= d > 0
+        hit = ~(has_neg & has_pos)
+
+        # Pairs are grouped by query with ascending triangle index, so the
+        # first hit of every query is its lowest containing triangle
+        hit_query = pair_query[hit]
+        found, first = np.unique(hit_query, return_index=True)
+        result[found] = pair_tri[hit][first]
+        return result
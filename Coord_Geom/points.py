@@ -1,6 +1,8 @@
 import math
 
 class Point:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -24,27 +26,20 @@ class Point:
         return math.sqrt((self.x - 0) ** 2 + (self.y - 0) ** 2)
 
     def midpoint(self, other):
-        return Point((self.x + other.x)/2, (self.y + other.y)/2)
+        return type(self)((self.x + other.x)/2, (self.y + other.y)/2)
 
     def collinear(self, other, next):
-        dx1 = self.x - other.x
-        dx2 = self.x - next.x
-        dy1 = self.y - other.y
-        dy2 = self.y - next.y
-        if dx1 == 0 and dx2 == 0:
-            return True  # vertical line
-        if dx1 == 0 or dx2 == 0:
-            return False
-        return (dy1 / dx1) == (dy2 / dx2)
+        # Zero signed area; no slope division, so coincident points work too
+        return self.determinant(other, next) == 0
 
     def reflect_x(self):
-        return Point(self.x, -self.y)
+        return type(self)(self.x, -self.y)
 
     def reflect_y(self):
-        return Point(-self.x, self.y)
+        return type(self)(-self.x, self.y)
 
     def reflect_o(self):
-        return Point(-self.x, -self.y)
+        return type(self)(-self.x, -self.y)
 
     def angle_with(self, other):
         """
@@ -95,4 +90,4 @@ class Point:
         x_rot = x_shifted * cos_a - y_shifted * sin_a + cx
         y_rot = x_shifted * sin_a + y_shifted * cos_a + cy
 
-        return Point(x_rot, y_rot)
\ No newline at end of file
+        return type(self)(x_rot, y_rot)
\ No newline at end of file
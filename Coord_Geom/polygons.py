@@ -0,0 +1,164 @@
+import numpy as np
+from Coord_Geom.points import Point
+from Coord_Geom.point_arrays import as_coords
+
+
+class Polygon:
+    """
+    A simple polygon stored as one read-only (N, 2) float64 array of
+    vertices, in either winding order. A closing vertex equal to the first
+    one is dropped.
+
+    Area, centroid, perimeter and orientation are single vectorized passes
+    over the edges. ``contains_points`` uses a slab index built on first
+    use: the polygon's y range is cut into up to N horizontal bands and every
+    edge is listed under the bands it spans, so a query only tests the edges
+    of its own band. The index holds at most about 4N entries; a query costs
+    the number of edges in its band, which stays small unless horizontal
+    lines cross a large share of the edges.
+    """
+
+    def __init__(self, vertices):
+        coords = np.array(as_coords(vertices), dtype=float)
+        if coords.shape[0] > 1 and np.array_equal(coords[0], coords[-1]):
+            coords = coords[:-1]
+        if coords.shape[0] < 3:
+            raise ValueError("A polygon needs at least three vertices.")
+        coords.flags.writeable = False
+        self.coords = coords
+        self._bands = None
+
+    def __len__(self):
+        return self.coords.shape[0]
+
+    def __repr__(self):
+        return "Polygon(n={})".format(len(self))
+
+    def to_points(self):
+        return [Point(x, y) for x, y in self.coords.tolist()]
+
+    def _edges(self):
+        start = self.coords
+        end = np.roll(self.coords, -1, axis=0)
+        return start, end
+
+    def signed_area(self):
+        """Shoelace area: positive for counter-clockwise vertices, negative for clockwise."""
+        start, end = self._edges()
+        return float(np.sum(start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1]) / 2)
+
+    def area(self):
+        return abs(self.signed_area())
+
+    def perimeter(self):
+        start, end = self._edges()
+        return float(np.hypot(*(end - start).T).sum())
+
+    def orientation(self):
+        """'counterclockwise', 'clockwise' or 'degenerate' (zero area)."""
+        area = self.signed_area()
+        if area > 0:
+            return 'counterclockwise'
+        if area < 0:
+            return 'clockwise'
+        return 'degenerate'
+
+    def centroid(self):
+        """Area centroid ``(x, y)``; raises ValueError for a zero-area polygon."""
+        start, end = self._edges()
+        # Shift to the first vertex to keep the cross products small
+        origin = start[0]
+        start = start - origin
+        end = end - origin
+        cross = start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1]
+        area = cross.sum() / 2
+        if area == 0:
+            raise ValueError("Centroid of a zero-area polygon is undefined.")
+        cx = np.sum((start[:, 0] + end[:, 0]) * cross) / (6 * area)
+        cy = np.sum((start[:, 1] + end[:, 1]) * cross) / (6 * area)
+        return float(cx + origin[0]), float(cy + origin[1])
+
+    def _band_index(self):
+        """CSR index of edges per y band: (y range, band height, offsets, edges)."""
+        if self._bands is None:
+            start, end = self._edges()
+            ylo = np.minimum(start[:, 1], end[:, 1])
+            yhi = np.maximum(start[:, 1], end[:, 1])
+            y0, y1 = ylo.min(), yhi.max()
+            # As many bands as vertices, unless tall edges would push the
+            # index past about 4 entries per edge
+            height = max((y1 - y0) / len(self), (yhi - ylo).sum() / (3 * len(self)), np.finfo(float).tiny)
+            bands = int(min(np.ceil((y1 - y0) / height), len(self))) or 1
+
+            first = np.clip(np.floor((ylo - y0) / height).astype(np.intp), 0, bands - 1)
+            last = np.clip(np.floor((yhi - y0) / height).astype(np.intp), 0, bands - 1)
+            counts = last - first + 1
+            edge = np.repeat(np.arange(len(self), dtype=np.intp), counts)
+            local = np.arange(edge.shape[0], dtype=np.intp) - np.repeat(np.cumsum(counts) - counts, counts)
+            band = first[edge] + local
+
+            order = np.argsort(band, kind='stable')
+            offsets = np.zeros(bands + 1, dtype=np.intp)
+            np.cumsum(np.bincount(band, minlength=bands), out=offsets[1:])
+            self._bands = (y0, y1, height, offsets, edge[order])
+        return self._bands
+
+    def contains_points(self, points, chunk_size=1 << 22):
+        """
+        Boolean mask of the points inside the polygon or on its boundary
+        (like Triangle.contains_point). Uses even-odd crossing parity, so
+        self-intersecting polygons follow the even-odd rule. Queries are
+        processed in blocks of about ``chunk_size`` (point, edge) tests to
+        bound memory.
+        """
+        xy = as_coords(points)
+        y0, y1, height, offsets, band_edges = self._band_index()
+        bands = offsets.shape[0] - 1
+        result = np.zeros(xy.shape[0], dtype=bool)
+
+        query = np.flatnonzero((xy[:, 1] >= y0) & (xy[:, 1] <= y1))
+        band = np.clip(np.floor((xy[query, 1] - y0) / height).astype(np.intp), 0, bands - 1)
+        starts = offsets[band]
+        counts = offsets[band + 1] - starts
+
+        cumulative = np.cumsum(counts)
+        limit = cumulative[-1] if query.shape[0] else 0
+        block_ends = np.searchsorted(cumulative, np.arange(chunk_size, limit, chunk_size), side='right')
+        first = 0
+        for last in np.unique(np.append(block_ends, query.shape[0])).tolist():
+            if last > first:
+                block = slice(first, last)
+                result[query[block]] = self._contains_block(xy[query[block]], starts[block], counts[block])
+            first = last
+        return result
+
+    def _contains_block(self, xy, starts, counts):
+        total = int(counts.sum())
+        if total == 0:
+            return np.zeros(xy.shape[0], dtype=bool)
+        _, _, _, _, band_edges = self._band_index()
+
+        # Expand (query, candidate edge) pairs
+        pair_query = np.repeat(np.arange(xy.shape[0], dtype=np.intp), counts)
+        local = np.arange(total, dtype=np.intp) - np.repeat(np.cumsum(counts) - counts, counts)
+        edge = band_edges[np.repeat(starts, counts) + local]
+
+        start, end = self._edges()
+        ax, ay = start[edge, 0], start[edge, 1]
+        bx, by = end[edge, 0], end[edge, 1]
+        px, py = xy[pair_query, 0], xy[pair_query, 1]
+
+        # On the boundary: collinear with the edge and inside its bounding box
+        cross = (bx - ax) * (py - ay) - (px - ax) * (by - ay)
+        on_edge = ((cross == 0) & (np.minimum(ax, bx) <= px) & (px <= np.maximum(ax, bx))
+                   & (np.minimum(ay, by) <= py) & (py <= np.maximum(ay, by)))
+
+        # Half-open crossing rule for a ray towards +x
+        straddles = (ay > py) != (by > py)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_cross = ax + (py - ay) * (bx - ax) / (by - ay)
+        crossing = straddles & (px < x_cross)
+
+        parity = np.bincount(pair_query[crossing], minlength=xy.shape[0]) % 2 == 1
+        boundary = np.bincount(pair_query[on_edge], minlength=xy.shape[0]) > 0
+        return parity | boundary
@@ -0,0 +1,42 @@
+from fractions import Fraction
+
+# Relative error bounds of the floating point sign tests below; anything
+# closer to zero than this is decided again in exact rational arithmetic
+ERRBOUND = 4e-15
+INCIRCLE_ERRBOUND = 1e-14
+
+
+def sign(value):
+    return (value > 0) - (value < 0)
+
+
+def orient(ax, ay, bx, by, cx, cy):
+    """Sign of the turn a -> b -> c: 1 left, -1 right, 0 collinear."""
+    left = (bx - ax) * (cy - ay)
+    right = (by - ay) * (cx - ax)
+    det = left - right
+    if abs(det) > ERRBOUND * (abs(left) + abs(right)):
+        return sign(det)
+    F = Fraction
+    return sign((F(bx) - F(ax)) * (F(cy) - F(ay)) - (F(by) - F(ay)) * (F(cx) - F(ax)))
+
+
+def incircle(ax, ay, bx, by, cx, cy, dx, dy):
+    """Sign of the incircle determinant: 1 when d is inside circle abc (abc counter-clockwise)."""
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    alift, blift, clift = adx * adx + ady * ady, bdx * bdx + bdy * bdy, cdx * cdx + cdy * cdy
+    det = (alift * (bdx * cdy - cdx * bdy) + blift * (cdx * ady - adx * cdy)
+           + clift * (adx * bdy - bdx * ady))
+    permanent = (alift * (abs(bdx * cdy) + abs(cdx * bdy)) + blift * (abs(cdx * ady) + abs(adx * cdy))
+                 + clift * (abs(adx * bdy) + abs(bdx * ady)))
+    if abs(det) > INCIRCLE_ERRBOUND * permanent:
+        return sign(det)
+    F = Fraction
+    adx, ady = F(ax) - F(dx), F(ay) - F(dy)
+    bdx, bdy = F(bx) - F(dx), F(by) - F(dy)
+    cdx, cdy = F(cx) - F(dx), F(cy) - F(dy)
+    return sign((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+                + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+                + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
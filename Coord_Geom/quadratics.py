@@ -0,0 +1,88 @@
+import math
+
+# All solvers use the cancellation-free form of the quadratic formula:
+#     q = -(b + sign(b) * sqrt(b^2 - 4ac)) / 2,   roots q / a and c / q
+# which never subtracts two nearly equal numbers, so the small root keeps
+# full precision even when b^2 >> 4ac.
+
+
+def quadratic_roots(a, b, c):
+    """
+    Both roots of a x^2 + b x + c = 0 (a != 0) as ``(r_plus, r_minus)``, the
+    roots taking +sqrt and -sqrt in the textbook formula. A double root is
+    returned twice; a negative discriminant gives a complex conjugate pair.
+    """
+    discriminant = b ** 2 - 4 * a * c
+    if discriminant > 0:
+        q = -0.5 * (b + math.copysign(math.sqrt(discriminant), b))
+        if math.copysign(1.0, b) > 0:
+            return c / q, q / a
+        return q / a, c / q
+    elif discriminant == 0:
+        r = -b / (2 * a)
+        return r, r
+    else:
+        real = -b / (2 * a)
+        imag = math.sqrt(-discriminant) / (2 * a)
+        return complex(real, imag), complex(real, -imag)
+
+
+def real_roots(a, b, c, tol=0.0):
+    """
+    The distinct real roots of a x^2 + b x + c = 0 in ascending order, as a
+    tuple of 0, 1 or 2 floats. ``a`` may be zero (a linear equation). A
+    discriminant within ``tol * b^2`` of zero counts as a double root.
+    """
+    if a == 0:
+        return (-c / b,) if b != 0 else ()
+    discriminant = b ** 2 - 4 * a * c
+    if abs(discriminant) <= tol * b ** 2:
+        return (-b / (2 * a),)
+    if discriminant < 0:
+        return ()
+    q = -0.5 * (b + math.copysign(math.sqrt(discriminant), b))
+    r1, r2 = q / a, c / q
+    return (r1, r2) if r1 < r2 else (r2, r1)
+
+
+def solve_quadratics(a, b, c, tol=0.0, complex_roots=False):
+    """
+    Batched real_roots over arrays of coefficients (broadcast together).
+
+    Returns ``(roots, counts)``: ``roots`` has the broadcast shape plus a
+    trailing axis of 2 holding the real roots in ascending order (NaN where
+    unused) and ``counts`` the number of real roots, 0, 1 or 2.
+
+    With ``complex_roots=True``, ``roots`` is complex instead and equations
+    with a negative discriminant get their conjugate pair, ordered as in
+    quadratic_roots; ``counts`` still counts real roots only.
+    """
+    import numpy as np
+
+    a, b, c = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, c)))
+    discriminant = b ** 2 - 4 * a * c
+
+    quadratic = a != 0
+    double = quadratic & (np.abs(discriminant) <= tol * b ** 2)
+    two = quadratic & (discriminant > 0) & ~double
+    linear = ~quadratic & (b != 0)
+
+    roots = np.full(a.shape + (2,), np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        q = -0.5 * (b + np.copysign(np.sqrt(discriminant), b))
+        r1 = q / a
+        r2 = c / q
+        roots[two, 0] = np.minimum(r1, r2)[two]
+        roots[two, 1] = np.maximum(r1, r2)[two]
+        roots[double, 0] = (-b / (2 * a))[double]
+        roots[linear, 0] = (-c / b)[linear]
+    counts = (2 * two + double + linear).astype(np.int8)
+
+    if complex_roots:
+        roots = roots.astype(complex)
+        pair = quadratic & (discriminant < 0) & ~double
+        real = -b[pair] / (2 * a[pair])
+        imag = np.sqrt(-discriminant[pair]) / (2 * a[pair])
+        roots[pair, 0] = real + 1j * imag
+        roots[pair, 1] = real - 1j * imag
+    return roots, counts
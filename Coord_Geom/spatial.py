@@ -0,0 +1,65 @@
+import numpy as np
+from Coord_Geom.point_arrays import as_coords
+
+
+class KDTree:
+    """
+    Static 2-D spatial index over a fixed set of points.
+
+    Built once from a list of Points, a PointArray or an (N, 2) array; every
+    query takes a batch of query points and returns index arrays into the
+    original point order. The tree itself is scipy's compiled cKDTree.
+    """
+
+    def __init__(self, points, leafsize=16):
+        from scipy.spatial import cKDTree
+
+        self.data = as_coords(points)
+        self._tree = cKDTree(self.data, leafsize=leafsize, balanced_tree=False, compact_nodes=False)
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def query(self, points, k=1, max_distance=np.inf, workers=1):
+        """
+        k nearest neighbours of every query point.
+
+        Returns ``(distances, indices)``, both of shape (M, k) and sorted by
+        distance. Missing neighbours (fewer than k points, or none within
+        ``max_distance``) have distance ``inf`` and index ``len(self)``.
+        """
+        queries = as_coords(points)
+        distances, indices = self._tree.query(queries, k=[i + 1 for i in range(k)],
+                                              distance_upper_bound=max_distance, workers=workers)
+        return distances, indices
+
+    def query_radius(self, points, r, workers=1):
+        """
+        All indexed points within distance ``r`` of every query point.
+
+        Returns ``(offsets, indices)`` in compressed form: the neighbours of
+        query ``i`` are ``indices[offsets[i]:offsets[i + 1]]``, in ascending
+        index order. ``r`` may be a scalar or one radius per query.
+        """
+        queries = as_coords(points)
+        neighbours = self._tree.query_ball_point(queries, r, workers=workers, return_sorted=True)
+        counts = np.fromiter((len(n) for n in neighbours), dtype=np.intp, count=len(neighbours))
+        offsets = np.zeros(len(neighbours) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+        if offsets[-1] == 0:
+            return offsets, np.empty(0, dtype=np.intp)
+        indices = np.concatenate([np.asarray(n, dtype=np.intp) for n in neighbours])
+        return offsets, indices
+
+    def query_pairs(self, r):
+        """
+        All pairs of indexed points within distance ``r`` of each other.
+
+        Returns a (K, 2) int array of ``(i, j)`` rows with ``i < j``, sorted
+        lexicographically.
+        """
+        pairs = self._tree.query_pairs(r, output_type='ndarray')
+        if len(pairs) == 0:
+            return np.empty((0, 2), dtype=np.intp)
+        order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+        return pairs[order].astype(np.intp, copy=False)
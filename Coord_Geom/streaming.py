@@ -0,0 +1,238 @@
+import itertools
+import time
+from collections import namedtuple
+
+import numpy as np
+from Coord_Geom.point_arrays import PointArray, as_coords
+from Coord_Geom.line_arrays import LineArray
+from Coord_Geom.circle_arrays import CircleArray
+
+StageStats = namedtuple('StageStats', ['name', 'rows', 'seconds', 'rows_per_second'])
+
+
+def read_csv(path, chunk_size=1 << 20, usecols=(0, 1), delimiter=',', skiprows=0):
+    """
+    Yields (N, 2) float arrays of at most ``chunk_size`` rows from a text file,
+    taking x and y from the columns ``usecols``. Blank lines are skipped.
+    Only one chunk of lines is held in memory at a time.
+    """
+    with open(path) as f:
+        lines = (line for line in itertools.islice(f, skiprows, None) if line.strip())
+        while True:
+            block = list(itertools.islice(lines, chunk_size))
+            if not block:
+                return
+            yield np.loadtxt(block, delimiter=delimiter, usecols=usecols, ndmin=2)
+
+
+def read_binary(path, chunk_size=1 << 20, dtype='<f8'):
+    """
+    Yields (N, 2) float arrays of at most ``chunk_size`` rows from a raw file
+    of interleaved x, y values of type ``dtype`` (no header).
+    """
+    with open(path, 'rb') as f:
+        while True:
+            values = np.fromfile(f, dtype=dtype, count=2 * chunk_size)
+            if values.shape[0] == 0:
+                return
+            if values.shape[0] % 2:
+                raise ValueError("{} holds an odd number of values; expected x, y pairs".format(path))
+            yield values.astype(float).reshape(-1, 2)
+
+
+def read_array(xy, chunk_size=1 << 20):
+    """Yields ``chunk_size``-row slices of an (N, 2) array, e.g. one opened with np.load(mmap_mode='r')."""
+    for start in range(0, xy.shape[0], chunk_size):
+        yield np.asarray(xy[start:start + chunk_size], dtype=float)
+
+
+class CSVWriter:
+    """Appends each chunk to a delimited text file; the header row lists the column names."""
+
+    def __init__(self, path, delimiter=',', header=True, precision=17):
+        self.path = path
+        self.delimiter = delimiter
+        self.header = header
+        self.precision = precision
+        self._file = None
+
+    def write(self, names, columns):
+        if self._file is None:
+            self._file = open(self.path, 'w')
+            if self.header:
+                self._file.write(self.delimiter.join(names) + '\n')
+        formats = ['%d' if np.issubdtype(c.dtype, np.integer) else '%.{}g'.format(self.precision)
+                   for c in columns]
+        # One % over the whole chunk: same text as np.savetxt, without its per-row loop
+        block = np.column_stack(columns)
+        row = self.delimiter.join(formats) + '\n'
+        self._file.write((row * block.shape[0]) % tuple(block.ravel().tolist()))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class BinaryWriter:
+    """
+    Appends each chunk to a raw file as interleaved rows of ``dtype`` values,
+    one value per column (integer codes are stored as that dtype too).
+    """
+
+    def __init__(self, path, dtype='<f8'):
+        self.path = path
+        self.dtype = dtype
+        self._file = None
+
+    def write(self, names, columns):
+        if self._file is None:
+            self._file = open(self.path, 'wb')
+        np.column_stack(columns).astype(self.dtype).tofile(self._file)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class StreamReport:
+    """Rows and wall time per stage of a Pipeline run, including reading and writing."""
+
+    def __init__(self):
+        self._stats = {}
+
+    def _add(self, name, rows, seconds):
+        total_rows, total_seconds = self._stats.get(name, (0, 0.0))
+        self._stats[name] = (total_rows + rows, total_seconds + seconds)
+
+    def rows(self):
+        """StageStats rows in pipeline order."""
+        return [StageStats(name, rows, seconds, rows / seconds if seconds else float('inf'))
+                for name, (rows, seconds) in self._stats.items()]
+
+    def __getitem__(self, name):
+        rows, seconds = self._stats[name]
+        return StageStats(name, rows, seconds, rows / seconds if seconds else float('inf'))
+
+    def __str__(self):
+        lines = ["{:<30} {:>14} {:>12} {:>14}".format('stage', 'rows', 'seconds', 'rows/s')]
+        for row in self.rows():
+            lines.append("{:<30} {:>14} {:>12.3f} {:>14.0f}".format(
+                row.name, row.rows, row.seconds, row.rows_per_second))
+        return "\n".join(lines)
+
+
+class Pipeline:
+    """
+    A chain of point operations applied chunk by chunk to a stream of
+    coordinates, so inputs far larger than memory can be processed.
+
+    Transform stages (``rotate``, ``reflect_x``, ``reflect_y``,
+    ``reflect_o``, ``translate``) replace the points with the PointArray
+    result; measure stages (``distance_to_line``, ``in_circle``) add a named
+    output column computed on the points as they are at that step. Stage
+    methods return the pipeline, so calls chain.
+
+    The source is any iterable of (N, 2) chunks, such as ``read_csv``,
+    ``read_binary`` or ``read_array``. ``run`` writes every processed chunk
+    (columns ``x``, ``y``, then the measures in order) before reading the
+    next, so memory stays at a few chunks whatever the input size.
+    """
+
+    def __init__(self):
+        self._stages = []
+        self._columns = []
+
+    def _transform(self, name, func):
+        self._stages.append((name, None, func))
+        return self
+
+    def _measure(self, name, column, func):
+        if column in ('x', 'y') or column in self._columns:
+            raise ValueError("Duplicate output column {!r}".format(column))
+        self._columns.append(column)
+        self._stages.append((name, column, func))
+        return self
+
+    @property
+    def columns(self):
+        """Output column names."""
+        return ['x', 'y'] + self._columns
+
+    def rotate(self, angle_deg, around_origin=True, center=None):
+        return self._transform('rotate', lambda p: p.rotate(angle_deg, around_origin, center))
+
+    def reflect_x(self):
+        return self._transform('reflect_x', PointArray.reflect_x)
+
+    def reflect_y(self):
+        return self._transform('reflect_y', PointArray.reflect_y)
+
+    def reflect_o(self):
+        return self._transform('reflect_o', PointArray.reflect_o)
+
+    def translate(self, dx, dy):
+        return self._transform('translate', lambda p: p.translate(dx, dy))
+
+    def distance_to_line(self, line, column='distance'):
+        """Perpendicular distance from each point to ``line``."""
+        lines = LineArray.from_lines([line])
+        return self._measure('distance_to_line', column, lines.distance_from_points)
+
+    def in_circle(self, circle, column='in_circle', tol=0.0):
+        """Containment code against ``circle``: INSIDE (-1), ON (0) or OUTSIDE (1), as CircleArray.contains_points."""
+        circles = CircleArray.from_circles([circle])
+        return self._measure('in_circle', column, lambda p: circles.contains_points(p, tol))
+
+    def chunks(self, source, report=None):
+        """
+        Yields ``(points, columns)`` per input chunk: the transformed
+        PointArray and a dict of measure arrays. Stage times are added to
+        ``report`` when given. A chunk that is not an (N, 2) array raises
+        ValueError (see as_coords).
+        """
+        source = iter(source)
+        while True:
+            start = time.perf_counter()
+            xy = next(source, None)
+            if xy is None:
+                return
+            xy = as_coords(xy)
+            if report is not None:
+                report._add('read', xy.shape[0], time.perf_counter() - start)
+
+            points = PointArray(xy[:, 0], xy[:, 1])
+            columns = {}
+            for position, (name, column, func) in enumerate(self._stages):
+                start = time.perf_counter()
+                if column is None:
+                    points = func(points)
+                else:
+                    columns[column] = func(points)
+                if report is not None:
+                    report._add('{} {}'.format(position + 1, name), len(points), time.perf_counter() - start)
+            yield points, columns
+
+    def run(self, source, writer=None):
+        """
+        Processes the whole source, passing each chunk to ``writer`` (a
+        CSVWriter, BinaryWriter or any object with ``write(names, columns)``
+        and ``close()``), and returns a StreamReport.
+        """
+        report = StreamReport()
+        names = self.columns
+        start = time.perf_counter()
+        total = 0
+        try:
+            for points, columns in self.chunks(source, report):
+                total += len(points)
+                if writer is not None:
+                    begin = time.perf_counter()
+                    writer.write(names, [points.x, points.y] + [columns[c] for c in self._columns])
+                    report._add('write', len(points), time.perf_counter() - begin)
+        finally:
+            if writer is not None:
+                writer.close()
+        report._add('total', total, time.perf_counter() - start)
+        return report
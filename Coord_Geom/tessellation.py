@@ -0,0 +1,200 @@
+import functools
+import math
+
+import numpy as np
+from Coord_Geom.lines import Line
+from Coord_Geom.triangles import Triangle
+from Coord_Geom.circles import Circle
+from Coord_Geom.parabolas import Parabola
+from Coord_Geom.ellipses import Ellipse
+from Coord_Geom.hyperbolas import Hyperbola
+
+# Default chord error, relative to the size of the shape (or of the bounds)
+DEFAULT_RELATIVE_TOLERANCE = 1e-3
+MIN_SEGMENTS = 8
+MAX_SEGMENTS = 1 << 16
+CACHE_SIZE = 1024
+
+# Resolution of the grid used to integrate the vertex density
+_DENSITY_SAMPLES = 257
+
+
+def tessellate(shape, tolerance=None, bounds=(-10, 10)):
+    """
+    Turns a Line, Triangle, Circle, Parabola, Ellipse or Hyperbola into an
+    (N, 2) polyline whose chords stay within ``tolerance`` of the true curve.
+
+    Vertices are spread by curvature: a curve r(t) gets about
+    sqrt(|r' x r''| / (8 * tolerance * |r'|)) vertices per unit of its
+    parameter, so flat stretches get few points and tight bends many. Pieces
+    (hyperbola branches) are separated by a row of NaN, which matplotlib
+    draws as a gap.
+
+    ``bounds`` is the x range for lines, vertical parabolas and horizontal
+    hyperbolas, and the y range for horizontal parabolas and vertical
+    hyperbolas. A vertical line has no x extent, so it spans ``bounds`` in y
+    instead (plot_line draws vertical lines with axvline, unbounded). Lines
+    and triangles are exact and ignore ``tolerance``; a zero-size shape or
+    zero-width ``bounds`` gives a degenerate polyline rather than an error.
+    Results are cached by shape parameters, tolerance and bounds (see
+    clear_cache) and are returned read-only.
+    """
+    key = _shape_key(shape, bounds)
+    if key[0] in ('line', 'triangle'):
+        return _cached_tessellation(key, 0.0)
+    if tolerance is None:
+        # Any positive tolerance will do when the shape collapses to a point
+        tolerance = DEFAULT_RELATIVE_TOLERANCE * _shape_size(key) or 1.0
+    if tolerance <= 0:
+        raise ValueError("tolerance must be positive")
+    return _cached_tessellation(key, float(tolerance))
+
+
+def pixel_tolerance(ax=None, pixels=0.5):
+    """Data-space length of ``pixels`` screen pixels on the given (or current) axes."""
+    if ax is None:
+        import matplotlib.pyplot as plt
+        ax = plt.gca()
+    width, height = ax.get_window_extent().size
+    x0, x1 = ax.get_xlim()
+    y0, y1 = ax.get_ylim()
+    return pixels * min(abs(x1 - x0) / width, abs(y1 - y0) / height)
+
+
+def clear_cache():
+    _cached_tessellation.cache_clear()
+
+
+def cache_info():
+    return _cached_tessellation.cache_info()
+
+
+def _shape_key(shape, bounds):
+    lo, hi = float(min(bounds)), float(max(bounds))
+    if isinstance(shape, Circle):
+        return ('circle', shape.center.x, shape.center.y, shape.radius)
+    if isinstance(shape, Ellipse):
+        return ('ellipse', shape.a, shape.b, shape.h, shape.k, shape.orientation)
+    if isinstance(shape, Parabola):
+        return ('parabola', shape.a, shape.b, shape.c, shape.orientation, lo, hi)
+    if isinstance(shape, Hyperbola):
+        return ('hyperbola', shape.a, shape.b, shape.h, shape.k, shape.orientation, lo, hi)
+    if isinstance(shape, Line):
+        return ('line', shape.p1.x, shape.p1.y, shape.p2.x, shape.p2.y, lo, hi)
+    if isinstance(shape, Triangle):
+        return ('triangle', shape.a.x, shape.a.y, shape.b.x, shape.b.y, shape.c.x, shape.c.y)
+    raise TypeError("Cannot tessellate object of type {}".format(type(shape).__name__))
+
+
+def _shape_size(key):
+    kind = key[0]
+    if kind == 'circle':
+        return abs(key[3])
+    if kind == 'ellipse':
+        return max(abs(key[1]), abs(key[2]))
+    return key[-1] - key[-2]
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _cached_tessellation(key, tolerance):
+    kind = key[0]
+    if kind == 'circle':
+        pts = _circle(key, tolerance)
+    elif kind == 'ellipse':
+        pts = _ellipse(key, tolerance)
+    elif kind == 'parabola':
+        pts = _parabola(key, tolerance)
+    elif kind == 'hyperbola':
+        pts = _hyperbola(key, tolerance)
+    elif kind == 'line':
+        pts = _line(key)
+    else:
+        _, ax, ay, bx, by, cx, cy = key
+        pts = np.array([[ax, ay], [bx, by], [cx, cy], [ax, ay]], dtype=float)
+    pts.flags.writeable = False
+    return pts
+
+
+def _parameters(lo, hi, bend, tolerance, min_segments=1):
+    """
+    Parameter values on [lo, hi] for a curve whose ``bend(t)`` is
+    |r' x r''| / |r'|; vertex density is sqrt(bend / (8 * tolerance)).
+    """
+    fine = np.linspace(lo, hi, _DENSITY_SAMPLES)
+    density = np.sqrt(np.abs(bend(fine)) / (8 * tolerance))
+    cumulative = np.concatenate(([0.0], np.cumsum((density[1:] + density[:-1]) / 2 * np.diff(fine))))
+    segments = int(min(max(math.ceil(cumulative[-1]), min_segments), MAX_SEGMENTS))
+    if cumulative[-1] == 0:
+        return np.linspace(lo, hi, segments + 1)
+    return np.interp(np.linspace(0, cumulative[-1], segments + 1), cumulative, fine)
+
+
+def _circle(key, tolerance):
+    _, cx, cy, r = key
+    t = _parameters(0.0, 2 * math.pi, lambda t: np.full_like(t, r), tolerance, MIN_SEGMENTS)
+    return np.column_stack((cx + r * np.cos(t), cy + r * np.sin(t)))
+
+
+def _ellipse(key, tolerance):
+    _, a, b, h, k, orientation = key
+    ex, ey = (a, b) if orientation == 'h' else (b, a)
+
+    def bend(t):
+        return ex * ey / np.hypot(ex * np.sin(t), ey * np.cos(t))
+
+    t = _parameters(0.0, 2 * math.pi, bend, tolerance, MIN_SEGMENTS)
+    return np.column_stack((h + ex * np.cos(t), k + ey * np.sin(t)))
+
+
+def _parabola(key, tolerance):
+    _, a, b, c, orientation, lo, hi = key
+
+    def bend(t):
+        return 2 * a / np.sqrt(1 + (2 * a * t + b) ** 2)
+
+    t = _parameters(lo, hi, bend, tolerance)
+    value = a * t ** 2 + b * t + c
+    if orientation == 'v':
+        return np.column_stack((t, value))
+    return np.column_stack((value, t))
+
+
+def _hyperbola(key, tolerance):
+    _, a, b, h, k, orientation, lo, hi = key
+    # Work in (u, v): u along the transverse axis, where ``bounds`` apply
+    center_u, center_v = (h, k) if orientation == 'h' else (k, h)
+
+    def bend(s):
+        return a * b / np.hypot(a * np.sinh(s), b * np.cosh(s))
+
+    pieces = []
+    for sign in (1.0, -1.0):
+        # Range of a cosh(s) = sign * (u - center_u) inside [lo, hi]
+        near, far = sorted((sign * (lo - center_u), sign * (hi - center_u)))
+        if far < a:
+            continue
+        s_max = math.acosh(far / a)
+        s_min = math.acosh(max(near / a, 1.0))
+        ranges = [(-s_max, s_max)] if s_min == 0 else [(-s_max, -s_min), (s_min, s_max)]
+        for s_lo, s_hi in ranges:
+            s = _parameters(s_lo, s_hi, bend, tolerance)
+            u = center_u + sign * a * np.cosh(s)
+            v = center_v + b * np.sinh(s)
+            pieces.append(np.column_stack((u, v) if orientation == 'h' else (v, u)))
+
+    if not pieces:
+        return np.empty((0, 2))
+    gap = np.full((1, 2), np.nan)
+    joined = [pieces[0]]
+    for piece in pieces[1:]:
+        joined.extend((gap, piece))
+    return np.concatenate(joined)
+
+
+def _line(key):
+    _, x1, y1, x2, y2, lo, hi = key
+    if x1 == x2:
+        return np.array([[x1, lo], [x1, hi]], dtype=float)
+    m = (y2 - y1) / (x2 - x1)
+    c = y1 - m * x1
+    return np.array([[lo, m * lo + c], [hi, m * hi + c]], dtype=float)
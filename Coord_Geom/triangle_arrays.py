@@ -0,0 +1,190 @@
+import enum
+
+import numpy as np
+from Coord_Geom.points import Point
+from Coord_Geom.triangles import Triangle
+
+
+class SideType(enum.IntEnum):
+    EQUILATERAL = 0
+    ISOSCELES = 1
+    SCALENE = 2
+
+
+class AngleType(enum.IntEnum):
+    DEGENERATE = -1
+    ACUTE = 0
+    RIGHT = 1
+    OBTUSE = 2
+
+
+class TriangleArray:
+    """
+    Many triangles stored as one read-only (N, 3, 2) float64 buffer of
+    vertices ``a``, ``b``, ``c``.
+
+    Every Triangle metric is available in batch, with the same ordering
+    conventions (side lengths are ``ab, bc, ca``; angles, heights and medians
+    follow that order). Instead of printing on collinear input, the
+    ``degenerate`` mask flags triangles whose area is at most ``tol`` times
+    their longest side squared; their metrics that need a non-zero area are
+    NaN and ``type_by_angles`` gives them AngleType.DEGENERATE. Slices keep
+    the array's ``tol``.
+    """
+
+    def __init__(self, coords, tol=0.0):
+        coords = np.array(coords, dtype=float)
+        if coords.ndim != 3 or coords.shape[1:] != (3, 2):
+            raise ValueError("Expected an (N, 3, 2) array of vertices, got shape {}".format(coords.shape))
+        coords.flags.writeable = False
+        self.coords = coords
+        self.tol = tol
+        self._sides = None
+
+        cross = self._cross()
+        longest = self.side_lengths().max(axis=1)
+        self.degenerate = np.abs(cross) <= tol * longest ** 2
+
+    @classmethod
+    def from_triangles(cls, triangles, tol=0.0):
+        triangles = list(triangles)
+        coords = np.array([[[t.a.x, t.a.y], [t.b.x, t.b.y], [t.c.x, t.c.y]] for t in triangles],
+                          dtype=float).reshape(-1, 3, 2)
+        return cls(coords, tol=tol)
+
+    @classmethod
+    def from_vertices(cls, a, b, c, tol=0.0):
+        return cls(np.stack([np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                             np.asarray(c, dtype=float)], axis=1), tol=tol)
+
+    def to_triangles(self):
+        """Returns a list of Triangle objects, with None for degenerate rows."""
+        triangles = []
+        for ((ax, ay), (bx, by), (cx, cy)), degenerate in zip(self.coords.tolist(), self.degenerate.tolist()):
+            if degenerate:
+                triangles.append(None)
+            else:
+                triangles.append(Triangle(Point(ax, ay), Point(bx, by), Point(cx, cy)))
+        return triangles
+
+    def __len__(self):
+        return self.coords.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            (ax, ay), (bx, by), (cx, cy) = self.coords[index].tolist()
+            return Triangle(Point(ax, ay), Point(bx, by), Point(cx, cy))
+        return TriangleArray(self.coords[index], tol=self.tol)
+
+    def __repr__(self):
+        return "TriangleArray(n={})".format(len(self))
+
+    @property
+    def a(self):
+        return self.coords[:, 0]
+
+    @property
+    def b(self):
+        return self.coords[:, 1]
+
+    @property
+    def c(self):
+        return self.coords[:, 2]
+
+    def _cross(self):
+        ab = self.b - self.a
+        ac = self.c - self.a
+        return ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]
+
+    def _nan_degenerate(self, values):
+        values[self.degenerate] = np.nan
+        return values
+
+    def side_lengths(self):
+        if self._sides is None:
+            edges = np.roll(self.coords, -1, axis=1) - self.coords
+            sides = np.hypot(edges[..., 0], edges[..., 1])
+            sides.flags.writeable = False
+            self._sides = sides
+        return self._sides
+
+    def angles(self):
+        sides = self.side_lengths()
+        a, b, c = sides[:, 0], sides[:, 1], sides[:, 2]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cos_a = np.clip((b ** 2 + c ** 2 - a ** 2) / (2 * b * c), -1.0, 1.0)
+            cos_b = np.clip((a ** 2 + c ** 2 - b ** 2) / (2 * a * c), -1.0, 1.0)
+        ang_a = np.degrees(np.arccos(cos_a))
+        ang_b = np.degrees(np.arccos(cos_b))
+        angles = np.column_stack((ang_a, ang_b, 180.0 - ang_a - ang_b))
+        return self._nan_degenerate(angles)
+
+    def perimeter(self):
+        return self.side_lengths().sum(axis=1)
+
+    def area(self):
+        return np.abs(self._cross()) / 2
+
+    def heights(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            heights = (2 * self.area())[:, None] / self.side_lengths()
+        return self._nan_degenerate(heights)
+
+    def medians(self):
+        sq = self.side_lengths() ** 2
+        total = sq.sum(axis=1)[:, None]
+        return 0.5 * np.sqrt(np.maximum(2 * total - 3 * sq, 0.0))
+
+    def centroid(self):
+        return self.coords.mean(axis=1)
+
+    def incenter(self):
+        # Each vertex is weighted by the length of the side opposite it
+        sides = self.side_lengths()
+        opposite = sides[:, [1, 2, 0]]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            centers = (opposite[:, :, None] * self.coords).sum(axis=1) / sides.sum(axis=1)[:, None]
+        return self._nan_degenerate(centers)
+
+    def inradius(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            radii = self.area() / (self.perimeter() / 2)
+        return self._nan_degenerate(radii)
+
+    def circumcenter(self):
+        ab = self.b - self.a
+        ac = self.c - self.a
+        ab_sq = (ab ** 2).sum(axis=1)
+        ac_sq = (ac ** 2).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            d = 2 * self._cross()
+            ux = (ac[:, 1] * ab_sq - ab[:, 1] * ac_sq) / d
+            uy = (ab[:, 0] * ac_sq - ac[:, 0] * ab_sq) / d
+        centers = self.a + np.column_stack((ux, uy))
+        return self._nan_degenerate(centers)
+
+    def circumradius(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            radii = self.side_lengths().prod(axis=1) / (4 * self.area())
+        return self._nan_degenerate(radii)
+
+    def orthocenter(self):
+        # Euler line: H = A + B + C - 2 O
+        return self.coords.sum(axis=1) - 2 * self.circumcenter()
+
+    def type_by_sides(self, rel_tol=1e-9):
+        sides = self.side_lengths()
+        equal = np.isclose(sides, np.roll(sides, -1, axis=1), rtol=rel_tol, atol=0.0)
+        types = np.full(len(self), SideType.SCALENE, dtype=np.int8)
+        types[equal.any(axis=1)] = SideType.ISOSCELES
+        types[equal.all(axis=1)] = SideType.EQUILATERAL
+        return types
+
+    def type_by_angles(self, abs_tol=1e-5):
+        """AngleType codes per triangle; degenerate rows are AngleType.DEGENERATE (-1)."""
+        max_angle = self.angles().max(axis=1)
+        types = np.full(len(self), AngleType.ACUTE, dtype=np.int8)
+        types[max_angle > 90.0] = AngleType.OBTUSE
+        types[np.abs(max_angle - 90.0) <= abs_tol] = AngleType.RIGHT
+        types[self.degenerate] = AngleType.DEGENERATE
+        return types
@@ -1,6 +1,7 @@
 import math
 from Coord_Geom.points import Point
 from Coord_Geom.lines import Line
+from Coord_Geom.caching import cached_method
 
 class Triangle:
     def __init__(self, v1 : Point, v2 : Point, v3 : Point):
@@ -12,12 +13,17 @@ class Triangle:
         self.b = v2
         self.c = v3
 
+    def _cache_key(self):
+        return self.a.x, self.a.y, self.b.x, self.b.y, self.c.x, self.c.y
+
+    @cached_method
     def side_lengths(self):
         ab = math.hypot(self.a.x - self.b.x, self.a.y - self.b.y)
         bc = math.hypot(self.b.x - self.c.x, self.b.y - self.c.y)
         ca = math.hypot(self.c.x - self.a.x, self.c.y - self.a.y)
         return ab, bc, ca
 
+    @cached_method
     def angles(self):
         a, b, c = self.side_lengths()
         ang_a = math.degrees(math.acos((b ** 2 + c ** 2 - a ** 2) / (2 * b * c)))
@@ -29,6 +35,7 @@ class Triangle:
         ab, bc, ca = self.side_lengths()
         return ab + bc + ca
 
+    @cached_method
     def area(self):
         ab, bc, ca = self.side_lengths()
         s = (ab + bc + ca) / 2
@@ -73,10 +80,11 @@ class Triangle:
         return (self.a.x + self.b.x + self.c.x)/3 , (self.a.y + self.b.y + self.c.y)/3
 
     def incenter(self):
-        a, b, c = self.side_lengths()
+        ab, bc, ca = self.side_lengths()
 
-        px = (a * self.a.x + b * self.b.x + c * self.c.x) / (a + b + c)
-        py = (a * self.a.y + b * self.b.y + c * self.c.y) / (a + b + c)
+        # Each vertex is weighted by the length of the side opposite it
+        px = (bc * self.a.x + ca * self.b.x + ab * self.c.x) / (ab + bc + ca)
+        py = (bc * self.a.y + ca * self.b.y + ab * self.c.y) / (ab + bc + ca)
 
         return px, py
 
@@ -84,6 +92,7 @@ class Triangle:
         s = self.perimeter() / 2
         return self.area() / s
 
+    @cached_method
     def circumcenter(self):
         l1 = Line(self.a, self.b)
         l2 = Line(self.b, self.c)
@@ -107,6 +116,7 @@ class Triangle:
         a, b, c = self.side_lengths()
         return (a * b * c) / (4 * self.area())
 
+    @cached_method
     def orthocenter(self):
         s1 = Line(self.a, self.b).perpendicular_slope()
         s2 = Line(self.b, self.c).perpendicular_slope()
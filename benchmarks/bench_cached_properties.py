@@ -0,0 +1,90 @@
+"""
+"Compute every property" reports for Triangle and the conics.
+
+Each report is timed three ways:
+
+* uncached  - every cached method replaced by the plain function it wraps,
+              i.e. the cost before derived values were cached;
+* cold      - a fresh instance per report, so the memoized sub-results
+              (side lengths, area, vertex, focal distance, ...) are computed
+              once and reused within the report;
+* warm      - the same instance reported again, memoized parts cached.
+
+Only shared or costly sub-results are memoized: a cached method's first
+call pays for the cache key and dict on top of the formula, so cold can be
+slower than uncached for shapes with little reuse.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_cached_properties [--repeat N]
+"""
+import argparse
+import time
+from unittest import mock
+
+from Coord_Geom.points import Point
+from Coord_Geom.triangles import Triangle
+from Coord_Geom.parabolas import Parabola
+from Coord_Geom.ellipses import Ellipse
+from Coord_Geom.hyperbolas import Hyperbola
+
+
+def triangle_report(t):
+    return (t.side_lengths(), t.angles(), t.perimeter(), t.area(), t.heights(),
+            t.medians(), t.centroid(), t.incenter(), t.inradius(),
+            t.circumcenter(), t.circumradius(), t.orthocenter(), t.type_by_angles())
+
+
+def parabola_report(p):
+    return (p.vertex(), p.focus(), p.focal_length(), p.directrix(),
+            p.focus_directrix_form(), p.axis_of_symmetry(), p.direction(),
+            p.discriminant(), p.latus_rectum_length(), p.roots())
+
+
+def ellipse_report(e):
+    return (e.equation(), e.center(), e.eccentricity(), e.foci(), e.vertices(),
+            e.co_vertices(), e.area(), e.perimeter_approx(), e.axis_of_symmetry())
+
+
+def hyperbola_report(h):
+    return (h.eccentricity(), h.foci(), h.vertices(), h.latus_rectum_length(),
+            h.latus_rectum_endpoints(), h.transverse_axis_length(),
+            h.conjugate_axis_length(), h.asymptotes(), h.angle_between_asymptotes(),
+            h.conjugate_hyperbola(), h.conic_form_equation())
+
+
+CASES = [
+    ('Triangle', Triangle, lambda: Triangle(Point(0, 0), Point(4, 0.5), Point(1, 3)), triangle_report),
+    ('Parabola', Parabola, lambda: Parabola(1.5, -2, -3), parabola_report),
+    ('Ellipse', Ellipse, lambda: Ellipse(5, 3, 1, 2), ellipse_report),
+    ('Hyperbola', Hyperbola, lambda: Hyperbola(3, 4, 1, 2), hyperbola_report),
+]
+
+
+def per_report(run, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    print("{:<10} {:>13} {:>13} {:>13}".format('shape', 'uncached us', 'cold us', 'warm us'))
+    for name, cls, build, report in CASES:
+        plain = {name: method.__wrapped__ for name, method in vars(cls).items()
+                 if hasattr(method, '__wrapped__')}
+        with mock.patch.multiple(cls, **plain):
+            shape = build()
+            uncached = per_report(lambda: report(shape), args.repeat)
+        cold = per_report(lambda: report(build()), args.repeat)
+        shape = build()
+        warm = per_report(lambda: report(shape), args.repeat)
+        print("{:<10} {:>13.2f} {:>13.2f} {:>13.2f}".format(name, uncached, cold, warm))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+CircleArray.overlapping_pairs against the pairwise Circle.intersects_circle loop.
+
+Circles are scattered at constant density (about one neighbour each), so the
+broad phase should scale near-linearly. The pairwise loop is timed on a
+sample of pairs and extrapolated to all n * (n - 1) / 2; up to
+``--check-max`` circles the result is verified against a vectorized
+all-pairs narrow phase.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_circle_overlaps [--sizes 1e4 1e5 1e6]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Coord_Geom.circle_arrays import CircleArray
+
+
+def random_circles(n, rng):
+    side = np.sqrt(n) * 3.0
+    return CircleArray(*rng.uniform(0, side, size=(2, n)), rng.uniform(0.5, 1.5, size=n))
+
+
+def pairwise_seconds(circles, rng, samples=200000):
+    objects = circles.to_circles()
+    i = rng.integers(0, len(objects), size=samples).tolist()
+    j = rng.integers(0, len(objects), size=samples).tolist()
+    start = time.perf_counter()
+    for a, b in zip(i, j):
+        objects[a].intersects_circle(objects[b])
+    n = len(objects)
+    return (time.perf_counter() - start) / samples * n * (n - 1) / 2
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1e4, 1e5, 1e6])
+    parser.add_argument('--check-max', type=float, default=5e3)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    check = random_circles(int(args.check_max), rng)
+    pairs, _, _, counts = check.overlapping_pairs()
+    i, j = np.triu_indices(len(check), 1)
+    expected, _, _, _ = check._narrow_phase(i, j, 0.0)
+    assert {tuple(p) for p in pairs.tolist()} == {tuple(p) for p in expected.tolist()}
+    print("{} circles: {} overlapping pairs match the all-pairs check".format(len(check), len(pairs)))
+
+    print("{:>10} {:>10} {:>10} {:>10} {:>16} {:>10}".format(
+        'n', 'pairs', 'crossing', 'grid s', 'pairwise loop s', 'speedup'))
+    for n in (int(s) for s in args.sizes):
+        circles = random_circles(n, rng)
+        start = time.perf_counter()
+        pairs, _, _, counts = circles.overlapping_pairs()
+        grid = time.perf_counter() - start
+        loop = pairwise_seconds(circles, rng)
+        print("{:>10} {:>10} {:>10} {:>10.3f} {:>16.1f} {:>9.0f}x".format(
+            n, len(pairs), int((counts == 2).sum()), grid, loop, loop / grid))
+
+
+if __name__ == '__main__':
+    main()
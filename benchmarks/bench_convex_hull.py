@@ -0,0 +1,91 @@
+"""
+convex_hull on point clouds of 10^5 to 10^7 points.
+
+For each size and distribution the table shows the hull size, how many
+points survive the Akl-Toussaint octagon filter and the total time. A
+pure-Python monotone chain over Point objects and Point.determinant is
+timed at the smallest size for reference; up to ``--check-max`` points the
+hull is compared with that reference.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_convex_hull [--sizes 1e5 1e6 1e7]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Coord_Geom.points import Point
+from Coord_Geom.hulls import convex_hull, _outside_octagon
+
+
+def square(n, rng):
+    return rng.random((n, 2))
+
+
+def disc(n, rng):
+    radius = np.sqrt(rng.random(n))
+    angle = rng.random(n) * 2 * np.pi
+    return np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+
+
+def gaussian(n, rng):
+    return rng.normal(size=(n, 2))
+
+
+def circle(n, rng):
+    # Worst case for the filter: every point is a hull vertex
+    angle = rng.random(n) * 2 * np.pi
+    return np.column_stack((np.cos(angle), np.sin(angle)))
+
+
+def reference_hull(points):
+    """Monotone chain on Point objects; indices in convex_hull's order."""
+    order = sorted(range(len(points)), key=lambda i: (points[i].x, points[i].y, i))
+    distinct = []
+    for i in order:
+        if not distinct or (points[i].x, points[i].y) != (points[distinct[-1]].x, points[distinct[-1]].y):
+            distinct.append(i)
+
+    def half(indices):
+        chain = []
+        for i in indices:
+            while len(chain) >= 2 and points[chain[-2]].determinant(points[chain[-1]], points[i]) <= 0:
+                chain.pop()
+            chain.append(i)
+        return chain
+
+    return half(distinct)[:-1] + half(distinct[::-1])[:-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1e5, 1e6, 1e7])
+    parser.add_argument('--check-max', type=float, default=1e5)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    print("{:>10} {:<9} {:>8} {:>12} {:>10} {:>14}".format(
+        'n', 'cloud', 'hull', 'filtered to', 'hull s', 'Python loop s'))
+    for n in (int(s) for s in args.sizes):
+        for cloud in (square, disc, gaussian, circle):
+            xy = cloud(n, rng)
+            start = time.perf_counter()
+            hull = convex_hull(xy)
+            elapsed = time.perf_counter() - start
+            survivors = _outside_octagon(xy, 1 << 20).shape[0]
+
+            loop = float('nan')
+            if n <= args.check_max:
+                points = [Point(x, y) for x, y in xy.tolist()]
+                start = time.perf_counter()
+                expected = reference_hull(points)
+                loop = time.perf_counter() - start
+                assert hull.tolist() == expected
+            print("{:>10} {:<9} {:>8} {:>12} {:>10.3f} {:>14.3f}".format(
+                n, cloud.__name__, len(hull), survivors, elapsed, loop))
+
+
+if __name__ == '__main__':
+    main()
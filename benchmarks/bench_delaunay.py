@@ -0,0 +1,58 @@
+"""
+Scaling of the Bowyer-Watson Delaunay triangulation.
+
+Uniform random points at doubling sizes. The ``per n log2 n`` column
+should stay roughly flat if construction is O(n log n); the last column
+adds the circumcenters and circumradii of every face through
+``to_triangle_array``. The smallest size is checked against
+scipy.spatial.Delaunay when scipy is installed (random points are in
+general position, so the triangulation is unique).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_delaunay [--sizes 1e3 2e3 ...]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Coord_Geom.delaunay import Delaunay
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=float, nargs='+',
+                        default=[1e3, 2e3, 4e3, 8e3, 1.6e4, 3.2e4, 6.4e4, 1.28e5])
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    try:
+        from scipy.spatial import Delaunay as Reference
+    except ImportError:
+        Reference = None
+    if Reference is not None:
+        xy = rng.random((int(args.sizes[0]), 2))
+        faces = {tuple(sorted(f)) for f in Delaunay(xy).faces.tolist()}
+        assert faces == {tuple(sorted(f)) for f in Reference(xy).simplices.tolist()}
+        print("{} points: {} faces match scipy.spatial.Delaunay".format(len(xy), len(faces)))
+
+    print("{:>9} {:>8} {:>10} {:>12} {:>18} {:>14}".format(
+        'points', 'faces', 'seconds', 'us / point', 'per n log2 n (ns)', 'circumcircles'))
+    for n in (int(s) for s in args.sizes):
+        xy = rng.random((n, 2))
+        start = time.perf_counter()
+        mesh = Delaunay(xy)
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        triangles = mesh.to_triangle_array()
+        triangles.circumcenter(), triangles.circumradius()
+        circles = time.perf_counter() - start
+
+        print("{:>9} {:>8} {:>10.3f} {:>12.1f} {:>18.2f} {:>14.4f}".format(
+            n, len(mesh), elapsed, elapsed / n * 1e6, elapsed / (n * np.log2(n)) * 1e9, circles))
+
+
+if __name__ == '__main__':
+    main()
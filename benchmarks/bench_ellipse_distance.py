@@ -0,0 +1,96 @@
+"""
+Throughput and accuracy of Ellipse.nearest_points.
+
+Accuracy is asserted on a subset of the queries plus points on both axes
+(the closed-form branches), the center and the foci. The reference distance
+is the best of a dense parametric sampling of the curve, refined by a bounded
+scalar minimization around that sample when scipy is installed. The run fails
+if a distance differs from the reference by more than ``--tol`` (relative)
+or a foot point is off the ellipse equation by more than 1e-12.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ellipse_distance [--points N] [--check M]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Coord_Geom.ellipses import Ellipse
+
+
+def reference_distances(ellipse, queries, samples=200001):
+    ex, ey = (ellipse.a, ellipse.b) if ellipse.orientation == 'h' else (ellipse.b, ellipse.a)
+    t = np.linspace(0, 2 * np.pi, samples)
+    step = t[1] - t[0]
+    cx = ellipse.h + ex * np.cos(t)
+    cy = ellipse.k + ey * np.sin(t)
+    try:
+        from scipy.optimize import minimize_scalar
+    except ImportError:
+        minimize_scalar = None
+
+    reference = []
+    for qx, qy in queries.tolist():
+        sampled = np.hypot(cx - qx, cy - qy)
+        best = int(sampled.argmin())
+        distance = sampled[best]
+        if minimize_scalar is not None:
+            result = minimize_scalar(
+                lambda s: np.hypot(ellipse.h + ex * np.cos(s) - qx, ellipse.k + ey * np.sin(s) - qy),
+                bounds=(t[best] - step, t[best] + step), method='bounded', options={'xatol': 1e-13})
+            distance = min(distance, result.fun)
+        reference.append(distance)
+    return np.array(reference)
+
+
+def check_accuracy(ellipse, queries, tol):
+    distances, xs, ys, _ = ellipse.nearest_points(queries)
+    reference = reference_distances(ellipse, queries)
+    error = np.abs(distances - reference) / np.maximum(reference, 1.0)
+    worst = int(error.argmax())
+    assert error[worst] <= tol, "{}: distance {!r} vs reference {!r} at {}".format(
+        ellipse.equation(), distances[worst], reference[worst], queries[worst].tolist())
+
+    ex, ey = (ellipse.a, ellipse.b) if ellipse.orientation == 'h' else (ellipse.b, ellipse.a)
+    residual = np.abs(((xs - ellipse.h) / ex) ** 2 + ((ys - ellipse.k) / ey) ** 2 - 1)
+    assert residual.max() <= 1e-12, "{}: foot point off the curve by {:.1e}".format(
+        ellipse.equation(), residual.max())
+    return error.max(), residual.max()
+
+
+def special_queries(ellipse, rng):
+    """Points on both symmetry axes, inside and outside, plus the center and foci."""
+    h, k, reach = ellipse.h, ellipse.k, 2 * ellipse.a
+    along = rng.uniform(-reach, reach, size=50)
+    (f1x, f1y), f2 = ellipse.foci()
+    return np.vstack([np.column_stack((h + along, np.full(50, k))),
+                      np.column_stack((np.full(50, h), k + along)),
+                      [[h, k], [f1x, f1y], [f2.x, f2.y]]])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--points', type=int, default=1000000)
+    parser.add_argument('--check', type=int, default=500)
+    parser.add_argument('--tol', type=float, default=1e-9)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    for ellipse in (Ellipse(5, 3, 1, -2, 'h'), Ellipse(5, 3, 1, -2, 'v'), Ellipse(50, 0.5)):
+        queries = rng.uniform(-60, 60, size=(args.points, 2))
+        start = time.perf_counter()
+        ellipse.nearest_points(queries)
+        elapsed = time.perf_counter() - start
+
+        checked = np.vstack([queries[:args.check], special_queries(ellipse, rng)])
+        error, residual = check_accuracy(ellipse, checked, args.tol)
+        print("a={:<4} b={:<4} {}  {:>8.3f} s  {:>10.0f} points/s  "
+              "max rel error {:.1e}  curve residual {:.1e}".format(
+                  ellipse.a, ellipse.b, ellipse.orientation, elapsed,
+                  args.points / elapsed, error, residual))
+
+
+if __name__ == '__main__':
+    main()
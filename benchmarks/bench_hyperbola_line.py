@@ -0,0 +1,63 @@
+"""
+Hyperbola-line intersection: exact quadratic solve against the sampled
+fallback, plus the vectorized batch variant.
+
+Accuracy is the largest ``|conic(x, y) - 1|`` over all reported points.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_hyperbola_line [--lines N] [--samples S]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Coord_Geom.points import Point
+from Coord_Geom.lines import Line
+from Coord_Geom.hyperbolas import Hyperbola
+
+
+def residual(hyperbola, xs, ys):
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if xs.size == 0:
+        return 0.0
+    value = (xs - hyperbola.h) ** 2 / hyperbola.a ** 2 - (ys - hyperbola.k) ** 2 / hyperbola.b ** 2
+    return float(np.nanmax(np.abs(value - 1)))
+
+
+def run(label, hyperbola, lines, method, samples):
+    start = time.perf_counter()
+    found = [hyperbola.intersects_with_line(l, samples=samples, method=method) for l in lines]
+    elapsed = time.perf_counter() - start
+    points = [p for pts in found for p in pts]
+    error = residual(hyperbola, [p.x for p in points], [p.y for p in points])
+    print("{:<12} {:>10.1f} us/line {:>10} points  max residual {:.2e}".format(
+        label, elapsed / len(lines) * 1e6, len(points), error))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lines', type=int, default=2000)
+    parser.add_argument('--batch', type=int, default=1000000)
+    parser.add_argument('--samples', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    hyperbola = Hyperbola(3.0, 2.0, 1.0, -1.0)
+    coords = rng.uniform(-15, 15, size=(args.batch, 4))
+    lines = [Line(Point(x1, y1), Point(x2, y2)) for x1, y1, x2, y2 in coords[:args.lines].tolist()]
+
+    run('exact', hyperbola, lines, 'exact', args.samples)
+    run('sampled', hyperbola, lines, 'sampled', args.samples)
+
+    start = time.perf_counter()
+    xs, ys, counts = hyperbola.intersections_with_lines(coords)
+    elapsed = time.perf_counter() - start
+    print("{:<12} {:>10.3f} us/line {:>10} points  max residual {:.2e}".format(
+        'vectorized', elapsed / args.batch * 1e6, int(counts.sum()), residual(hyperbola, xs, ys)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Per-instance memory of the geometry value types.
+
+Compares the original ``__dict__``-backed layout (reproduced here by plain
+classes that assign the same attributes, including the per-instance
+``orientation.lower()`` string) with the slotted classes and their immutable
+``Frozen*`` variants. Line and Circle figures include their Point objects.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory [--count N]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from Coord_Geom.points import Point
+from Coord_Geom.lines import Line
+from Coord_Geom.circles import Circle
+from Coord_Geom.parabolas import Parabola
+from Coord_Geom.ellipses import Ellipse
+from Coord_Geom.hyperbolas import Hyperbola
+from Coord_Geom.frozen import (FrozenPoint, FrozenLine, FrozenCircle,
+                               FrozenParabola, FrozenEllipse, FrozenHyperbola)
+
+
+def _legacy(name, fields):
+    def __init__(self, *args):
+        for field, value in zip(fields, args):
+            if field == 'orientation':
+                value = value.lower()
+            setattr(self, field, value)
+    return type(name, (), {'__init__': __init__})
+
+
+LegacyPoint = _legacy('LegacyPoint', ('x', 'y'))
+LegacyLine = _legacy('LegacyLine', ('p1', 'p2'))
+LegacyCircle = _legacy('LegacyCircle', ('center', 'radius'))
+LegacyParabola = _legacy('LegacyParabola', ('a', 'b', 'c', 'orientation'))
+LegacyConic = _legacy('LegacyConic', ('a', 'b', 'h', 'k', 'orientation'))
+
+CASES = [
+    ('Point', lambda i, P: P(float(i), 1.5),
+     (LegacyPoint, Point, FrozenPoint)),
+    ('Line', lambda i, L, P: L(P(float(i), 0.0), P(1.0, float(i))),
+     ((LegacyLine, LegacyPoint), (Line, Point), (FrozenLine, FrozenPoint))),
+    ('Circle', lambda i, C, P: C(P(float(i), 0.0), 2.0),
+     ((LegacyCircle, LegacyPoint), (Circle, Point), (FrozenCircle, FrozenPoint))),
+    ('Parabola', lambda i, P: P(float(i), 2.0, 3.0, 'v'),
+     (LegacyParabola, Parabola, FrozenParabola)),
+    ('Ellipse', lambda i, E: E(float(i) + 5.0, 2.0, 0.0, 0.0, 'h'),
+     (LegacyConic, Ellipse, FrozenEllipse)),
+    ('Hyperbola', lambda i, H: H(float(i) + 1.0, 2.0, 0.0, 0.0, 'h'),
+     (LegacyConic, Hyperbola, FrozenHyperbola)),
+]
+
+
+def bytes_per_instance(factory, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before - float_list_bytes(count)) / count
+
+
+def float_list_bytes(count):
+    # The list holding the instances plus the float built from ``i``
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    values = [float(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del values
+    return after - before
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    print("{:<10} {:>12} {:>12} {:>12}".format('type', '__dict__', 'slots', 'frozen'))
+    for name, build, classes in CASES:
+        sizes = []
+        for cls in classes:
+            if isinstance(cls, tuple):
+                factory = lambda i, c=cls: build(i, *c)
+            else:
+                factory = lambda i, c=cls: build(i, c)
+            sizes.append(bytes_per_instance(factory, args.count))
+        print("{:<10} {:>10.1f} B {:>10.1f} B {:>10.1f} B".format(name, *sizes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+TriangleGrid point location against the naive double loop over
+``Triangle.contains_point``.
+
+The mesh is a jittered regular grid split into two triangles per square. The
+naive loop is timed on a handful of queries and extrapolated.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_point_location [--triangles N] [--points M]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Coord_Geom.points import Point
+from Coord_Geom.triangle_arrays import TriangleArray
+from Coord_Geom.point_location import TriangleGrid
+
+
+def jittered_mesh(triangles, rng):
+    side = max(1, int(np.sqrt(triangles / 2)))
+    gx, gy = np.meshgrid(np.arange(side + 1, dtype=float), np.arange(side + 1, dtype=float))
+    grid = np.stack([gx, gy], axis=-1)
+    grid[1:-1, 1:-1] += rng.uniform(-0.3, 0.3, size=(side - 1, side - 1, 2))
+    v00 = grid[:-1, :-1].reshape(-1, 2)
+    v10 = grid[:-1, 1:].reshape(-1, 2)
+    v01 = grid[1:, :-1].reshape(-1, 2)
+    v11 = grid[1:, 1:].reshape(-1, 2)
+    lower = np.stack([v00, v10, v11], axis=1)
+    upper = np.stack([v00, v11, v01], axis=1)
+    return np.concatenate([lower, upper]), float(side)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--triangles', type=int, default=50000)
+    parser.add_argument('--points', type=int, default=10000000)
+    parser.add_argument('--cells-per-triangle', type=float, default=1.0)
+    parser.add_argument('--naive-queries', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    coords, side = jittered_mesh(args.triangles, rng)
+    queries = rng.uniform(-0.05 * side, 1.05 * side, size=(args.points, 2))
+
+    start = time.perf_counter()
+    grid = TriangleGrid(coords, cells_per_triangle=args.cells_per_triangle)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    located = grid.locate(queries)
+    query = time.perf_counter() - start
+
+    triangles = TriangleArray(coords).to_triangles()
+    start = time.perf_counter()
+    for i in range(args.naive_queries):
+        p = Point(*queries[i])
+        naive = next((j for j, t in enumerate(triangles) if t.contains_point(p)), -1)
+        assert naive == located[i]
+    naive = (time.perf_counter() - start) / args.naive_queries * args.points
+
+    print("triangles={} points={} grid={}x{}".format(len(coords), args.points, *grid.shape))
+    print("build      {:>12.3f} s".format(build))
+    print("locate     {:>12.3f} s  ({:.0f} points/s, {:.1%} misses)".format(
+        query, args.points / query, np.mean(located < 0)))
+    print("naive      {:>12.0f} s  (extrapolated)".format(naive))
+    print("speedup    {:>12.0f}x".format(naive / (build + query)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Polygon metrics and slab-indexed point-in-polygon on large polygons.
+
+Polygons are wavy rings (40 lobes) with n vertices. For each size the
+table shows the time of area + centroid + perimeter, of building the slab
+index (the first, one-point query) and of ``--queries`` containment
+queries, next to the all-edges vectorized ray cast (every query against
+every edge, timed on a sample and extrapolated) that the index replaces.
+The two must agree on the sample.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_polygons [--sizes 1e3 1e4 1e5 1e6] [--queries Q]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Coord_Geom.polygons import Polygon
+
+
+def wavy_ring(n):
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    r = 1 + 0.2 * np.sin(40 * t)
+    return np.column_stack((r * np.cos(t), r * np.sin(t)))
+
+
+def all_edges(coords, xy):
+    """Crossing parity of every query against every edge."""
+    ax, ay = coords[:, 0], coords[:, 1]
+    bx, by = np.roll(ax, -1), np.roll(ay, -1)
+    inside = np.zeros(xy.shape[0], dtype=bool)
+    for k, (px, py) in enumerate(xy.tolist()):
+        straddles = (ay > py) != (by > py)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_cross = ax + (py - ay) * (bx - ax) / (by - ay)
+        inside[k] = np.count_nonzero(straddles & (px < x_cross)) % 2 == 1
+    return inside
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1e3, 1e4, 1e5, 1e6])
+    parser.add_argument('--queries', type=int, default=1000000)
+    parser.add_argument('--sample', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    queries = rng.uniform(-1.3, 1.3, size=(args.queries, 2))
+    print("{:>9} {:>10} {:>9} {:>10} {:>14} {:>9}".format(
+        'vertices', 'metrics s', 'index s', 'queries s', 'all-edges s', 'speedup'))
+    for n in (int(s) for s in args.sizes):
+        polygon = Polygon(wavy_ring(n))
+
+        start = time.perf_counter()
+        polygon.area(), polygon.centroid(), polygon.perimeter()
+        metrics = time.perf_counter() - start
+
+        start = time.perf_counter()
+        polygon.contains_points([(0.0, 0.0)])  # first query builds the slab index
+        index = time.perf_counter() - start
+
+        start = time.perf_counter()
+        inside = polygon.contains_points(queries)
+        elapsed = time.perf_counter() - start
+
+        sample = queries[:args.sample]
+        start = time.perf_counter()
+        expected = all_edges(polygon.coords, sample)
+        brute = (time.perf_counter() - start) / args.sample * args.queries
+        assert (inside[:args.sample] == expected).all()
+
+        print("{:>9} {:>10.4f} {:>9.4f} {:>10.3f} {:>14.1f} {:>8.0f}x".format(
+            n, metrics, index, elapsed, brute, brute / (index + elapsed)))
+
+
+if __name__ == '__main__':
+    main()
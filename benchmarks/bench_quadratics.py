@@ -0,0 +1,93 @@
+"""
+Throughput and accuracy of the quadratic solvers in Coord_Geom.quadratics.
+
+Throughput: solve_quadratics on N random equations against the per-equation
+Python loops (the textbook formula that Parabola.roots used to apply, and the
+scalar real_roots).
+
+Accuracy: families with b^2 >> 4ac, where the textbook formula cancels, are
+solved both ways and compared with roots computed in 60-digit decimal
+arithmetic; the worst relative error of the smaller-magnitude root is shown.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_quadratics [--equations N] [--check M]
+"""
+import argparse
+import decimal
+import math
+import time
+
+import numpy as np
+
+from Coord_Geom.quadratics import real_roots, solve_quadratics
+
+
+def textbook(a, b, c):
+    discriminant = b ** 2 - 4 * a * c
+    if discriminant < 0:
+        return ()
+    root = math.sqrt(discriminant)
+    return sorted(((-b + root) / (2 * a), (-b - root) / (2 * a)))
+
+
+def reference_small_root(a, b, c):
+    with decimal.localcontext() as ctx:
+        ctx.prec = 60
+        a, b, c = decimal.Decimal(a), decimal.Decimal(b), decimal.Decimal(c)
+        root = (b * b - 4 * a * c).sqrt()
+        roots = ((-b + root) / (2 * a), (-b - root) / (2 * a))
+        return float(min(roots, key=abs))
+
+
+def relative_error(value, reference):
+    return abs(value - reference) / abs(reference)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--equations', type=int, default=1000000)
+    parser.add_argument('--check', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    a, b, c = rng.uniform(-10, 10, size=(3, args.equations))
+
+    start = time.perf_counter()
+    solve_quadratics(a, b, c)
+    batched = time.perf_counter() - start
+
+    loops = {}
+    subset = min(args.equations, 100000)
+    rows = list(zip(a[:subset].tolist(), b[:subset].tolist(), c[:subset].tolist()))
+    for name, solver in (('textbook loop', textbook), ('real_roots loop', real_roots)):
+        start = time.perf_counter()
+        for row in rows:
+            solver(*row)
+        loops[name] = (time.perf_counter() - start) / subset * args.equations
+
+    print("{:<18} {:>10} {:>16}".format('solver', 'seconds', 'equations/s'))
+    print("{:<18} {:>10.3f} {:>16.0f}".format('solve_quadratics', batched, args.equations / batched))
+    for name, seconds in loops.items():
+        print("{:<18} {:>10.3f} {:>16.0f}  (extrapolated from {})".format(
+            name, seconds, args.equations / seconds, subset))
+
+    print()
+    print("{:>8} {:>18} {:>18}".format('b', 'textbook rel err', 'stable rel err'))
+    for b_value in (1e2, 1e4, 1e6, 1e8):
+        a, c = rng.uniform(0.5, 2.0, size=(2, args.check))
+        b = np.full(args.check, b_value) * rng.choice([-1.0, 1.0], size=args.check)
+        roots, counts = solve_quadratics(a, b, c)
+        assert (counts == 2).all()
+        worst_textbook = worst_stable = 0.0
+        for i, row in enumerate(zip(a.tolist(), b.tolist(), c.tolist())):
+            reference = reference_small_root(*row)
+            small = min(textbook(*row), key=abs)
+            stable = min(roots[i].tolist(), key=abs)
+            worst_textbook = max(worst_textbook, relative_error(small, reference))
+            worst_stable = max(worst_stable, relative_error(stable, reference))
+        print("{:>8.0e} {:>18.2e} {:>18.2e}".format(b_value, worst_textbook, worst_stable))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Scene rendering against the per-call plot_* path.
+
+Both paths draw the same circles and line segments and write a PNG on the
+Agg backend; the per-call path issues one ``plt.plot`` per shape.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scene [--circles N] [--segments M]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from Coord_Geom.points import Point
+from Coord_Geom.circles import Circle
+from Coord_Geom.lines import Line
+from Coord_Geom.circle_arrays import CircleArray
+from Coord_Geom import plot_utils
+
+
+def per_call(circles, lines, path):
+    plot_utils.prepare_plot("per-call")
+    for circle in circles:
+        plot_utils.plot_circle(circle, show_center=False, show_radius=False)
+    for line in lines:
+        xs = [line.p1.x, line.p2.x]
+        ys = [line.p1.y, line.p2.y]
+        plt.plot(xs, ys, color='blue')
+    plt.savefig(path)
+    plt.close('all')
+
+
+def batched(circles, lines, path):
+    scene = plot_utils.Scene("scene")
+    scene.add_circles(circles)
+    scene.add_segments(lines)
+    scene.render(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--circles', type=int, default=10000)
+    parser.add_argument('--segments', type=int, default=10000)
+    parser.add_argument('--skip-per-call', action='store_true')
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 100, size=(args.circles, 2))
+    radii = rng.uniform(0.2, 2.0, size=args.circles)
+    circles = [Circle(Point(x, y), r) for (x, y), r in zip(centers.tolist(), radii.tolist())]
+    ends = rng.uniform(0, 100, size=(args.segments, 4))
+    lines = [Line(Point(x1, y1), Point(x2, y2)) for x1, y1, x2, y2 in ends.tolist()]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, run in (('per-call', per_call), ('scene', batched)):
+            if label == 'per-call' and args.skip_per_call:
+                continue
+            if label == 'scene':
+                shapes = CircleArray.from_circles(circles)
+            else:
+                shapes = circles
+            path = os.path.join(tmp, label + '.png')
+            start = time.perf_counter()
+            run(shapes, lines, path)
+            elapsed = time.perf_counter() - start
+            print("{:<9} {:>9.2f} s  ({} circles, {} segments)".format(
+                label, elapsed, args.circles, args.segments))
+        for ext in ('svg',):
+            path = os.path.join(tmp, 'scene.' + ext)
+            start = time.perf_counter()
+            batched(CircleArray.from_circles(circles), lines, path)
+            print("{:<9} {:>9.2f} s".format('scene ' + ext, time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
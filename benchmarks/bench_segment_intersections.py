@@ -0,0 +1,103 @@
+"""
+segment_intersections against the brute-force pairwise check.
+
+Segments are short random strokes in a square, so the number of crossings
+grows linearly with n. The brute force tests every pair with vectorized
+orientation signs (chunked to bound memory) and is skipped above
+``--brute-max`` segments; where it runs, both must report the same pairs.
+A small integer grid with vertical, touching and overlapping segments is
+checked as well.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_segment_intersections [--sizes 1e3 1e4 1e5]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Coord_Geom.intersections import segment_intersections
+
+
+def brute_force_pairs(coords, chunk=1 << 22):
+    """Every intersecting pair, touching included, from all n * (n - 1) / 2 tests."""
+    n = len(coords)
+    a, b = coords[:, None, :2], coords[:, None, 2:]
+    found = []
+    rows = max(1, chunk // max(n, 1))
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        c, d = coords[None, :, :2], coords[None, :, 2:]
+        pa, pb = a[start:stop], b[start:stop]
+
+        def orient(p, q, r):
+            return np.sign((q[..., 0] - p[..., 0]) * (r[..., 1] - p[..., 1])
+                           - (q[..., 1] - p[..., 1]) * (r[..., 0] - p[..., 0]))
+
+        def within(p, q, r):
+            return ((np.minimum(p[..., 0], q[..., 0]) <= r[..., 0]) & (r[..., 0] <= np.maximum(p[..., 0], q[..., 0]))
+                    & (np.minimum(p[..., 1], q[..., 1]) <= r[..., 1]) & (r[..., 1] <= np.maximum(p[..., 1], q[..., 1])))
+
+        o1, o2 = orient(pa, pb, c), orient(pa, pb, d)
+        o3, o4 = orient(c, d, pa), orient(c, d, pb)
+        hit = (o1 * o2 < 0) & (o3 * o4 < 0)
+        hit |= (o1 == 0) & within(pa, pb, c)
+        hit |= (o2 == 0) & within(pa, pb, d)
+        hit |= (o3 == 0) & within(c, d, pa)
+        hit |= (o4 == 0) & within(c, d, pb)
+        i, j = np.nonzero(hit)
+        i += start
+        keep = i < j
+        found.append(np.column_stack((i[keep], j[keep])))
+    return np.concatenate(found) if found else np.empty((0, 2), dtype=np.intp)
+
+
+def random_strokes(n, rng, length=10.0):
+    side = np.sqrt(n) * 20.0
+    start = rng.uniform(0, side, size=(n, 2))
+    return np.hstack((start, start + rng.uniform(-length, length, size=(n, 2))))
+
+
+def degenerate_grid(n, rng):
+    coords = rng.integers(0, 8, size=(n, 4)).astype(float)
+    coords[::3, 2] = coords[::3, 0]
+    return coords
+
+
+def same_pairs(first, second):
+    return {tuple(p) for p in first.tolist()} == {tuple(p) for p in second.tolist()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1e3, 1e4, 1e5])
+    parser.add_argument('--brute-max', type=float, default=2e4)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    grid = degenerate_grid(300, rng)
+    pairs, _, overlaps = segment_intersections(grid)
+    assert same_pairs(pairs, brute_force_pairs(grid))
+    print("degenerate grid: {} segments, {} pairs ({} overlapping) match the brute force".format(
+        len(grid), len(pairs), int(overlaps.sum())))
+
+    print("{:>10} {:>10} {:>10} {:>12} {:>9}".format('n', 'pairs', 'sweep s', 'brute s', 'speedup'))
+    for n in (int(s) for s in args.sizes):
+        coords = random_strokes(n, rng)
+        start = time.perf_counter()
+        pairs, _, _ = segment_intersections(coords)
+        sweep = time.perf_counter() - start
+
+        brute = float('nan')
+        if n <= args.brute_max:
+            start = time.perf_counter()
+            expected = brute_force_pairs(coords)
+            brute = time.perf_counter() - start
+            assert same_pairs(pairs, expected)
+
+        print("{:>10} {:>10} {:>10.3f} {:>12.3f} {:>8.1f}x".format(n, len(pairs), sweep, brute, brute / sweep))
+
+
+if __name__ == '__main__':
+    main()
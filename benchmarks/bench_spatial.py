@@ -0,0 +1,71 @@
+"""
+KDTree against the brute-force ``Point.distance_to`` scan.
+
+For every size the tree is built once and answers a batch of k-NN and radius
+queries; the brute-force loop is timed on a few queries and extrapolated to
+the whole batch (and skipped entirely above ``--brute-max`` points).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_spatial [--sizes 1e4 1e5 1e6 1e7] [--queries Q]
+"""
+import argparse
+import heapq
+import time
+
+import numpy as np
+
+from Coord_Geom.points import Point
+from Coord_Geom.spatial import KDTree
+
+
+def brute_force_knn(points, query, k):
+    return heapq.nsmallest(k, range(len(points)), key=lambda i: points[i].distance_to(query))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1e4, 1e5, 1e6, 1e7])
+    parser.add_argument('--queries', type=int, default=10000)
+    parser.add_argument('--k', type=int, default=8)
+    parser.add_argument('--brute-queries', type=int, default=3)
+    parser.add_argument('--brute-max', type=float, default=1e6)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    print("{:>10} {:>10} {:>12} {:>12} {:>14} {:>9}".format(
+        'n', 'build s', 'knn s', 'radius s', 'brute knn s', 'speedup'))
+
+    for n in (int(s) for s in args.sizes):
+        coords = rng.random((n, 2)) * 1000.0
+        queries = rng.random((args.queries, 2)) * 1000.0
+        radius = 1000.0 * np.sqrt(args.k / (np.pi * n))
+
+        start = time.perf_counter()
+        tree = KDTree(coords)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, indices = tree.query(queries, k=args.k)
+        knn = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tree.query_radius(queries, radius)
+        radius_time = time.perf_counter() - start
+
+        brute = float('nan')
+        if n <= args.brute_max:
+            points = [Point(x, y) for x, y in coords.tolist()]
+            start = time.perf_counter()
+            for q in queries[:args.brute_queries].tolist():
+                brute_force_knn(points, Point(*q), args.k)
+            brute = (time.perf_counter() - start) / args.brute_queries * args.queries
+            expected = brute_force_knn(points, Point(*queries[0]), args.k)
+            assert sorted(expected) == sorted(indices[0].tolist())
+
+        print("{:>10} {:>10.3f} {:>12.4f} {:>12.4f} {:>14.1f} {:>8.0f}x".format(
+            n, build, knn, radius_time, brute, brute / (build + knn)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Import time and memory of ``import Coord_Geom``.
+
+Every scenario runs in a fresh interpreter and reports wall time for the
+imports, the peak RSS of the process and which heavy dependencies ended up
+loaded.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup [--repeat N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SCENARIOS = [
+    ('interpreter', "pass"),
+    ('core classes', "import Coord_Geom\nCoord_Geom.Line(Coord_Geom.Point(0, 0), Coord_Geom.Point(1, 1)).length()"),
+    ('PointArray', "import Coord_Geom\nCoord_Geom.PointArray([0.0], [1.0])"),
+    ('plot_utils', "import Coord_Geom\nCoord_Geom.plot_circle"),
+]
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+heavy = [m for m in ('numpy', 'scipy', 'matplotlib') if m in sys.modules]
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(__import__('json').dumps({{'seconds': elapsed, 'rss_kb': rss, 'heavy': heavy}}))
+"""
+
+
+def probe(code):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, '-c', PROBE.format(code=code)], cwd=root,
+                         check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print("{:<14} {:>10} {:>10}  {}".format('scenario', 'import ms', 'RSS MB', 'heavy modules loaded'))
+    for name, code in SCENARIOS:
+        runs = [probe(code) for _ in range(args.repeat)]
+        seconds = min(r['seconds'] for r in runs)
+        rss = min(r['rss_kb'] for r in runs) / 1024
+        print("{:<14} {:>10.1f} {:>10.1f}  {}".format(
+            name, seconds * 1000, rss, ', '.join(runs[0]['heavy']) or '-'))
+
+
+if __name__ == '__main__':
+    main()
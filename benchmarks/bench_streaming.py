@@ -0,0 +1,79 @@
+"""
+Memory and per-stage throughput of the streaming Pipeline.
+
+A raw binary file of random coordinates is written to a temporary directory
+for each size, streamed through rotate -> reflect_x -> translate ->
+distance_to_line -> in_circle and written back out. Peak traced memory
+(tracemalloc, which sees NumPy buffers) should stay flat as the input grows,
+since only a few chunks are ever alive. The largest run's stage report is
+printed, followed by the same pipeline on a CSV file of ``--csv-rows`` rows.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_streaming [--sizes 1e6 4e6 1.6e7] [--chunk-size 262144]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from Coord_Geom import Point, Line, Circle
+from Coord_Geom.streaming import Pipeline, read_binary, read_csv, BinaryWriter, CSVWriter
+
+
+def write_input(path, rows, rng, block=1 << 20):
+    with open(path, 'wb') as f:
+        for start in range(0, rows, block):
+            rng.uniform(-100, 100, size=(min(block, rows - start), 2)).tofile(f)
+
+
+def pipeline():
+    return (Pipeline()
+            .rotate(30)
+            .reflect_x()
+            .translate(5, -5)
+            .distance_to_line(Line(Point(0, 1), Point(3, 2)))
+            .in_circle(Circle(Point(1, 1), 50)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1e6, 4e6, 1.6e7])
+    parser.add_argument('--chunk-size', type=int, default=1 << 18)
+    parser.add_argument('--csv-rows', type=int, default=1000000)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'points.bin')
+        target = os.path.join(directory, 'out.bin')
+
+        print("{:>12} {:>12} {:>12} {:>12}".format('rows', 'input MiB', 'seconds', 'peak MiB'))
+        for rows in (int(s) for s in args.sizes):
+            write_input(source, rows, rng)
+            tracemalloc.start()
+            start = time.perf_counter()
+            report = pipeline().run(read_binary(source, args.chunk_size), BinaryWriter(target))
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert os.path.getsize(target) == rows * 4 * 8
+            print("{:>12} {:>12.1f} {:>12.3f} {:>12.1f}".format(
+                rows, os.path.getsize(source) / 2 ** 20, elapsed, peak / 2 ** 20))
+        print()
+        print(report)
+
+        source = os.path.join(directory, 'points.csv')
+        np.savetxt(source, rng.uniform(-100, 100, size=(args.csv_rows, 2)), delimiter=',',
+                   header='x,y', comments='', fmt='%.17g')
+        report = pipeline().run(read_csv(source, args.chunk_size, skiprows=1),
+                                CSVWriter(os.path.join(directory, 'out.csv')))
+        print()
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
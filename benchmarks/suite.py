@@ -0,0 +1,460 @@
+"""
+Benchmark suite covering every Coord_Geom module, with stored baselines.
+
+Each workload builds realistic inputs of a size scaled by ``--scale`` and is
+timed ``--repeat`` times; the best time is kept. Results are written as JSON
+and can be compared against a stored baseline; any workload slower than the
+baseline by more than ``--threshold`` (relative, per item) is flagged, as is
+any baseline workload the run no longer produces, and the command exits with
+status 1.
+
+Run from the repository root:
+
+    python -m benchmarks.suite run [--scale 1.0] [--output results.json] [--filter circles]
+    python -m benchmarks.suite compare benchmarks/baseline.json results.json [--threshold 0.2]
+    python -m benchmarks.suite run --compare benchmarks/baseline.json
+
+Baselines are machine-specific: regenerate benchmarks/baseline.json with
+``run --output benchmarks/baseline.json`` on the machine that runs the checks.
+"""
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from Coord_Geom.points import Point
+from Coord_Geom.lines import Line
+from Coord_Geom.triangles import Triangle
+from Coord_Geom.circles import Circle
+from Coord_Geom.parabolas import Parabola
+from Coord_Geom.ellipses import Ellipse
+from Coord_Geom.hyperbolas import Hyperbola
+
+WORKLOADS = {}
+
+
+def workload(name, size):
+    """Registers ``setup(n, rng) -> run()``; ``size`` is n at scale 1."""
+    def register(setup):
+        WORKLOADS[name] = (size, setup)
+        return setup
+    return register
+
+
+def random_points(n, rng, spread=100.0):
+    return [Point(x, y) for x, y in rng.uniform(-spread, spread, size=(n, 2)).tolist()]
+
+
+def random_lines(n, rng, spread=100.0):
+    coords = rng.uniform(-spread, spread, size=(n, 4)).tolist()
+    return [Line(Point(x1, y1), Point(x2, y2)) for x1, y1, x2, y2 in coords]
+
+
+def random_vertices(n, rng):
+    points = random_points(3 * n, rng)
+    return [points[i:i + 3] for i in range(0, 3 * n, 3)]
+
+
+def random_triangles(n, rng):
+    return [Triangle(*vertices) for vertices in random_vertices(n, rng)]
+
+
+# ---------- points ----------
+
+@workload('points.distance_to', 200000)
+def _(n, rng):
+    points = random_points(n, rng)
+    origin = Point(1.0, 2.0)
+    return lambda: [p.distance_to(origin) for p in points]
+
+
+@workload('points.rotate', 100000)
+def _(n, rng):
+    points = random_points(n, rng)
+    center = Point(1.0, 2.0)
+    return lambda: [p.rotate(30, around_origin=False, center=center) for p in points]
+
+
+@workload('point_arrays.distance_to', 2000000)
+def _(n, rng):
+    from Coord_Geom.point_arrays import PointArray
+    points = PointArray(*rng.uniform(-100, 100, size=(2, n)))
+    return lambda: points.distance_to(Point(1.0, 2.0))
+
+
+# ---------- lines ----------
+
+@workload('lines.distance_from_point', 100000)
+def _(n, rng):
+    lines = random_lines(n, rng)
+    p = Point(3.0, -4.0)
+    return lambda: [l.distance_from_point(p) for l in lines]
+
+
+@workload('lines.point_on_line', 100000)
+def _(n, rng):
+    lines = random_lines(n, rng)
+    return lambda: [l.point_on_line(l.p1) for l in lines]
+
+
+@workload('lines.reflect_point', 100000)
+def _(n, rng):
+    lines = random_lines(n, rng)
+    p = Point(3.0, -4.0)
+    return lambda: [l.reflect_point(p) for l in lines]
+
+
+@workload('line_arrays.distance_from_points', 2000000)
+def _(n, rng):
+    from Coord_Geom.line_arrays import LineArray
+    lines = LineArray.from_coords(rng.uniform(-100, 100, size=(n, 4)))
+    return lambda: lines.distance_from_points(Point(3.0, -4.0))
+
+
+@workload('line_arrays.reflect_points_outer', 1000000)
+def _(n, rng):
+    from Coord_Geom.line_arrays import LineArray
+    lines = LineArray.from_coords(rng.uniform(-100, 100, size=(100, 4)))
+    xy = rng.uniform(-100, 100, size=(n // 100, 2))
+    return lambda: lines.reflect_points(xy, outer=True)
+
+
+@workload('intersections.segment_intersections', 20000)
+def _(n, rng):
+    from Coord_Geom.intersections import segment_intersections
+    start = rng.uniform(0, np.sqrt(n) * 20.0, size=(n, 2))
+    coords = np.hstack((start, start + rng.uniform(-10, 10, size=(n, 2))))
+    return lambda: segment_intersections(coords)
+
+
+# ---------- triangles ----------
+# Derived triangle and conic values are memoized per instance, so workloads
+# timing them build fresh objects inside run() to measure the cold cost.
+
+@workload('triangles.circumcenter', 50000)
+def _(n, rng):
+    vertices = random_vertices(n, rng)
+    return lambda: [Triangle(a, b, c).circumcenter() for a, b, c in vertices]
+
+
+@workload('triangles.report', 20000)
+def _(n, rng):
+    vertices = random_vertices(n, rng)
+
+    def run():
+        for a, b, c in vertices:
+            t = Triangle(a, b, c)
+            t.angles(), t.area(), t.heights(), t.medians(), t.inradius(), t.circumradius(), t.orthocenter()
+    return run
+
+
+@workload('triangles.contains_point', 100000)
+def _(n, rng):
+    triangles = random_triangles(n, rng)
+    p = Point(0.5, 0.5)
+    return lambda: [t.contains_point(p) for t in triangles]
+
+
+@workload('triangle_arrays.metrics', 1000000)
+def _(n, rng):
+    from Coord_Geom.triangle_arrays import TriangleArray
+    coords = rng.uniform(-100, 100, size=(n, 3, 2))
+    return lambda: TriangleArray(coords).circumcenter()
+
+
+# ---------- circles ----------
+
+@workload('circles.contains_point', 200000)
+def _(n, rng):
+    circle = Circle(Point(0.0, 0.0), 50.0)
+    points = random_points(n, rng)
+    return lambda: [circle.contains_point(p) for p in points]
+
+
+@workload('circles.tangent_from_point', 50000)
+def _(n, rng):
+    circle = Circle(Point(0.0, 0.0), 5.0)
+    points = random_points(n, rng)
+    points = [p for p in points if p.dist_origin() > 5.0]
+    return lambda: [circle.tangent_from_point(p) for p in points]
+
+
+@workload('circle_arrays.contains_points', 2000000)
+def _(n, rng):
+    from Coord_Geom.circle_arrays import CircleArray
+    circles = CircleArray([0.0], [0.0], [50.0])
+    xy = rng.uniform(-100, 100, size=(n, 2))
+    return lambda: circles.contains_points(xy)
+
+
+@workload('circle_arrays.overlapping_pairs', 200000)
+def _(n, rng):
+    from Coord_Geom.circle_arrays import CircleArray
+    side = np.sqrt(n) * 3.0
+    circles = CircleArray(*rng.uniform(0, side, size=(2, n)), rng.uniform(0.5, 1.5, size=n))
+    return lambda: circles.overlapping_pairs()
+
+
+# ---------- conics ----------
+
+@workload('parabolas.intersection_with_line', 50000)
+def _(n, rng):
+    parabola = Parabola(0.5, -1.0, -3.0)
+    lines = random_lines(n, rng, spread=10.0)
+    return lambda: [parabola.intersection_with_line(l) for l in lines]
+
+
+@workload('parabolas.intersections_with_lines', 2000000)
+def _(n, rng):
+    parabola = Parabola(0.5, -1.0, -3.0)
+    coords = rng.uniform(-10, 10, size=(n, 4))
+    return lambda: parabola.intersections_with_lines(coords)
+
+
+@workload('parabolas.roots', 200000)
+def _(n, rng):
+    coefficients = rng.uniform(-10, 10, size=(n, 3)).tolist()
+    return lambda: [Parabola(a, b, c).roots() for a, b, c in coefficients]
+
+
+@workload('quadratics.solve_quadratics', 5000000)
+def _(n, rng):
+    from Coord_Geom.quadratics import solve_quadratics
+    a, b, c = rng.uniform(-10, 10, size=(3, n))
+    return lambda: solve_quadratics(a, b, c)
+
+
+@workload('ellipses.nearest_points', 200000)
+def _(n, rng):
+    ellipse = Ellipse(5.0, 3.0, 1.0, -2.0)
+    xy = rng.uniform(-20, 20, size=(n, 2))
+    return lambda: ellipse.nearest_points(xy)
+
+
+@workload('ellipses.get_y_given_x', 200000)
+def _(n, rng):
+    ellipse = Ellipse(5.0, 3.0, 1.0, -2.0)
+    xs = rng.uniform(-6, 8, size=n).tolist()
+    return lambda: [ellipse.get_y_given_x(x) for x in xs]
+
+
+@workload('ellipses.get_y_given_x_array', 2000000)
+def _(n, rng):
+    ellipse = Ellipse(5.0, 3.0, 1.0, -2.0)
+    xs = rng.uniform(-6, 8, size=n)
+    return lambda: ellipse.get_y_given_x(xs)
+
+
+@workload('hyperbolas.evaluate_array', 2000000)
+def _(n, rng):
+    hyperbola = Hyperbola(3.0, 2.0, 1.0, -1.0)
+    xs = rng.uniform(-20, 20, size=n)
+    return lambda: hyperbola.evaluate(xs)
+
+
+@workload('hyperbolas.distance_to_hyperbola', 2000)
+def _(n, rng):
+    hyperbola = Hyperbola(3.0, 2.0, 1.0, -1.0)
+    points = random_points(n, rng, spread=20.0)
+    return lambda: [hyperbola.distance_to_hyperbola(p) for p in points]
+
+
+@workload('hyperbolas.nearest_points', 500000)
+def _(n, rng):
+    hyperbola = Hyperbola(3.0, 2.0, 1.0, -1.0)
+    xy = rng.uniform(-20, 20, size=(n, 2))
+    return lambda: hyperbola.nearest_points(xy)
+
+
+@workload('hyperbolas.intersects_with_line', 50000)
+def _(n, rng):
+    hyperbola = Hyperbola(3.0, 2.0, 1.0, -1.0)
+    lines = random_lines(n, rng, spread=15.0)
+    return lambda: [hyperbola.intersects_with_line(l) for l in lines]
+
+
+# ---------- hulls ----------
+
+@workload('hulls.convex_hull', 2000000)
+def _(n, rng):
+    from Coord_Geom.hulls import convex_hull
+    radius = np.sqrt(rng.random(n))
+    angle = rng.random(n) * 2 * np.pi
+    xy = np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+    return lambda: convex_hull(xy)
+
+
+# ---------- polygons ----------
+
+@workload('polygons.contains_points', 1000000)
+def _(n, rng):
+    from Coord_Geom.polygons import Polygon
+    angle = np.linspace(0, 2 * np.pi, 100000, endpoint=False)
+    radius = 1 + 0.2 * np.sin(40 * angle)
+    polygon = Polygon(np.column_stack((radius * np.cos(angle), radius * np.sin(angle))))
+    polygon.contains_points([(0.0, 0.0)])  # builds the slab index
+    xy = rng.uniform(-1.3, 1.3, size=(n, 2))
+    return lambda: polygon.contains_points(xy)
+
+
+# ---------- delaunay ----------
+
+@workload('delaunay.build', 50000)
+def _(n, rng):
+    from Coord_Geom.delaunay import Delaunay
+    xy = rng.random((n, 2))
+    return lambda: Delaunay(xy)
+
+
+# ---------- streaming ----------
+
+@workload('streaming.pipeline', 4000000)
+def _(n, rng):
+    from Coord_Geom.streaming import Pipeline, read_array
+    xy = rng.uniform(-100, 100, size=(n, 2))
+    pipeline = (Pipeline().rotate(30).reflect_x().translate(5, -5)
+                .distance_to_line(Line(Point(0, 1), Point(3, 2))).in_circle(Circle(Point(1, 1), 50)))
+    return lambda: pipeline.run(read_array(xy, 1 << 18))
+
+
+# ---------- plot_utils ----------
+
+@workload('tessellation.uncached', 5000)
+def _(n, rng):
+    from Coord_Geom.tessellation import tessellate, clear_cache
+    shapes = [Ellipse(a, b, h, k) for a, b, h, k in rng.uniform(1, 10, size=(n, 4)).tolist()]
+
+    def run():
+        clear_cache()
+        return [tessellate(s) for s in shapes]
+    return run
+
+
+@workload('plot_utils.scene_render', 5000)
+def _(n, rng):
+    import matplotlib
+    matplotlib.use('Agg')
+    from Coord_Geom.circle_arrays import CircleArray
+    from Coord_Geom.plot_utils import Scene
+    circles = CircleArray(*rng.uniform(0, 100, size=(2, n)), rng.uniform(0.5, 2, size=n))
+    lines = random_lines(n, rng)
+
+    def run():
+        scene = Scene()
+        scene.add_circles(circles)
+        scene.add_segments(lines)
+        scene.render(io.BytesIO(), format='png')
+    return run
+
+
+# ---------- driver ----------
+
+def run_suite(scale=1.0, repeat=3, pattern=None, seed=0):
+    results = {}
+    for name, (size, setup) in sorted(WORKLOADS.items()):
+        if pattern and pattern not in name:
+            continue
+        n = max(1, int(size * scale))
+        run = setup(n, np.random.default_rng(seed))
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        results[name] = {'n': n, 'seconds': best, 'per_item_us': best / n * 1e6}
+        print("{:<40} n={:<9} {:>10.4f} s {:>12.4f} us/item".format(name, n, best, best / n * 1e6))
+    return {
+        'meta': {
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'scale': scale,
+            'repeat': repeat,
+            'filter': pattern,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold=0.2):
+    """
+    Prints a comparison table and returns ``(regressions, missing)``: the
+    workloads that got slower than ``threshold`` and the baseline workloads
+    absent from the current run (deleted or renamed). Workloads left out by
+    the current run's ``--filter`` do not count as missing.
+    """
+    regressions = []
+    print("{:<40} {:>14} {:>14} {:>9}".format('workload', 'baseline us', 'current us', 'change'))
+    for name, result in sorted(current['results'].items()):
+        base = baseline['results'].get(name)
+        if base is None:
+            print("{:<40} {:>14} {:>14.4f} {:>9}".format(name, '-', result['per_item_us'], 'new'))
+            continue
+        change = result['per_item_us'] / base['per_item_us'] - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print("{:<40} {:>14.4f} {:>14.4f} {:>+8.1%}{}".format(
+            name, base['per_item_us'], result['per_item_us'], change, flag))
+
+    pattern = current.get('meta', {}).get('filter')
+    missing = sorted(name for name in baseline['results']
+                     if name not in current['results'] and (not pattern or pattern in name))
+    for name in missing:
+        print("{:<40} {:>14.4f} {:>14} {:>9}".format(
+            name, baseline['results'][name]['per_item_us'], '-', 'MISSING'))
+    return regressions, missing
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='run the workloads')
+    run_parser.add_argument('--scale', type=float, default=1.0)
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--filter', default=None, help='only workloads containing this text')
+    run_parser.add_argument('--output', default=None, help='write results JSON here')
+    run_parser.add_argument('--compare', default=None, help='baseline JSON to compare against')
+    run_parser.add_argument('--threshold', type=float, default=0.2)
+
+    compare_parser = commands.add_parser('compare', help='compare two results files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.2)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        current = run_suite(args.scale, args.repeat, args.filter)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(current, f, indent=2, sort_keys=True)
+        if not args.compare:
+            return 0
+        baseline = load(args.compare)
+    else:
+        baseline, current = load(args.baseline), load(args.current)
+
+    regressions, missing = compare(baseline, current, args.threshold)
+    if regressions:
+        print("{} regression(s): {}".format(len(regressions), ', '.join(regressions)))
+    if missing:
+        print("{} baseline workload(s) missing: {}".format(len(missing), ', '.join(missing)))
+    return 1 if regressions or missing else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
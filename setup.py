@@ -2,17 +2,18 @@ from setuptools import setup, find_packages
 
 setup(
     name="Coord_Geom",
-    version="0.1",
+    version="0.2",
     description="A modular coordinate geometry library with plotting tools",
     author="Rahul Agarwal",
     packages=find_packages(),
     install_requires=[
         "matplotlib",
+        "numpy",
         "scipy"
     ],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )